@@ -0,0 +1,29 @@
+"""
+# Benchmarks
+The benchmarks folder contains scripts measuring the speed of the
+logic part of the project.
+
+They are run from the app folder, for example:
+```
+python -m benchmarks.text_benchmark
+```
+
+## Files
+- `text_benchmark.py` measures a language switch of the `TextManager`.
+- `import_benchmark.py` measures the import time of a module.
+- `wrap_benchmark.py` measures the formatting of the questions.
+- `state_benchmark.py` measures the answers saved per second.
+- `adaptive_benchmark.py` measures the "adaptive" randomizing style.
+- `style_benchmark.py` compares every registered randomizing style.
+- `music_benchmark.py` measures the idle CPU of the music.
+- `sound_benchmark.py` measures the loading of the sound effects.
+- `logs_benchmark.py` measures a log call on the calling thread.
+- `session_benchmark.py` measures the memory of a player session.
+- `shard_benchmark.py` measures the answers per second of the server
+with 1, 2, 4 and 8 workers.
+- `load_benchmark.py` simulates many players against the engine or a
+server and reports the latency, the throughput and the memory.
+- `suite.py` runs the benchmarks of the hot paths and compares them
+with the baselines of the `baselines` folder.
+- `ui_stub.py` replaces Kivy with empty modules for the benchmarks.
+"""
@@ -0,0 +1,84 @@
+"""
+# Adaptive Benchmark
+The `adaptive_benchmark.py` module measures the "adaptive" randomizing
+style on banks of 10 000, 100 000 and 1 000 000 questions.
+
+Half of every bank was already answered, so the heap of the
+`SpacedRepetition` holds half of the questions. It measures the time
+to build the scheduler and the mean time of one draw followed by its
+answer.
+
+```
+python -m benchmarks.adaptive_benchmark [questions_count ...]
+```
+"""
+
+import sys
+import time
+from random import Random
+
+from sources.engine.question_stats import QuestionStats, MAX_BOX
+from sources.engine.spaced_repetition import SpacedRepetition
+
+
+def synthetic_stats(count: int, seed: int = 56) -> QuestionStats:
+    """
+    # Synthetic Stats
+    The `synthetic_stats` function returns the statistics of a bank of
+    `count` questions, half of them answered during the last week.
+    """
+
+    rng = Random(seed)
+    now = time.time()
+    stats = QuestionStats("en-EN", count)
+
+    for question in range(0, count, 2):
+        asked = rng.randint(1, 10)
+        stats.asked[question] = asked
+        stats.correct[question] = rng.randint(0, asked)
+        stats.last_asked[question] = now - rng.uniform(0, 7 * 24 * 3600)
+        stats.box[question] = rng.randint(0, MAX_BOX)
+
+    return stats
+
+
+def run(count: int, draws: int = 100_000) -> dict[str, float]:
+    """
+    # Run
+    The `run` function returns the build time of the scheduler and the
+    mean time of one draw and answer.
+    """
+
+    stats = synthetic_stats(count)
+    rng = Random(0)
+
+    start = time.perf_counter()
+    scheduler = SpacedRepetition(stats)
+    build = time.perf_counter() - start
+
+    now = time.time()
+    start = time.perf_counter()
+    for _ in range(draws):
+        question = scheduler.draw(now)
+        stats.observe(question, rng.random() < 0.7, 3.0, now)
+        scheduler.observe(question, now)
+        now += 5
+    draw = time.perf_counter() - start
+
+    return {
+        "questions": count,
+        "build_ms": build * 1000,
+        "draw_us": draw / draws * 1_000_000
+    }
+
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    for questions_count in counts:
+        results = run(questions_count)
+        print(
+            f"{questions_count} questions: scheduler built in "
+            f"{results['build_ms']:.0f} ms, "
+            f"draw and answer in {results['draw_us']:.2f} us"
+        )
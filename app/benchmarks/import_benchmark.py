@@ -0,0 +1,196 @@
+"""
+# Import Benchmark
+The `import_benchmark.py` module measures the import time of a module
+of the project with `python -X importtime`, like it's done when the
+app starts.
+
+```
+python -m benchmarks.import_benchmark
+python -m benchmarks.import_benchmark sources.logic.questions_manager --save
+```
+
+The module is imported in a `ui_stub.sandbox`, so it doesn't write in
+the real state of the game and works without a `resources/music`
+folder. Kivy is replaced by the `ui_stub` only if it isn't installed,
+the report tells it.
+
+With `--save`, the report is added to
+`benchmarks/results/import_time.json` so the cold start can be
+compared between versions. Every report is compared with the last
+saved one of the same module.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+import importlib.util
+from datetime import datetime
+
+from benchmarks import ui_stub
+
+RESULTS_PATH = os.path.join(
+    os.path.dirname(__file__), "results", "import_time.json"
+)
+WATCHED_PACKAGES = ("pandas", "numpy", "kivy", "pygame")
+STUB_CODE = (
+    "import importlib.util\n"
+    "if importlib.util.find_spec('kivy') is None:\n"
+    "    from benchmarks import ui_stub; ui_stub.install()\n"
+)
+
+
+class ImportFailed(Exception):
+    """
+    # Import Failed
+    The `ImportFailed` exception is raised when the module can't be
+    imported, with the last line of its error.
+    """
+
+
+def import_time(module: str) -> list[tuple[str, int, int]]:
+    """
+    # Import Time
+    The `import_time` function imports the `module` in a new
+    interpreter and returns `(package, self_us, cumulative_us)` for
+    every imported package.
+    """
+
+    with tempfile.TemporaryDirectory(prefix="quizmaster-import-") as data:
+        # The child inherits the sandbox
+        ui_stub.sandbox(data)
+        process = subprocess.run(
+            [
+                sys.executable, "-X", "importtime", "-c",
+                f"{STUB_CODE}import {module}"
+            ],
+            cwd=ui_stub.APP_FOLDER,
+            capture_output=True,
+            text=True
+        )
+
+    if process.returncode != 0:
+        errors = process.stderr.strip().splitlines()
+        raise ImportFailed(errors[-1] if errors else process.returncode)
+
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, package = (
+            line[len("import time:"):].split("|")
+        )
+        # Nested imports keep their indentation
+        imports.append(
+            (package[1:].rstrip(), int(self_us), int(cumulative_us))
+        )
+
+    return imports
+
+
+def report(module: str, top: int = 10) -> dict:
+    """
+    # Report
+    The `report` function returns the total import time of the
+    `module`, the slowest packages and the watched heavy packages
+    which were imported.
+    """
+
+    imports = import_time(module)
+    top_level = [
+        i for i in imports
+        if not i[0].startswith((" ", "benchmarks"))  # Not the stub
+    ]
+    roots = {}
+
+    # Its cumulative time, without the imports of the stub
+    total_us = next(
+        (i[2] for i in reversed(top_level) if i[0] == module),
+        sum(i[1] for i in imports)
+    )
+
+    for package, _, cumulative_us in imports:
+        root = package.strip().split(".")[0]
+        roots[root] = max(roots.get(root, 0), cumulative_us)
+
+    return {
+        "module": module,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "stubbed_kivy": importlib.util.find_spec("kivy") is None,
+        "total_ms": total_us / 1000,
+        "modules_count": len(imports),
+        "slowest": [
+            {"package": package, "cumulative_ms": cumulative_us / 1000}
+            for package, _, cumulative_us in sorted(
+                top_level, key=lambda i: i[2], reverse=True
+            )[:top]
+        ],
+        "watched_ms": {
+            package: roots[package] / 1000
+            for package in WATCHED_PACKAGES
+            if package in roots
+        }
+    }
+
+
+def history() -> list[dict]:
+    """
+    # History
+    The `history` function returns the saved import time reports.
+    """
+
+    if not os.path.exists(RESULTS_PATH):
+        return []
+
+    with open(RESULTS_PATH, "r", encoding="UTF-8") as f:
+        return json.load(f)
+
+
+def save(result: dict) -> None:
+    """
+    # Save
+    The `save` function adds the `result` to the history of the
+    import time reports.
+    """
+
+    reports = history()
+    reports.append(result)
+
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, "w", encoding="UTF-8") as f:
+        json.dump(reports, f, indent=4)
+
+
+if __name__ == "__main__":
+    arguments = [a for a in sys.argv[1:] if a != "--save"]
+    module_name = arguments[0] if arguments else "main"
+
+    try:
+        result = report(module_name)
+    except ImportFailed as e:
+        print(f"Import of <{module_name}> failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Import of <{result['module']}>: {result['total_ms']:.1f} ms "
+        f"({result['modules_count']} modules"
+        f"{', Kivy stubbed' if result['stubbed_kivy'] else ''})"
+    )
+
+    previous = [r for r in history() if r["module"] == result["module"]]
+    if previous:
+        before = previous[-1]
+        print(
+            f"  Last saved, {before['date']}: {before['total_ms']:.1f} ms "
+            f"({result['total_ms'] / before['total_ms'] - 1:+.0%})"
+        )
+    for package, ms in result["watched_ms"].items():
+        print(f"  {package}: {ms:.1f} ms")
+    print("Slowest imports:")
+    for entry in result["slowest"]:
+        print(f"  {entry['package']}: {entry['cumulative_ms']:.1f} ms")
+
+    if "--save" in sys.argv:
+        save(result)
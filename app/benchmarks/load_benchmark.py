@@ -0,0 +1,310 @@
+"""
+# Load Benchmark
+The `load_benchmark.py` module simulates many players answering
+questions at the same time, and measures the time between an answer
+and the next question, the answers per second and the memory.
+
+It plays against one of two targets:
+- `engine` plays in this process with the game's path: a `Quiz` over
+one `QuestionBank` per language, with the `PointsManager` of every
+player saving its answers and its points in a `StateStore`. Every
+player has its own "normal" randomizing style, like the only player of
+the game, instead of drawing from the shared bag of the bank.
+- `server` connects the players of `sources.server.load_generator`
+to a quiz server with WebSockets, started in another process with
+`--spawn`. The latency is measured from an answer to the next
+question, so it counts the end of the round and the pause.
+
+Every player waits a random think time before answering, answers
+right with the chosen accuracy and plays a language of the mix.
+Against a server the players don't know the true answer, so they
+answer randomly and the ratio of right answers is measured instead.
+
+```
+python -m benchmarks.load_benchmark --target engine --players 2000
+python -m benchmarks.load_benchmark --target server --spawn
+    --languages en-EN:3,fr-FR:1 --think-time 0.5 --duration 30
+```
+
+The report is printed as JSON.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+from sources.engine.state_store import StateStore
+from sources.engine.question_bank import QuestionBank
+from sources.engine.points_manager import PointsManager
+from sources.engine.randomizing_styles import create_style
+from sources.engine.quiz import Quiz
+from sources.server.load_generator import (
+    Results, percentile, play, wait_for_server
+)
+
+SAVE_EVERY = 10  # Answers between two saves of the points of a player
+
+
+def rss_bytes(pid: int) -> int | None:
+    """
+    # RSS Bytes
+    The `rss_bytes` function returns the resident memory of the `pid`
+    process and of its children, or `None` without `/proc`.
+    """
+
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            total = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            children = [int(child) for child in f.read().split()]
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    for child in children:
+        total += rss_bytes(child) or 0
+
+    return total
+
+
+def parse_languages(text: str) -> dict[str, float]:
+    """
+    # Parse Languages
+    The `parse_languages` function reads a mix like "en-EN:3,fr-FR:1"
+    and returns the weight of every language.
+    """
+
+    languages = {}
+
+    for item in text.split(","):
+        language, _, weight = item.partition(":")
+        languages[language.strip()] = float(weight or 1)
+
+    return languages
+
+
+class LoadTest():
+    """
+    # Load Test
+    The `LoadTest` class collects the measures of the players and
+    samples the memory of the `pid` process, if it's known.
+    """
+
+    def __init__(self, pid: int | None, sample_time: float) -> None:
+        self.pid = pid
+        self.sample_time = sample_time
+        self.start = time.monotonic()
+
+        self.answers = 0
+        self.right = 0
+        self.errors = 0
+        self.latencies = []  # Seconds between an answer and the next
+        self.memory = []
+
+    async def sample_memory(self) -> None:
+        while True:
+            rss = None if self.pid is None else rss_bytes(self.pid)
+            self.memory.append({
+                "seconds": round(time.monotonic() - self.start, 2),
+                "rss_mb": None if rss is None else round(rss / 2**20, 1)
+            })
+            await asyncio.sleep(self.sample_time)
+
+    def report(self, **settings) -> dict:
+        elapsed = time.monotonic() - self.start
+        latencies = sorted(self.latencies)
+
+        return {
+            **settings,
+            "seconds": round(elapsed, 2),
+            "answers": self.answers,
+            "errors": self.errors,
+            "answers_per_second": round(self.answers / elapsed, 1),
+            "right_ratio": round(self.right / max(1, self.answers), 3),
+            "latency_ms": {
+                f"p{p}": round(percentile(latencies, p) * 1000, 3)
+                for p in (50, 95, 99)
+            },
+            "memory": self.memory
+        }
+
+
+async def play_engine(
+    quiz: Quiz, test: LoadTest, think_time: float, accuracy: float,
+    stop_at: float, rng: random.Random
+) -> None:
+    """
+    # Play Engine
+    The `play_engine` function is one player of the engine. The
+    latency is measured from the end of the think time, so it counts
+    the wait for the other players too.
+    """
+
+    loop = asyncio.get_running_loop()
+    question = quiz.ask()
+    answers = 0  # Of this player, between two saves of its points
+
+    while loop.time() < stop_at:
+        due = loop.time() + rng.uniform(0, think_time)
+        await asyncio.sleep(due - loop.time())
+
+        choice = question.correct
+        if rng.random() >= accuracy:
+            choice = (choice + rng.randrange(1, 4)) % 4
+
+        test.right += quiz.answer(choice)
+        test.answers += 1
+        answers += 1
+
+        if answers == SAVE_EVERY:
+            quiz.points.save_data()
+            answers = 0
+
+        question = quiz.ask()
+        test.latencies.append(loop.time() - due)
+
+
+async def run_engine(
+    players: int, languages: dict[str, float], think_time: float,
+    accuracy: float, duration: float, sample_time: float
+) -> dict:
+    test = LoadTest(os.getpid(), sample_time)
+    rng = random.Random(56)
+
+    with tempfile.TemporaryDirectory() as folder:
+        store = StateStore(os.path.join(folder, "state.sqlite3"))
+        banks = {
+            language: QuestionBank(language, store)
+            for language in languages
+        }
+        names = rng.choices(
+            list(languages), list(languages.values()), k=players
+        )
+
+        sampler = asyncio.create_task(test.sample_memory())
+        stop_at = asyncio.get_running_loop().time() + duration
+
+        await asyncio.gather(*(
+            play_engine(
+                Quiz(
+                    banks[language], PointsManager(store, f"player-{i}"),
+                    rng=random.Random(i), style=create_style(
+                        "normal", len(banks[language]),
+                        banks[language].stats
+                    )
+                ),
+                test, think_time, accuracy, stop_at, random.Random(i)
+            )
+            for i, language in enumerate(names)
+        ))
+
+        sampler.cancel()
+        for bank in banks.values():
+            bank.save(wait=True)
+            bank.close()
+        store.close()
+
+    return test.report(
+        target="engine", players=players, languages=languages,
+        think_time=think_time, accuracy=accuracy
+    )
+
+
+async def run_server(
+    host: str, port: int, pid: int | None, players: int,
+    languages: dict[str, float], think_time: float, duration: float,
+    sample_time: float, room_size: int
+) -> dict:
+    test = LoadTest(pid, sample_time)
+    results = Results()
+    rng = random.Random(56)
+    names = rng.choices(list(languages), list(languages.values()), k=players)
+    stop_at = time.monotonic() + duration
+
+    sampler = asyncio.create_task(test.sample_memory())
+    await asyncio.gather(*(
+        play(
+            host, port, f"{language}-{i // room_size}", f"player-{i}",
+            language, think_time, stop_at, results
+        )
+        for i, language in enumerate(names)
+    ))
+    sampler.cancel()
+
+    test.answers = results.answered
+    test.right = results.right
+    test.errors = results.failed + results.errors
+    test.latencies = results.latencies
+
+    return test.report(
+        target="server", players=players, languages=languages,
+        think_time=think_time, room_size=room_size
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="A quiz load test.")
+    parser.add_argument(
+        "--target", choices=("engine", "server"), default="engine"
+    )
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--languages", default="en-EN")
+    parser.add_argument("--think-time", type=float, default=1.0)
+    parser.add_argument("--accuracy", type=float, default=0.7)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--sample-time", type=float, default=1.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--room-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--pid", type=int, default=None,
+        help="The process of a server which wasn't spawned, for memory."
+    )
+    parser.add_argument(
+        "--spawn", action="store_true",
+        help="Start a server with short rounds in another process."
+    )
+    arguments = parser.parse_args()
+    languages = parse_languages(arguments.languages)
+
+    if arguments.target == "engine":
+        report = asyncio.run(run_engine(
+            arguments.players, languages, arguments.think_time,
+            arguments.accuracy, arguments.duration, arguments.sample_time
+        ))
+        print(json.dumps(report, indent=2))
+        return
+
+    server = None
+    if arguments.spawn:
+        server = subprocess.Popen([
+            sys.executable, "-m", "sources.server",
+            "--host", arguments.host, "--port", str(arguments.port),
+            "--question-time", "5", "--pause-time", "0.2",
+            "--workers", str(arguments.workers)
+        ], stderr=subprocess.DEVNULL)
+
+    try:
+        asyncio.run(wait_for_server(arguments.host, arguments.port, 30))
+        report = asyncio.run(run_server(
+            arguments.host, arguments.port,
+            server.pid if server else arguments.pid, arguments.players,
+            languages, arguments.think_time, arguments.duration,
+            arguments.sample_time, arguments.room_size
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
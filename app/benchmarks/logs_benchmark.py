@@ -0,0 +1,145 @@
+"""
+# Logs Benchmark
+The `logs_benchmark.py` module measures the time spent on the calling
+thread by one `log.info`, like the ones of `rand_quest` and
+`check_answer`.
+
+"Before" writes every record with a `FileHandler`. "After" puts it in
+the queue of the `LogsManager`, written in batches by the background
+writer. A burst bigger than the queue shows the overflow policies.
+
+```
+python -m benchmarks.logs_benchmark [records]
+```
+"""
+
+import os
+import sys
+import time
+import queue
+import logging
+import tempfile
+from logging.handlers import QueueListener
+
+from sources.logic.logs_manager import (
+    BoundedQueueHandler, BatchFileHandler, OVERFLOW_POLICIES, QUEUE_SIZE
+)
+
+SPACING = 0.001  # Seconds between two spaced records
+SPACED_RECORDS = 2000
+
+
+def _log_records(
+    logger: logging.Logger, records: int, spaced: bool
+) -> float:
+    """
+    # Log Records
+    The `_log_records` function returns the time spent in `records`
+    calls and the slowest call. When `spaced`, the calls are spread
+    out like in the game, so the background writer works between them.
+    """
+
+    elapsed = slowest = 0.0
+    for i in range(records):
+        start = time.perf_counter()
+        logger.info(f"Questions: The <{i} / {records}> question is asked.")
+        call = time.perf_counter() - start
+        elapsed += call
+        slowest = max(slowest, call)
+        if spaced:
+            time.sleep(SPACING)
+    return elapsed, slowest
+
+
+def run_before(
+    folder: str, records: int, spaced: bool = False
+) -> dict[str, float]:
+    logger = logging.getLogger("benchmark.before")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = logging.FileHandler(os.path.join(folder, "before.log"))
+    logger.addHandler(handler)
+
+    elapsed, slowest = _log_records(logger, records, spaced)
+
+    logger.removeHandler(handler)
+    handler.close()
+    return {
+        "call_us": elapsed / records * 1_000_000,
+        "slowest_us": slowest * 1_000_000,
+        "dropped": 0
+    }
+
+
+def run_after(
+    folder: str, records: int, overflow: str, spaced: bool = False
+) -> dict[str, float]:
+    logger = logging.getLogger(f"benchmark.{overflow}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    log_queue = queue.Queue(QUEUE_SIZE)
+    handler = BatchFileHandler(
+        os.path.join(folder, f"{overflow}.log"), log_queue
+    )
+    queue_handler = BoundedQueueHandler(log_queue, overflow)
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    logger.addHandler(queue_handler)
+
+    elapsed, slowest = _log_records(logger, records, spaced)
+
+    start = time.perf_counter()
+    listener.stop()
+    flush = time.perf_counter() - start
+    logger.removeHandler(queue_handler)
+    handler.close()
+
+    return {
+        "call_us": elapsed / records * 1_000_000,
+        "slowest_us": slowest * 1_000_000,
+        "flush_ms": flush * 1000,
+        "dropped": queue_handler.dropped,
+        "writes": handler.writes
+    }
+
+
+def run(records: int = 50_000) -> dict[str, dict]:
+    """
+    # Run
+    The `run` function logs `SPACED_RECORDS` spaced records, then a
+    burst of `records` records, with the `FileHandler` and with every
+    overflow policy.
+    """
+
+    with tempfile.TemporaryDirectory() as folder:
+        results = {
+            "spaced before": run_before(folder, SPACED_RECORDS, True),
+            "spaced after": run_after(folder, SPACED_RECORDS, "drop", True),
+            "burst before": run_before(folder, records)
+        }
+        for overflow in OVERFLOW_POLICIES:
+            results[f"burst {overflow}"] = run_after(
+                folder, records, overflow
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    records_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(
+        f"{SPACED_RECORDS} spaced records, burst of {records_count} "
+        f"records, queue of {QUEUE_SIZE}"
+    )
+
+    for name, result in run(records_count).items():
+        print(
+            f"{name:<14} {result['call_us']:.2f} us per call, "
+            f"slowest {result['slowest_us']:.0f} us, "
+            f"{result['dropped']} dropped"
+            + (
+                f", {result['writes']} writes, "
+                f"flushed in {result['flush_ms']:.1f} ms"
+                if "writes" in result else ""
+            )
+        )
@@ -0,0 +1,108 @@
+"""
+# Music Benchmark
+The `music_benchmark.py` module measures the CPU used by the music
+while the game is idle on the main menu.
+
+"Before" runs the old work of every frame at 60 frames per second:
+`check_song` and the five `set_volume` calls. "After" only runs
+`check_song` every `SONG_CHECK_INTERVAL` seconds, and `set_volumes`
+does nothing while the volumes don't change.
+
+Both measures include the CPU used by the mixer to play the music, so
+the difference is the work which was removed. It runs without sound
+device with the SDL dummy audio driver.
+
+```
+python -m benchmarks.music_benchmark [seconds]
+```
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from sources.logic.music_manager import (  # noqa: E402
+    music_manager, SONG_CHECK_INTERVAL
+)
+
+FPS = 60
+
+
+def legacy_frame(music_volume: float, sounds_volume: float) -> None:
+    """
+    # Legacy Frame
+    The `legacy_frame` function is the work the menus did every frame
+    before.
+    """
+
+    music_manager.check_song()
+    pygame.mixer.music.set_volume(music_volume)
+    music_manager.transition.set_volume(sounds_volume)
+    music_manager.button_clicked.set_volume(sounds_volume)
+    music_manager.win.set_volume(sounds_volume)
+    music_manager.lose.set_volume(sounds_volume)
+
+
+def idle_cpu(callback, interval: float, seconds: float) -> float:
+    """
+    # Idle Cpu
+    The `idle_cpu` function calls `callback` every `interval` seconds
+    during `seconds` seconds, and returns the CPU used in percent of
+    one core.
+    """
+
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    next_call = start
+
+    while time.perf_counter() - start < seconds:
+        callback()
+        next_call += interval
+        time.sleep(max(0.0, next_call - time.perf_counter()))
+
+    wall = time.perf_counter() - start
+    return (time.process_time() - start_cpu) / wall * 100
+
+
+def run(seconds: float = 10.0) -> dict[str, float]:
+    """
+    # Run
+    The `run` function returns the idle CPU before and after, and the
+    cost of one legacy frame.
+    """
+
+    before = idle_cpu(
+        lambda: legacy_frame(0.5, 0.25), 1 / FPS, seconds
+    )
+    after = idle_cpu(
+        lambda: (
+            music_manager.check_song(), music_manager.set_volumes(0.5, 0.25)
+        ),
+        SONG_CHECK_INTERVAL, seconds
+    )
+
+    frames = 10_000
+    start = time.perf_counter()
+    for _ in range(frames):
+        legacy_frame(0.5, 0.25)
+    frame = (time.perf_counter() - start) / frames
+
+    return {
+        "before_cpu_percent": before,
+        "after_cpu_percent": after,
+        "legacy_frame_us": frame * 1_000_000
+    }
+
+
+if __name__ == "__main__":
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    results = run(duration)
+    print(
+        f"Idle CPU before: {results['before_cpu_percent']:.2f} %\n"
+        f"Idle CPU after: {results['after_cpu_percent']:.2f} %\n"
+        f"Work of one frame before: {results['legacy_frame_us']:.1f} us"
+    )
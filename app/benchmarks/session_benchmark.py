@@ -0,0 +1,111 @@
+"""
+# Session Benchmark
+The `session_benchmark.py` module measures the memory of the players
+served by one process.
+
+Every player has a `Session` over one `SharedBank`, and answered a few
+questions. It's compared with the state one player had before in a
+`QuestionBank`: the shuffle bag of the "normal" style and the
+statistics of the questions, which grow with the bank.
+
+```
+python -m benchmarks.session_benchmark [sessions] [--json]
+```
+"""
+
+import sys
+import json
+import time
+import tracemalloc
+from random import Random
+
+from sources.engine.shared_bank import SharedBank
+from sources.engine.session import Session
+from sources.engine.shuffle_bag import ShuffleBag
+from sources.engine.question_stats import QuestionStats
+
+ANSWERS = ("Paris", "London", "Kyiv", "Rome", "1989", "2001", "Nile")
+
+
+def synthetic_bank(count: int, seed: int = 56) -> SharedBank:
+    """
+    # Synthetic Bank
+    The `synthetic_bank` function returns a bank of `count` questions
+    whose answers are often the same, like in the real databases.
+    """
+
+    rng = Random(seed)
+    return SharedBank("en-EN", tuple(
+        (f"Question {i}?",) + tuple(
+            sys.intern(rng.choice(ANSWERS)) for _ in range(4)
+        )
+        for i in range(count)
+    ))
+
+
+def _traced(create) -> tuple[object, int]:
+    tracemalloc.start()
+    created = create()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return created, memory
+
+
+def run(bank: SharedBank, sessions: int, answers: int = 20) -> dict:
+    """
+    # Run
+    The `run` function creates `sessions` sessions which answer
+    `answers` questions each, and returns the bytes per session.
+    """
+
+    rng = Random(0)
+
+    def create() -> list[Session]:
+        players = [Session(bank) for _ in range(sessions)]
+        for player in players:
+            for _ in range(answers):
+                question = player.ask()
+                player.answer(
+                    question.correct if rng.random() < 0.7 else -1
+                )
+        return players
+
+    players, memory = _traced(create)
+    del players
+
+    start = time.perf_counter()
+    players = create()  # Timed without tracemalloc
+    elapsed = time.perf_counter() - start
+
+    player_state, before = _traced(lambda: (
+        ShuffleBag(len(bank)), QuestionStats(bank.language, len(bank))
+    ))
+    del players, player_state
+
+    return {
+        "questions": len(bank),
+        "sessions": sessions,
+        "bytes_per_session": memory / sessions,
+        "bytes_per_player_before": before,
+        "answer_us": elapsed / (sessions * answers) * 1_000_000
+    }
+
+
+if __name__ == "__main__":
+    arguments = [a for a in sys.argv[1:] if not a.startswith("--")]
+    sessions_count = int(arguments[0]) if arguments else 10_000
+
+    banks = [SharedBank.load("en-EN")]
+    banks += [synthetic_bank(count) for count in (100_000, 1_000_000)]
+    results = [run(bank, sessions_count) for bank in banks]
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(
+                f"{r['questions']} questions, {r['sessions']} sessions: "
+                f"{r['bytes_per_session']:.0f} bytes per session "
+                f"(before {r['bytes_per_player_before']} bytes per "
+                f"player), {r['answer_us']:.1f} us per question"
+            )
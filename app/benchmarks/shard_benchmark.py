@@ -0,0 +1,134 @@
+"""
+# Shard Benchmark
+The `shard_benchmark.py` module measures the answers scored per second
+by the quiz server with 1, 2, 4 and 8 worker processes.
+
+For every count of workers, a server is started in another process
+with short rounds, and load generator processes connect players which
+answer at once, so the rooms are as busy as possible.
+
+The workers only scale with the cores: on a machine with fewer cores
+than workers, they share them with the load generators, so the results
+can't show the scaling and a warning is printed with them.
+
+```
+python -m benchmarks.shard_benchmark [clients] [--json]
+```
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import subprocess
+import multiprocessing
+
+from sources.server.load_generator import run, wait_for_server
+
+HOST = "127.0.0.1"
+PORT = 8790
+WORKERS = (1, 2, 4, 8)
+DURATION = 10.0
+
+
+def _generate(arguments: tuple) -> dict:
+    port, clients, rooms, first_room = arguments
+    return asyncio.run(run(
+        HOST, port, clients, rooms, DURATION, 0.0, "en-EN", 1.0,
+        first_room
+    ))
+
+
+def measure(
+    workers: int, clients: int, rooms: int, generators: int
+) -> dict:
+    """
+    # Measure
+    The `measure` function starts a server with `workers` workers and
+    returns the answers scored per second for `clients` players in
+    `rooms` rooms, connected by `generators` processes.
+    """
+
+    port = PORT + workers
+    server = subprocess.Popen([
+        sys.executable, "-m", "sources.server", "--host", HOST,
+        "--port", str(port), "--workers", str(workers),
+        "--question-time", "2", "--pause-time", "0"
+    ], stderr=subprocess.DEVNULL)
+
+    try:
+        asyncio.run(wait_for_server(HOST, port, 30))
+        time.sleep(0.5 * workers)  # The workers load their modules
+
+        share = clients // generators
+        rooms_share = max(1, rooms // generators)
+        context = multiprocessing.get_context("spawn")
+
+        with context.Pool(generators) as pool:
+            reports = pool.map(_generate, [
+                (port, share, rooms_share, i * rooms_share)
+                for i in range(generators)
+            ])
+    finally:
+        server.terminate()
+        server.wait()
+
+    seconds = max(report["seconds"] for report in reports)
+    delays = [report["delivery_ms"]["p99"] for report in reports]
+
+    return {
+        "workers": workers,
+        "clients": share * generators,
+        "rooms": rooms_share * generators,
+        "failed": sum(report["failed"] for report in reports),
+        "answers_per_second": round(
+            sum(report["results"] for report in reports) / seconds, 1
+        ),
+        "delivery_p99_ms": max(delays)
+    }
+
+
+if __name__ == "__main__":
+    arguments = [a for a in sys.argv[1:] if not a.startswith("--")]
+    clients_count = int(arguments[0]) if arguments else 2000
+    generators_count = max(1, min(4, os.cpu_count() or 1))
+
+    results = [
+        measure(workers, clients_count, 64, generators_count)
+        for workers in WORKERS
+    ]
+    baseline = results[0]["answers_per_second"] or 1
+    cores = os.cpu_count() or 1
+
+    for result in results:
+        result["speedup"] = round(
+            result["answers_per_second"] / baseline, 2
+        )
+        result["cores"] = cores
+
+    warning = None
+    if cores < max(WORKERS):
+        warning = (
+            f"Warning: only {cores} cores for up to {max(WORKERS)} "
+            "workers and the load generators. The workers share the "
+            "cores, so these numbers don't show how the server scales. "
+            f"Run it again on a machine with at least {max(WORKERS)} "
+            "cores."
+        )
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+        if warning:
+            print(warning, file=sys.stderr)  # The json stays valid
+    else:
+        print(f"{cores} cores")
+        for r in results:
+            print(
+                f"{r['workers']} workers: {r['answers_per_second']:.0f} "
+                f"answers per second (x{r['speedup']}), "
+                f"{r['failed']} failed, "
+                f"p99 delivery {r['delivery_p99_ms']} ms"
+            )
+        if warning:
+            print(warning)
@@ -0,0 +1,103 @@
+"""
+# Sound Benchmark
+The `sound_benchmark.py` module measures the loading of the sound
+effects when the game starts.
+
+"Before" decodes the four sounds with `pygame.mixer.Sound` before the
+window opens. "After" only asks the `SoundLoader` to load them, which
+returns at once, and the loading continues in the background: the
+first launch decodes the mp3 sounds and caches them, the next ones
+read the cache.
+
+It runs without sound device with the SDL dummy audio driver.
+
+```
+python -m benchmarks.sound_benchmark [repeats]
+```
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from sources.engine.resource_path import resource_path  # noqa: E402
+from sources.logic.sound_loader import SoundLoader  # noqa: E402
+
+SOUNDS = (
+    "resources/sounds/8bit-click.wav",
+    "resources/sounds/transition.mp3",
+    "resources/sounds/win.mp3",
+    "resources/sounds/lose.wav"
+)
+
+
+def load_before() -> float:
+    start = time.perf_counter()
+    for sound in SOUNDS:
+        pygame.mixer.Sound(resource_path(sound))
+    return time.perf_counter() - start
+
+
+def load_after(folder: str) -> tuple[float, float]:
+    """
+    # Load After
+    The `load_after` function returns the time blocking the start of
+    the game and the time until every sound is loaded.
+    """
+
+    start = time.perf_counter()
+    loader = SoundLoader(folder)
+    for sound in SOUNDS:
+        loader.load(resource_path(sound))
+    blocking = time.perf_counter() - start
+
+    loader.wait()
+    return blocking, time.perf_counter() - start
+
+
+def run(repeats: int = 20) -> dict[str, float]:
+    """
+    # Run
+    The `run` function returns the best times of `repeats` launches in
+    milliseconds.
+    """
+
+    pygame.mixer.init()
+    before = min(load_before() for _ in range(repeats))
+
+    cold_blocking = cold_total = float("inf")
+    warm_blocking = warm_total = float("inf")
+
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as folder:
+            blocking, total = load_after(folder)
+            cold_blocking = min(cold_blocking, blocking)
+            cold_total = min(cold_total, total)
+
+            blocking, total = load_after(folder)
+            warm_blocking = min(warm_blocking, blocking)
+            warm_total = min(warm_total, total)
+
+    return {
+        "before_blocking_ms": before * 1000,
+        "cold_blocking_ms": cold_blocking * 1000,
+        "cold_loaded_ms": cold_total * 1000,
+        "warm_blocking_ms": warm_blocking * 1000,
+        "warm_loaded_ms": warm_total * 1000
+    }
+
+
+if __name__ == "__main__":
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
+    print(
+        f"Before: {results['before_blocking_ms']:.2f} ms blocking\n"
+        f"After, first launch: {results['cold_blocking_ms']:.2f} ms "
+        f"blocking, loaded in {results['cold_loaded_ms']:.2f} ms\n"
+        f"After, next launches: {results['warm_blocking_ms']:.2f} ms "
+        f"blocking, loaded in {results['warm_loaded_ms']:.2f} ms"
+    )
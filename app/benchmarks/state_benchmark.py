@@ -0,0 +1,75 @@
+"""
+# State Benchmark
+The `state_benchmark.py` module measures how many answers per second
+can be saved.
+
+"Before" rewrites a whole points.json file after every answer, like
+the old `PointsManager.save_data` did. "After" saves every answer with the
+`StateStore`: a row of the answers history and the new points, written
+by its background thread. The time counts the wait until they are all
+written.
+
+```
+python -m benchmarks.state_benchmark [answers_count]
+```
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+
+from sources.engine.state_store import StateStore
+
+
+def run(answers: int = 20_000) -> dict[str, float]:
+    """
+    # Run
+    The `run` function returns the answers saved per second before and
+    after, and the size of the database.
+    """
+
+    with tempfile.TemporaryDirectory() as folder:
+        state = {"points": 0, "win_streak": 0, "best_win_streak": 0}
+
+        json_path = os.path.join(folder, "points.json")
+        start = time.perf_counter()
+        for _ in range(answers):
+            state["points"] += 7
+            with open(json_path, "w", encoding="UTF-8") as f:
+                json.dump(state, f)
+        before = time.perf_counter() - start
+
+        store = StateStore(os.path.join(folder, "state.db"))
+        start = time.perf_counter()
+        for question in range(answers):
+            state["points"] += 7
+            store.record_answer(
+                question % 2 == 0, state, language="en-EN",
+                question=question
+            )
+        store.flush()
+        after = time.perf_counter() - start
+
+        saved = store.answers_count()
+        store.close()
+        database_size = os.path.getsize(store.database_path)
+
+    return {
+        "before_per_s": answers / before,
+        "after_per_s": answers / after,
+        "saved_answers": saved,
+        "database_bytes": database_size
+    }
+
+
+if __name__ == "__main__":
+    answers_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    results = run(answers_count)
+    print(
+        f"Answers saved per second before: {results['before_per_s']:.0f}\n"
+        f"Answers saved per second after: {results['after_per_s']:.0f}\n"
+        f"Database with {results['saved_answers']} answers: "
+        f"{results['database_bytes'] / 1024:.0f} KB"
+    )
@@ -0,0 +1,125 @@
+"""
+# Style Benchmark
+The `style_benchmark.py` module compares the registered randomizing
+styles on a synthetic bank, half of it already answered.
+
+For every style it measures:
+- the time to create the style and its memory, with `tracemalloc`.
+- the draw latency, mean and 99th percentile.
+- the repeat distances: how many draws there are between two draws of
+the same question.
+
+```
+python -m benchmarks.style_benchmark [questions_count] [draws] [--json]
+```
+"""
+
+import sys
+import json
+import time
+import tracemalloc
+from array import array
+from random import Random
+from statistics import median
+
+from sources.engine.randomizing_styles import STYLES, create_style
+from benchmarks.adaptive_benchmark import synthetic_stats
+
+
+def _percentile(values: list, rate: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * rate))]
+
+
+def run_style(
+    name: str, count: int, draws: int, seed: int = 0
+) -> dict[str, float]:
+    """
+    # Run Style
+    The `run_style` function measures the style called `name` on a
+    bank of `count` questions during `draws` draws. Every draw is
+    answered, right 70% of the time.
+    """
+
+    stats = synthetic_stats(count)
+    rng = Random(seed)
+
+    tracemalloc.start()
+    style = create_style(name, count, stats)
+    memory = tracemalloc.get_traced_memory()[0]  # Kept by the style
+    tracemalloc.stop()
+    del style
+
+    start = time.perf_counter()
+    style = create_style(name, count, stats)
+    build = time.perf_counter() - start
+
+    last_draw = array("q", [-1]) * count
+    distances = []
+    latencies = []
+
+    for i in range(draws):
+        start = time.perf_counter_ns()
+        question = style.draw()
+        latencies.append(time.perf_counter_ns() - start)
+
+        if last_draw[question] >= 0:
+            distances.append(i - last_draw[question])
+        last_draw[question] = i
+
+        now = time.time()
+        correct = rng.random() < 0.7
+        stats.observe(question, correct, 3.0, now)
+        style.observe(question, correct, now)
+
+    latencies.sort()
+    distances.sort()
+
+    return {
+        "style": name,
+        "questions": count,
+        "draws": draws,
+        "build_ms": build * 1000,
+        "memory_bytes": memory,
+        "draw_mean_us": sum(latencies) / draws / 1000,
+        "draw_p99_us": _percentile(latencies, 0.99) / 1000,
+        "repeats": len(distances),
+        "repeat_min": distances[0] if distances else None,
+        "repeat_p10": _percentile(distances, 0.10) if distances else None,
+        "repeat_median": median(distances) if distances else None
+    }
+
+
+def run(count: int = 100_000, draws: int = 50_000) -> list[dict]:
+    """
+    # Run
+    The `run` function measures every registered style.
+    """
+
+    return [run_style(name, count, draws) for name in STYLES]
+
+
+if __name__ == "__main__":
+    arguments = [a for a in sys.argv[1:] if not a.startswith("--")]
+    questions_count = int(arguments[0]) if arguments else 100_000
+    draws_count = int(arguments[1]) if len(arguments) > 1 else 50_000
+    results = run(questions_count, draws_count)
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+    else:
+        print(
+            f"{questions_count} questions, {draws_count} draws\n"
+            f"{'style':<12}{'build ms':>10}{'memory KB':>11}"
+            f"{'mean us':>9}{'p99 us':>8}{'repeats':>9}"
+            f"{'min gap':>9}{'p10 gap':>9}{'median gap':>12}"
+        )
+        for r in results:
+            print(
+                f"{r['style']:<12}{r['build_ms']:>10.1f}"
+                f"{r['memory_bytes'] / 1024:>11.0f}"
+                f"{r['draw_mean_us']:>9.2f}{r['draw_p99_us']:>8.2f}"
+                f"{r['repeats']:>9}{str(r['repeat_min']):>9}"
+                f"{str(r['repeat_p10']):>9}{str(r['repeat_median']):>12}"
+            )
@@ -0,0 +1,376 @@
+"""
+# Suite
+The `suite.py` module runs the benchmarks of the hot paths of the game
+and compares them with a baseline saved in `benchmarks/baselines/`.
+
+It measures, with Kivy replaced by the `ui_stub`:
+- `QuestionsManager.rand_quest` with every randomizing style, on
+synthetic banks of 1k, 100k and 1M questions, and the compilation of
+their packs.
+- `QuestionsManager._format_text`.
+- `TextManager.translate` and `TextManager.get_value`.
+- `PointsManager.win` and `lose`, which queue the answer for the writer
+thread of the `StateStore`, and `save_data`, which waits for it.
+- `SettingsManager.import_data` and `save_data`.
+- `resource_path`.
+- the cold import of `main.py`, in a new interpreter.
+
+The suite runs in a `ui_stub.sandbox`: the state database, the
+shuffle bags, the sound cache and the logs of the game, and the ones of
+the `main.py` import, are written in a temporary folder which is
+removed at the end, not in `sources/json/` and `logs/`. Only the packs
+of the databases are compiled next to them, like when the game starts.
+
+```
+python -m benchmarks.suite run [--sizes 1000,100000] [--save name]
+python -m benchmarks.suite compare [name] [--current file]
+    [--threshold 0.25]
+```
+
+`compare` runs the suite, or reads the `--current` results, and
+returns an error code when a benchmark is slower than the baseline by
+more than the threshold, 25% by default.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import atexit
+import shutil
+import timeit
+import random
+import argparse
+import itertools
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+
+from benchmarks import ui_stub
+
+SANDBOX = ui_stub.sandbox(tempfile.mkdtemp(prefix="quizmaster-suite-"))
+atexit.register(shutil.rmtree, SANDBOX, True)
+ui_stub.install()
+
+from sources.engine.resource_path import resource_path  # noqa: E402
+from sources.engine.state_store import StateStore  # noqa: E402
+from sources.engine.points_manager import PointsManager  # noqa: E402
+from sources.engine.question_bank import QuestionBank  # noqa: E402
+from sources.engine.bag_store import BagStore  # noqa: E402
+from sources.engine.randomizing_styles import STYLES  # noqa: E402
+from sources.logic.text_manager import text_manager as txt  # noqa: E402
+import sources.logic.settings_manager as settings_module  # noqa: E402
+import sources.logic.questions_manager as questions_module  # noqa: E402
+
+APP_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES_FOLDER = os.path.join(os.path.dirname(__file__), "baselines")
+SIZES = (1_000, 100_000, 1_000_000)
+THRESHOLD = 0.25
+REPEAT = 5
+
+WORDS = (
+    "Which", "country", "river", "year", "capital", "famous", "largest",
+    "painter", "ocean", "planet", "invented", "first", "world", "city"
+)
+ANSWERS = ("Paris", "London", "Kyiv", "Rome", "1989", "2001", "Nile")
+SAMPLE_TEXT = (
+    "Which famous painter was born in the largest city of the country "
+    "which is crossed by the longest river of the world?"
+)
+
+
+def _per_call_us(function, number: int) -> float:
+    # The best of the runs is the least disturbed by the system
+    return min(
+        timeit.repeat(function, number=number, repeat=REPEAT)
+    ) / number * 1_000_000
+
+
+def synthetic_database(folder: str, size: int, seed: int = 56) -> str:
+    """
+    # Synthetic Database
+    The `synthetic_database` function writes a csv database of `size`
+    questions of different lengths into `folder` and returns its path.
+    """
+
+    rng = random.Random(seed)
+    csv_path = os.path.join(folder, f"synthetic-{size}.csv")
+
+    with open(csv_path, "w", encoding="UTF-8", newline="") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow((
+            "Question", "GoodAnswer",
+            "WrongAnswer1", "WrongAnswer2", "WrongAnswer3"
+        ))
+        for i in range(size):
+            words = rng.choices(WORDS, k=rng.randint(4, 18))
+            writer.writerow(
+                (f"{' '.join(words)} {i}?",) + tuple(rng.sample(ANSWERS, 4))
+            )
+
+    return csv_path
+
+
+def bank_results(folder: str, size: int) -> dict[str, float]:
+    """
+    # Bank Results
+    The `bank_results` function measures the compilation of a
+    synthetic bank of `size` questions and `rand_quest` with every
+    randomizing style on it.
+    """
+
+    csv_path = synthetic_database(folder, size)
+    store = StateStore(":memory:")
+    bag_store = BagStore(os.path.join(folder, f"bags-{size}"))
+
+    start = time.perf_counter()
+    bank = QuestionBank(txt.current_language, store, bag_store, csv_path)
+    results = {f"compile_pack[{size}]": time.perf_counter() - start}
+
+    manager = questions_module.QuestionsManager()
+    manager.current_language = txt.current_language
+    manager.bank = bank
+    manager.quest_count = len(bank)
+
+    settings = questions_module.settings_manager
+    saved_style = settings.randomizing_style
+
+    try:
+        for style_name in STYLES:
+            settings.randomizing_style = style_name
+            manager.rand_quest()  # Creates the style
+            results[f"rand_quest.{style_name}[{size}]"] = _per_call_us(
+                manager.rand_quest, 200
+            )
+    finally:
+        settings.randomizing_style = saved_style
+        bank.close()  # Saves the bags in the background
+        bag_store.flush()
+        store.close()
+
+    return results
+
+
+def main_import_ms() -> float | None:
+    """
+    # Main Import Ms
+    The `main_import_ms` function returns the best time of a cold
+    import of `main.py` in a new interpreter, or `None` if it failed.
+    """
+
+    code = (
+        "from benchmarks import ui_stub; ui_stub.install(); import time; "
+        "start = time.perf_counter(); import main; "
+        "print(time.perf_counter() - start)"
+    )
+    times = []
+
+    for _ in range(REPEAT):
+        # The child inherits the sandbox
+        process = subprocess.run(
+            [sys.executable, "-c", code], cwd=APP_FOLDER,
+            capture_output=True, text=True
+        )
+        if process.returncode != 0:
+            print(process.stderr.strip().splitlines()[-1], file=sys.stderr)
+            return None
+        times.append(float(process.stdout.split()[-1]) * 1000)
+
+    return min(times)
+
+
+def run(sizes: tuple[int, ...] = SIZES) -> dict:
+    """
+    # Run
+    The `run` function measures every benchmark and returns the
+    results with the machine which measured them. The times are in
+    microseconds per call, except `compile_pack` in seconds and
+    `import.main` in milliseconds.
+    """
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as folder:
+        store = StateStore(os.path.join(folder, "state.db"))
+
+        points = PointsManager(store)
+        outcomes = iter(random.Random(0).choices((True, False), k=10**6))
+        results["points.win_lose"] = _per_call_us(
+            lambda: (points.win if next(outcomes) else points.lose)(
+                1, 2.0, "en-EN"
+            ), 500
+        )
+        results["points.save_data"] = _per_call_us(points.save_data, 100)
+
+        game_store = settings_module.state_store
+        settings_module.state_store = store
+        settings = settings_module.SettingsManager()
+
+        volumes = itertools.cycle((0.25, 0.75))
+
+        def change_and_save() -> None:
+            settings.music_volume = next(volumes)
+            settings.save_data(wait=True)
+
+        results["settings.import_data"] = _per_call_us(
+            settings.import_data, 200
+        )
+
+        disk_writes = settings.disk_writes
+        results["settings.save_data"] = _per_call_us(change_and_save, 100)
+
+        if settings.disk_writes == disk_writes:
+            raise RuntimeError(
+                "settings.save_data didn't write: the benchmark measured "
+                "an unchanged save."
+            )
+
+        manager = questions_module.QuestionsManager()
+        results["format_text"] = _per_call_us(
+            lambda: manager._format_text(SAMPLE_TEXT, 30), 2000
+        )
+        results["text.get_value"] = _per_call_us(
+            lambda: txt.get_value("Play"), 20000
+        )
+        results["text.translate"] = _per_call_us(txt.translate, 200)
+        results["resource_path"] = _per_call_us(
+            lambda: resource_path("resources/databases/en-EN.csv"), 20000
+        )
+
+        for size in sizes:
+            results.update(bank_results(folder, size))
+
+        settings_module.state_store = game_store
+        store.close()
+
+    import_ms = main_import_ms()
+    if import_ms is not None:
+        results["import.main"] = import_ms
+
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cores": os.cpu_count(),
+        "sizes": list(sizes),
+        "results": {name: round(value, 4) for name, value in results.items()}
+    }
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = THRESHOLD
+) -> list[str]:
+    """
+    # Compare
+    The `compare` function prints every result next to its baseline
+    and returns the names of the ones slower by more than `threshold`,
+    and of the ones of the baseline which are missing, for example
+    because their benchmark failed.
+    """
+
+    regressions = []
+    print(f"{'benchmark':<34}{'baseline':>12}{'current':>12}{'change':>9}")
+
+    for name, value in current["results"].items():
+        before = baseline["results"].get(name)
+
+        if before is None:
+            print(f"{name:<34}{'-':>12}{value:>12.3f}{'new':>9}")
+            continue
+
+        change = value / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+
+        print(
+            f"{name:<34}{before:>12.3f}{value:>12.3f}"
+            f"{change:>+9.0%}{flag}"
+        )
+
+    for name in sorted(
+        baseline["results"].keys() - current["results"].keys()
+    ):
+        print(
+            f"{name:<34}{baseline['results'][name]:>12.3f}"
+            f"{'missing':>12}  REGRESSION"
+        )
+        regressions.append(name)
+
+    return regressions
+
+
+def _baseline_path(name: str) -> str:
+    return os.path.join(BASELINES_FOLDER, f"{name}.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="The benchmark suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    run_parser.add_argument(
+        "--save", metavar="NAME", help="Save the results as a baseline."
+    )
+    run_parser.add_argument("--output", help="Write the results here.")
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare with a baseline."
+    )
+    compare_parser.add_argument("baseline", nargs="?", default="default")
+    compare_parser.add_argument(
+        "--current", help="Results to compare instead of a new run."
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=THRESHOLD
+    )
+    arguments = parser.parse_args()
+
+    if arguments.command == "run":
+        report = run(tuple(int(s) for s in arguments.sizes.split(",")))
+        text = json.dumps(report, indent=4)
+
+        for path in (
+            arguments.output,
+            arguments.save and _baseline_path(arguments.save)
+        ):
+            if path:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(path, "w", encoding="UTF-8") as f:
+                    f.write(text + "\n")
+
+        print(text)
+        return
+
+    with open(
+        _baseline_path(arguments.baseline), "r", encoding="UTF-8"
+    ) as f:
+        baseline = json.load(f)
+
+    if arguments.current:
+        with open(arguments.current, "r", encoding="UTF-8") as f:
+            current = json.load(f)
+    else:
+        current = run(tuple(baseline["sizes"]))
+
+    regressions = compare(baseline, current, arguments.threshold)
+
+    if regressions:
+        print(
+            f"Slower by more than {arguments.threshold:.0%} or missing: "
+            f"{', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+    print("No regression.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+# UI Stub
+The `ui_stub.py` module replaces Kivy with empty modules, so the
+benchmarks import the logic and `main.py` without a window, and
+measure the project's code instead of Kivy's.
+
+```python
+from benchmarks import ui_stub
+ui_stub.install()
+ui_stub.sandbox(folder)
+```
+
+`sandbox` makes the game write its state, its logs and its caches in a
+temporary folder, so the benchmarks don't change the real ones.
+"""
+
+import os
+import sys
+import shutil
+import importlib.abc
+import importlib.machinery
+from types import ModuleType
+
+STUBBED_PACKAGES = ("kivy",)
+
+APP_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_VARIABLE = "QUIZMASTER_DATA"  # Read by `resource_path`
+SANDBOX_FOLDERS = ("sources/json", "logs", "resources/music")
+
+
+class _StubType(type):
+    # `Window.size`, `Logger.info`: the class attributes are stubs too
+    def __getattr__(cls, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Stub()
+
+
+class Stub(metaclass=_StubType):
+    """
+    # Stub
+    The `Stub` class accepts every argument, attribute, call and
+    subclass, and does nothing.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Stub()
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+    def __getitem__(self, key):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self) -> bool:
+        return False
+
+
+class _StubModule(ModuleType):
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        stub = type(name, (Stub,), {})
+        setattr(self, name, stub)
+        return stub
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, fullname: str, path, target=None):
+        if fullname.split(".")[0] not in STUBBED_PACKAGES:
+            return None
+        return importlib.machinery.ModuleSpec(
+            fullname, self, is_package=True
+        )
+
+    def create_module(self, spec) -> ModuleType:
+        return _StubModule(spec.name)
+
+    def exec_module(self, module: ModuleType) -> None:
+        module.__path__ = []
+
+
+def install() -> None:
+    """
+    # Install
+    The `install` function makes every later import of the stubbed
+    packages return empty modules.
+    """
+
+    if not any(isinstance(f, _StubFinder) for f in sys.meta_path):
+        sys.meta_path.insert(0, _StubFinder())
+
+
+def sandbox(folder: str) -> str:
+    """
+    # Sandbox
+    The `sandbox` function sets the `QUIZMASTER_DATA` folder of the game
+    to `folder`, before the game is imported: the state database, the
+    shuffle bags, the sound cache and the logs are written in it, also
+    by the child processes which inherit the variable.
+
+    The `resources/music` folder of the player may not exist, so the
+    sandbox has its own with a sound of the game, and the mixer uses
+    the dummy SDL driver, so nothing is played.
+    """
+
+    for name in SANDBOX_FOLDERS:
+        os.makedirs(os.path.join(folder, name), exist_ok=True)
+
+    shutil.copyfile(
+        os.path.join(APP_FOLDER, "resources/sounds/transition.mp3"),
+        os.path.join(folder, "resources/music/benchmark.mp3")
+    )
+
+    os.environ[DATA_VARIABLE] = folder
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    return folder
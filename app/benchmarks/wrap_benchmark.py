@@ -0,0 +1,111 @@
+"""
+# Wrap Benchmark
+The `wrap_benchmark.py` module measures the formatting of the
+questions on a synthetic database of 100 000 questions.
+
+"Before" formats the question and the four answers every time a
+question is asked, like the old `_format_text` calls did. "After"
+compiles the wrapped columns once into the pack and only reads them
+when a question is asked.
+
+```
+python -m benchmarks.wrap_benchmark [questions_count]
+```
+"""
+
+import os
+import sys
+import csv
+import time
+import tempfile
+from random import Random
+
+from sources.engine.questions_pack import (
+    compile_pack, QuestionsPack, QUESTIONS_WRAP_WIDTHS
+)
+from sources.engine.text_wrapper import wrap_text
+from sources.engine.glyphs import replace_glyphs
+
+WORDS = (
+    "Які", "столиця", "of", "the", "biggest", "річка", "in", "world",
+    "який", "Єгипет", "famous", "Ґрунт", "ocean", "is", "où", "est",
+    "le", "plus", "grand", "самый", "длинный", "mountain", "year"
+)
+
+
+def write_bank(csv_path: str, count: int, seed: int = 56) -> None:
+    """
+    # Write Bank
+    The `write_bank` function writes a synthetic database with
+    `count` questions.
+    """
+
+    rng = Random(seed)
+
+    def sentence(words_count: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(words_count))
+
+    with open(csv_path, "w", encoding="UTF-8", newline="") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(
+            ["Question", "GoodAnswer", "WrongAnswer1",
+             "WrongAnswer2", "WrongAnswer3"]
+        )
+        for _ in range(count):
+            writer.writerow(
+                [sentence(rng.randint(6, 16))]
+                + [sentence(rng.randint(1, 5)) for _ in range(4)]
+            )
+
+
+def run(count: int = 100_000, asks: int = 20_000) -> dict[str, float]:
+    """
+    # Run
+    The `run` function returns the build time of the wrapped pack and
+    the mean formatting time of one asked question before and after.
+    """
+
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = os.path.join(folder, "bank.csv")
+        write_bank(csv_path, count)
+
+        start = time.perf_counter()
+        pack = QuestionsPack(
+            compile_pack(csv_path, wrap_widths=QUESTIONS_WRAP_WIDTHS)
+        )
+        build = time.perf_counter() - start
+
+        rng = Random(0)
+        rows = [rng.randrange(count) for _ in range(asks)]
+        raw_columns = pack.columns - len(QUESTIONS_WRAP_WIDTHS)
+
+        start = time.perf_counter()
+        for row in rows:
+            cells = pack.row(row)[:raw_columns]
+            for text, width in zip(cells, QUESTIONS_WRAP_WIDTHS):
+                wrap_text(replace_glyphs(text), width)
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for row in rows:
+            pack.row(row, raw_columns)
+        after = time.perf_counter() - start
+
+        pack.close()
+
+    return {
+        "build_s": build,
+        "before_us": before / asks * 1_000_000,
+        "after_us": after / asks * 1_000_000
+    }
+
+
+if __name__ == "__main__":
+    questions_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    results = run(questions_count)
+    print(
+        f"Pack with wrapped columns built in {results['build_s']:.2f} s "
+        f"for {questions_count} questions\n"
+        f"Formatting per question before: {results['before_us']:.1f} us\n"
+        f"Formatting per question after: {results['after_us']:.1f} us"
+    )
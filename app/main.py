@@ -16,8 +16,11 @@ from kivy.core.window import Window
 
 from sources.logic.points_manager import points_manager
 from sources.logic.questions_manager import questions_manager
+from sources.logic.question_prefetcher import question_prefetcher
 from sources.logic.settings_manager import settings_manager
-from sources.logic.resource_path import resource_path
+from sources.logic.state_store import state_store
+from sources.engine.resource_path import resource_path
+from sources.engine.points_manager import score
 
 from sources.ui.main_menu import MainMenu
 from sources.ui.question_menu import QuestionMenu
@@ -83,16 +86,27 @@ class QuizMasterApp(App):
         The `on_stop` method is activated when the window is closig.
 
         You can add your code, but at the moment
-        it only saves data and makes you loose when
-        you quitted and a question was asked.
+        it only saves data (settings and the order of the questions),
+        makes you loose when you quitted and a question was asked and
+        closes the state database. The prefetched questions are given
+        back before the order of the questions is saved. The waiting
+        logs are written at the end.
         """
-        settings_manager.save_data()
+        settings_manager.save_data(wait=True)
+        question_prefetcher.clear()
+        questions_manager.save_data(wait=True)
         if questions_manager.status:
             log.info(
                 "Main: The app stopped when a question "
                 "was asked. Points were lost."
             )
-            points_manager.lose()
+            # The question wasn't answered, so it's not in the history
+            points_manager.points, points_manager.win_streak = score(
+                points_manager.points, points_manager.win_streak, False
+            )
+            points_manager.save_data()
+        state_store.close()
+        logs_manager.flush()
 
 
 if __name__ == "__main__":
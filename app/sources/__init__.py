@@ -1,9 +1,12 @@
 """
 # Sources
 The sources folder contains all the code of the project.
-It's disposed in 3 folders:
+It's disposed in 5 folders:
 - `ui`. User Interface corespods to the visible part of the project - buttons,
 images, etc...
 - `logic`. Logic is used by the UI to add actions.
+- `engine`. Engine is the logic of the quiz without Kivy, used by the logic
+folder.
+- `server`. Server is the multiplayer quiz server built on the engine.
 - `json`. Json is used to save and import data about the results and settings.
 """
@@ -0,0 +1,40 @@
+"""
+# Engine
+The engine folder contains the logic of the quiz without UI: it
+chooses the questions, counts the points, translates the texts and
+saves the state. It doesn't import Kivy or Pygame and doesn't create
+any object when it's imported, so it's used by the game, by a server,
+by the benchmarks or by a script.
+
+The game creates its objects in the logic folder, which is the Kivy
+front end of the engine.
+
+## Files
+- `quiz.py` asks the questions and checks the answers without UI.
+- `question_bank.py` chooses the questions of one language.
+- `session.py` contains the state of one player, many sessions share
+one bank.
+- `shared_bank.py` keeps the questions of a language once, read-only,
+for every session.
+- `points_manager.py` counts points with `score`, saves and loads them
+from the state database.
+- `text_manager.py` manages labels and their translate by json files.
+- `state_store.py` keeps the settings, the points and the answers in a
+SQLite database.
+- `question_stats.py` keeps the answer statistics of the questions in
+memory.
+- `randomizing_styles.py` contains the randomizing styles and their
+registry.
+- `spaced_repetition.py` chooses the questions of the "adaptive"
+randomizing style.
+- `shuffle_bag.py` gives every question number once, randomly or in
+order, before giving them again.
+- `bag_store.py` saves the shuffle bags in the background and restores
+them when the app starts.
+- `questions_pack.py` compiles the csv databases into binary packs and
+reads questions from them.
+- `text_wrapper.py` cuts the questions and the answers into lines.
+- `glyphs.py` replaces the letters which aren't supported by the fonts.
+- `resource_path.py` finds the resources in a manifest built once.
+- `logger.py` contains the logger of the engine.
+"""
@@ -0,0 +1,152 @@
+"""
+# Bag Store
+The `bag_store.py` module only contains the `BagStore` class.
+
+It saves the state of the randomizing style of every language in the
+`sources/json` folder, so the order of the questions continues after a
+restart.
+"""
+
+import os
+import struct
+import threading
+from typing import final
+
+from sources.engine.resource_path import resource_path
+from sources.engine.logger import log
+
+
+BAG_MAGIC = b"QMBG"
+BAG_VERSION = 1
+HEADER = struct.Struct("<4sI32s")  # magic, version, csv hash
+
+
+@final
+class BagStore():
+    """
+    # Bag Store
+    The `BagStore` class saves and restores the states of the
+    randomizing styles, for example a shuffle bag, in
+    `sources/json/<name>.bag` files.
+
+    A bag file contains the hash of the database, so the state is
+    dropped when the questions changed. The state is stored as it's
+    given, so restoring a shuffle bag only copies bytes.
+
+    It contains these methods:
+    - `load` returns a saved state.
+    - `save` asks the background writer to save a state.
+    - `flush` waits until every asked state is written.
+    """
+
+    def __init__(self, folder: str | None = "sources/json/") -> None:
+        self.folder = resource_path(folder)
+
+        if not os.path.exists(self.folder):
+            os.makedirs(self.folder)
+
+        self._pending = {}  # The last bag data to write by file path
+        self._condition = threading.Condition()
+        self._writing = False
+        self._thread = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.folder, f"{name}.bag")
+
+    def load(self, name: str, source_hash: bytes) -> memoryview | None:
+        """
+        # Load
+        The `load` method returns the state saved as `name`, or `None`
+        if there is no state for this database.
+        """
+
+        path = self._path(name)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+
+            magic, version, saved_hash = HEADER.unpack_from(data, 0)
+
+            if magic != BAG_MAGIC or version != BAG_VERSION:
+                raise ValueError("Unknown bag format.")
+
+            if saved_hash != source_hash:
+                log.info(
+                    f"Questions: The database of <{name}> changed. "
+                    "The saved questions order was dropped."
+                )
+                return None
+
+        except (ValueError, struct.error):
+            log.warning(
+                f"Questions: The <{name}.bag> file is broken. "
+                "The questions order was reset."
+            )
+            return None
+
+        return memoryview(data)[HEADER.size:]
+
+    def save(self, name: str, state: bytes, source_hash: bytes) -> None:
+        """
+        # Save
+        The `save` method gives the `state` to the background writer.
+        If the previous state wasn't written yet, only the last one is
+        written.
+        """
+
+        data = HEADER.pack(BAG_MAGIC, BAG_VERSION, source_hash) + state
+
+        with self._condition:
+            self._pending[self._path(name)] = data
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write_loop, name="BagStore", daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        # Flush
+        The `flush` method waits until every saved state is written.
+        """
+
+        with self._condition:
+            while self._pending or self._writing:
+                self._condition.wait()
+
+    def _write_loop(self) -> None:
+        """
+        # Write Loop
+        The `_write_loop` method is the background writer. It writes
+        the states into temporary files which replace the old ones.
+        """
+
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+
+                pending = self._pending
+                self._pending = {}
+                self._writing = True
+
+            for path, data in pending.items():
+                try:
+                    with open(path + ".tmp", "wb") as f:
+                        f.write(data)
+                    os.replace(path + ".tmp", path)
+                except OSError as e:
+                    log.error(
+                        f"Questions: The <{path}> file wasn't saved: {e}"
+                    )
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
@@ -0,0 +1,229 @@
+"""
+# Glyphs
+The `glyphs.py` module replaces the letters which aren't supported by
+the fonts of the game by letters which look the same and are
+supported.
+
+The substitution table is built once from the characters really
+drawn by `big_font.ttf` and `small_font.ttf`, so with custom fonts
+supporting the ukrainian alphabet nothing is replaced.
+
+It contains these functions:
+- `font_characters` returns the characters supported by a font.
+- `glyph_table` returns the `str.maketrans` substitution table.
+- `glyphs_signature` returns bytes which change with the table.
+- `replace_glyphs` replaces the letters of one text in one pass.
+- `replace_glyphs_bulk` replaces the letters of a whole column.
+- `replace_glyphs_catalog` replaces the letters of a translation
+catalog.
+
+The uninstaller loads this file too, so it only imports the
+`resource_path` of the app which loads it and logs with the logger
+called "kivy", which is `log` of the engine and the `Logger` of Kivy.
+"""
+
+import logging
+import struct
+from functools import cache
+
+try:
+    from sources.engine.resource_path import resource_path
+except ModuleNotFoundError:  # Loaded by the uninstaller
+    from sources.logic.resource_path import resource_path
+
+
+log = logging.getLogger("kivy")
+
+FONTS = ("resources/fonts/big_font.ttf", "resources/fonts/small_font.ttf")
+
+SUBSTITUTIONS = {
+    "ї": ("ï",), "і": ("i",),
+    "Ї": ("Ï",), "І": ("I",),
+    "Є": ("Е",), "є": ("е",),
+    "Ґ": ("Г", "г"), "ґ": ("г",)
+}
+# The letter and its look-alikes, the first one supported by every
+# font is used. These are the letters of the ukrainian alphabet which
+# the default fonts don't support.
+
+
+def _cmap_format_4(data: bytes, start: int) -> set[int]:
+    segments = struct.unpack_from(">H", data, start + 6)[0] // 2
+    ends = struct.unpack_from(f">{segments}H", data, start + 14)
+    starts = struct.unpack_from(
+        f">{segments}H", data, start + 16 + segments * 2
+    )
+    deltas = struct.unpack_from(
+        f">{segments}h", data, start + 16 + segments * 4
+    )
+    ranges_start = start + 16 + segments * 6
+    range_offsets = struct.unpack_from(f">{segments}H", data, ranges_start)
+
+    characters = set()
+    for i in range(segments):
+        for code in range(starts[i], ends[i] + 1):
+            if code == 0xFFFF:
+                continue
+
+            if range_offsets[i] == 0:
+                glyph = (code + deltas[i]) & 0xFFFF
+            else:
+                glyph = struct.unpack_from(
+                    ">H", data,
+                    ranges_start + i * 2 + range_offsets[i]
+                    + (code - starts[i]) * 2
+                )[0]
+                if glyph:
+                    glyph = (glyph + deltas[i]) & 0xFFFF
+
+            if glyph:
+                characters.add(code)
+
+    return characters
+
+
+def _cmap_format_12(data: bytes, start: int) -> set[int]:
+    groups = struct.unpack_from(">I", data, start + 12)[0]
+
+    characters = set()
+    for i in range(groups):
+        first, last, _ = struct.unpack_from(
+            ">III", data, start + 16 + i * 12
+        )
+        characters.update(range(first, last + 1))
+
+    return characters
+
+
+def font_characters(font_path: str) -> set[int]:
+    """
+    # Font Characters
+    The `font_characters` function reads the `cmap` table of a
+    TrueType or OpenType font and returns the code points it draws.
+    """
+
+    with open(font_path, "rb") as f:
+        data = f.read()
+
+    tables_count = struct.unpack_from(">H", data, 4)[0]
+    cmap = None
+
+    for i in range(tables_count):
+        tag, _, offset, _ = struct.unpack_from(">4sIII", data, 12 + i * 16)
+        if tag == b"cmap":
+            cmap = offset
+
+    if cmap is None:
+        raise ValueError(f"The <{font_path}> font has no cmap table.")
+
+    subtables_count = struct.unpack_from(">H", data, cmap + 2)[0]
+    characters = set()
+
+    for i in range(subtables_count):
+        platform, _, offset = struct.unpack_from(
+            ">HHI", data, cmap + 4 + i * 8
+        )
+        if platform not in (0, 3):  # Unicode and Windows
+            continue
+
+        start = cmap + offset
+        subtable_format = struct.unpack_from(">H", data, start)[0]
+
+        if subtable_format == 4:
+            characters |= _cmap_format_4(data, start)
+        elif subtable_format == 12:
+            characters |= _cmap_format_12(data, start)
+
+    return characters
+
+
+@cache
+def glyph_table() -> dict[int, str]:
+    """
+    # Glyph Table
+    The `glyph_table` function returns the substitution table for the
+    letters which aren't supported by every font.
+    """
+
+    fonts_characters = []
+    for font in FONTS:
+        try:
+            fonts_characters.append(font_characters(resource_path(font)))
+        except (OSError, ValueError, struct.error) as e:
+            log.warning(
+                f"Glyphs: The characters of <{font}> couldn't be read, "
+                f"all the ukrainian letters will be replaced: {e}"
+            )
+            fonts_characters.append(set())
+
+    def supported(letter: str) -> bool:
+        return all(ord(letter) in chars for chars in fonts_characters)
+
+    table = {}
+    for letter, look_alikes in SUBSTITUTIONS.items():
+        if supported(letter):
+            continue
+        table[letter] = next(
+            (a for a in look_alikes if supported(a)), look_alikes[0]
+        )
+
+    log.info(f"Glyphs: {len(table)} letters will be replaced.")
+    return str.maketrans(table)
+
+
+def glyphs_signature() -> bytes:
+    """
+    # Glyphs Signature
+    The `glyphs_signature` function returns bytes which change when
+    the substitution table changes, for example with new fonts.
+    """
+
+    return "".join(
+        f"{chr(letter)}{replacement}"
+        for letter, replacement in sorted(glyph_table().items())
+    ).encode("UTF-8")
+
+
+def replace_glyphs(text: str) -> str:
+    """
+    # Replace Glyphs
+    The `replace_glyphs` function replaces the unsupported letters of
+    the `text` in one pass.
+    """
+
+    return str(text).translate(glyph_table())
+
+
+def replace_glyphs_bulk(texts) -> list[str]:
+    """
+    # Replace Glyphs Bulk
+    The `replace_glyphs_bulk` function replaces the unsupported
+    letters of every text, for example a whole database column.
+    """
+
+    table = glyph_table()
+    return [str(text).translate(table) for text in texts]
+
+
+def replace_glyphs_catalog(catalog: dict) -> dict:
+    """
+    # Replace Glyphs Catalog
+    The `replace_glyphs_catalog` function replaces the unsupported
+    letters of a translation catalog. The values can be texts or
+    lists of texts.
+    """
+
+    table = glyph_table()
+    replaced = {}
+
+    for key, value in catalog.items():
+        if isinstance(value, str):
+            value = value.translate(table)
+        elif isinstance(value, list):
+            value = [
+                v.translate(table) if isinstance(v, str) else v
+                for v in value
+            ]
+        replaced[key] = value
+
+    return replaced
@@ -0,0 +1,21 @@
+"""
+# Logger
+The `logger.py` module only contains `log`, the logger of the engine.
+
+It's the logger called "kivy", which is the `Logger` of Kivy when the
+game runs, so the records of the engine are in the logs of the game.
+Without Kivy, it's a standard logger and the engine doesn't import
+Kivy.
+"""
+
+import logging
+
+
+log = logging.getLogger("kivy")
+"""
+# Log
+`log` is the logger of the engine, used like the `Logger` of Kivy:
+```python
+log.info("Component: Message.")
+```
+"""
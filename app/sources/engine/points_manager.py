@@ -0,0 +1,154 @@
+"""
+# Points Manager
+The `points_manager.pymodule contains the `PointsManager` class and
+the `score` function which counts the points of an answer.
+
+It counts points, saves and loads them from the state database.
+"""
+from typing import final
+
+from sources.engine.state_store import StateStore
+from sources.engine.logger import log
+
+
+WINNING_POINTS = 7
+MAX_WINNING_WIN_STREAK_POINTS = 5
+WINNING_WIN_STREAK_POINTS = 1
+LOSING_POINTS = 10
+
+
+def score(points: int, win_streak: int, correct: bool) -> tuple[int, int]:
+    """
+    # Score
+    The `score` function returns the points and the win streak after
+    an answer. A right answer wins more points with a win streak, a
+    wrong one loses points and the win streak.
+    """
+
+    if not correct:
+        return max(0, points - LOSING_POINTS), 0
+
+    points += WINNING_POINTS + WINNING_WIN_STREAK_POINTS * min(
+        win_streak, MAX_WINNING_WIN_STREAK_POINTS
+    )
+    return points, win_streak + 1
+
+
+@final
+class PointsManager():
+    """
+    # Points Manager
+    The `PointsManager` class counts points of a `profile`, saves and
+    loads them from the `store`, a `StateStore`.
+
+    Every answer is saved with the new points, and added to the
+    history of the answers, by the writer thread of the `store`.
+
+    It contains these methods:
+    - `save_data` saves the points in the database.
+    - `import_data` imports the points from the database.
+    - `clear_data` clears the points.
+    - `lose` makes the player lose points.
+    - `win` makes the player win points.
+    """
+
+    def __init__(
+        self, store: StateStore, profile: str | None = "default"
+    ) -> None:
+        self.store = store
+        self.profile = profile
+        self.points = 0
+        self.win_streak = 0
+        self.best_win_streak = 0
+
+        self.import_data()
+
+    def _state(self) -> dict[str, int]:
+        return {
+            "points": self.points,
+            "win_streak": self.win_streak,
+            "best_win_streak": self.best_win_streak
+        }
+
+    def save_data(self) -> None:
+        """
+        # Save Data
+        The `save_data` method saves the points in the database.
+        """
+
+        self.store.set_points(self._state(), self.profile)
+        log.info("Points: Data has been saved in the database.")
+
+    def import_data(self) -> None:
+        """
+        # Import Data
+        The `import_data` method imports the points from the database.
+        """
+
+        data = self.store.get_points(self.profile)
+
+        if data is None:
+            log.info(
+                f"Points: The <{self.profile}> profile has no points yet."
+            )
+            return
+
+        self.points = data["points"]
+        self.win_streak = data["win_streak"]
+        self.best_win_streak = data["best_win_streak"]
+        log.info("Points: Data has been imported from the database.")
+
+    def clear_data(self) -> None:
+        """
+        # Clear Data
+        The `clear_data` method clears the points. The history of the
+        answers is kept.
+        """
+
+        self.points, self.win_streak, self.best_win_streak = 0, 0, 0
+        log.info("Points: The stats were succesfully cleared.")
+        self.save_data()
+
+    def win(
+        self, question: int | None = None, latency: float | None = 0.0,
+        language: str | None = None
+    ) -> float:
+        """
+        # Win
+        The `win` method makes the player win points, and saves the
+        answer to the `question` of the `language`, answered in
+        `latency` seconds. It returns the time of the answer.
+        """
+
+        self.points, self.win_streak = score(
+            self.points, self.win_streak, True
+        )
+
+        if self.win_streak > self.best_win_streak:
+            self.best_win_streak = self.win_streak
+
+        return self.store.record_answer(
+            True, self._state(), self.profile,
+            language, question, latency
+        )
+
+    def lose(
+        self, question: int | None = None, latency: float | None = 0.0,
+        language: str | None = None
+    ) -> float:
+        """
+        # Lose
+        The `lose` method makes the player lose points, and saves the
+        answer to the `question` of the `language`, answered in
+        `latency` seconds. It returns the time of the answer.
+        """
+
+        self.points, self.win_streak = score(
+            self.points, self.win_streak, False
+        )
+
+        return self.store.record_answer(
+            False, self._state(), self.profile,
+            language, question, latency
+        )
+
@@ -0,0 +1,201 @@
+"""
+# Question Bank
+The `question_bank.py` module only contains the `QuestionBank` class.
+
+It chooses the questions of one language and keeps the statistics of
+their answers. It doesn't know anything about the images or the UI.
+"""
+
+import time
+from typing import final
+
+from sources.engine.resource_path import resource_path
+from sources.engine.questions_pack import load_pack, QUESTIONS_WRAP_WIDTHS
+from sources.engine.bag_store import BagStore
+from sources.engine.state_store import StateStore
+from sources.engine.question_stats import QuestionStats
+from sources.engine.randomizing_styles import (
+    create_style, RandomizingStyle, STYLES
+)
+from sources.engine.logger import log
+
+
+SAVE_INTERVAL = 5.0  # Seconds between two saves of the drawn questions
+
+
+@final
+class QuestionBank():
+    """
+    # Question Bank
+    The `QuestionBank` class contains the questions of a `language`:
+    its pack, the statistics of its questions and its randomizing
+    styles.
+
+    The statistics are read from the `store` and the states of the
+    persistent styles are saved with the `bag_store`. Without them,
+    the bank starts from nothing and saves nothing.
+
+    It contains these methods:
+    - `draw` returns the number of the next question of a randomizing
+    style.
+    - `put_back` gives back a drawn question which wasn't asked.
+    - `question` returns a question and its four answers.
+    - `observe` adds an answer to the statistics and the styles.
+    - `save` saves the states of the persistent styles.
+    - `close` closes the pack.
+    """
+
+    def __init__(
+        self, language: str, store: StateStore | None = None,
+        bag_store: BagStore | None = None, csv_path: str | None = None
+    ) -> None:
+        self.language = language
+        self.store = store
+        self.bag_store = bag_store
+        self.csv_name = csv_path or resource_path(
+            f"resources/databases/{language}.csv"
+        )
+
+        self.pack = load_pack(self.csv_name, QUESTIONS_WRAP_WIDTHS)
+        self.first_wrapped_column = (
+            self.pack.columns - len(QUESTIONS_WRAP_WIDTHS)
+        )
+        self.size = len(self.pack)
+
+        rows = store.question_stats(language) if store is not None else []
+        self.stats = QuestionStats.from_rows(language, self.size, rows)
+        self.styles = {}  # The randomizing styles which were used
+        self.unsaved = set()  # The persistent styles changed since saved
+        self.saved_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _bag_name(self, style_name: str) -> str:
+        if style_name == "normal":
+            return self.language  # The name of the older versions
+        return f"{self.language}.{style_name}"
+
+    def style(self, style_name: str) -> RandomizingStyle:
+        """
+        # Style
+        The `style` method returns the randomizing style called
+        `style_name`. It's created the first time, from its saved state
+        if it's persistent.
+        """
+
+        style = self.styles.get(style_name)
+
+        if style is None:
+            data = None
+            if STYLES[style_name].persistent and self.bag_store is not None:
+                data = self.bag_store.load(
+                    self._bag_name(style_name), self.pack.source_hash
+                )
+
+            style = create_style(style_name, self.size, self.stats, data)
+            self.styles[style_name] = style
+
+            if style.restored:
+                log.info(
+                    f"Questions: The <{style_name}> questions order of "
+                    f"<{self.language}> was restored."
+                )
+
+        return style
+
+    def draw(self, style_name: str | None = "normal") -> int:
+        """
+        # Draw
+        The `draw` method returns the number of the next question of
+        the randomizing style called `style_name`.
+
+        The state of a persistent style is only marked as changed. It's
+        saved in the background at most every `SAVE_INTERVAL` seconds,
+        because saving a bag copies all of it.
+        """
+
+        style = self.style(style_name)
+        question = style.draw()
+
+        if style.persistent:
+            self.unsaved.add(style_name)
+
+            if time.monotonic() - self.saved_at >= SAVE_INTERVAL:
+                self.save()
+
+        return question
+
+    def put_back(self, style_name: str, question: int) -> None:
+        """
+        # Put Back
+        The `put_back` method gives back the last `question` drawn with
+        the style called `style_name` when it wasn't asked, so it's
+        not skipped.
+        """
+
+        style = self.styles.get(style_name)
+
+        if style is not None:
+            style.put_back(question)
+
+            if style.persistent:
+                self.unsaved.add(style_name)
+
+    def question(self, number: int) -> tuple[str, str, str, str, str]:
+        """
+        # Question
+        The `question` method returns the question `number` and its
+        true answer followed by the three wrong answers, already
+        formatted in the pack.
+        """
+
+        return self.pack.row(number, self.first_wrapped_column)
+
+    def observe(
+        self, question: int, correct: bool, latency: float,
+        now: float | None = None
+    ) -> None:
+        """
+        # Observe
+        The `observe` method adds an answer to the statistics kept in
+        memory and gives it to the styles. The database is updated by
+        the `PointsManager`.
+        """
+
+        now = time.time() if now is None else now
+        self.stats.observe(question, correct, latency, now)
+
+        for style_name, style in self.styles.items():
+            style.observe(question, correct, now)
+
+            if style.persistent:
+                self.unsaved.add(style_name)
+
+    def save(self, wait: bool | None = False) -> None:
+        """
+        # Save
+        The `save` method saves the states of the persistent styles
+        which changed in the background. When `wait` is `True`, it
+        waits until the files are written.
+        """
+
+        self.saved_at = time.monotonic()
+
+        if self.bag_store is None:
+            self.unsaved.clear()
+            return
+
+        for style_name in self.unsaved:
+            self.bag_store.save(
+                self._bag_name(style_name),
+                self.styles[style_name].to_bytes(), self.pack.source_hash
+            )
+        self.unsaved.clear()
+
+        if wait:
+            self.bag_store.flush()
+
+    def close(self) -> None:
+        self.save()  # The last draws weren't saved yet
+        self.pack.close()
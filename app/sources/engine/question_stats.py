@@ -0,0 +1,104 @@
+"""
+# Question Stats
+The `question_stats.py` module only contains the `QuestionStats` class.
+
+It keeps in memory the answer statistics of every question of one
+language, so the questions can be chosen by accuracy without reading
+the database.
+"""
+
+from array import array
+from typing import final
+
+
+MAX_BOX = 5
+# The Leitner boxes go from 0 to `MAX_BOX`. A right answer moves the
+# question to the next box, a wrong one moves it back to the first.
+
+
+@final
+class QuestionStats():
+    """
+    # Question Stats
+    The `QuestionStats` class mirrors the `question_stats` table of the
+    state database for one `language`, in packed arrays indexed by the
+    row of the question:
+    - `asked`, how many times the question was answered.
+    - `correct`, how many times it was answered right.
+    - `last_asked`, the time of the last answer, 0 if never asked.
+    - `latency_total`, the answer times added together, in seconds.
+    - `box`, the Leitner box of the question.
+
+    It contains these methods:
+    - `observe` adds an answer to the statistics.
+    - `accuracy` returns the rate of right answers of a question.
+    - `mean_latency` returns the mean answer time of a question.
+    """
+
+    def __init__(self, language: str, size: int) -> None:
+        self.language = language
+        self.size = size
+        self.asked = array("I", bytes(4 * size))
+        self.correct = array("I", bytes(4 * size))
+        self.last_asked = array("d", bytes(8 * size))
+        self.latency_total = array("d", bytes(8 * size))
+        self.box = array("B", bytes(size))
+
+    @classmethod
+    def from_rows(cls, language: str, size: int, rows) -> "QuestionStats":
+        """
+        # From Rows
+        The `from_rows` method creates the statistics from the rows of
+        the `question_stats` table: question, asked, correct, last
+        asked, latency total and box. The rows out of the bank are
+        ignored.
+        """
+
+        stats = cls(language, size)
+
+        for question, asked, correct, last_asked, latency, box in rows:
+            if 0 <= question < size:
+                stats.asked[question] = asked
+                stats.correct[question] = correct
+                stats.last_asked[question] = last_asked
+                stats.latency_total[question] = latency
+                stats.box[question] = min(box, MAX_BOX)
+
+        return stats
+
+    def observe(
+        self, question: int, correct: bool, latency: float, answered_at: float
+    ) -> None:
+        """
+        # Observe
+        The `observe` method adds an answer to the running totals of
+        the `question` and moves it to its new box.
+        """
+
+        self.asked[question] += 1
+        self.correct[question] += int(correct)
+        self.last_asked[question] = answered_at
+        self.latency_total[question] += latency
+        self.box[question] = (
+            min(self.box[question] + 1, MAX_BOX) if correct else 0
+        )
+
+    def accuracy(self, question: int) -> float | None:
+        """
+        # Accuracy
+        The `accuracy` method returns the rate of right answers of the
+        `question`, or `None` if it was never asked.
+        """
+
+        asked = self.asked[question]
+        return self.correct[question] / asked if asked else None
+
+    def mean_latency(self, question: int) -> float | None:
+        """
+        # Mean Latency
+        The `mean_latency` method returns the mean answer time of the
+        `question` in seconds, or `None` if it was never asked.
+        """
+
+        asked = self.asked[question]
+        return self.latency_total[question] / asked if asked else None
@@ -0,0 +1,330 @@
+"""
+# Questions Pack
+The `questions_pack.py` module compiles the csv databases into binary
+question packs and reads them back without parsing the csv again.
+
+The csv files stay the editable source. A pack is rebuilt every time
+the hash of its csv file changes.
+
+A pack can also contain the wrapped version of some columns, with the
+letters unsupported by the fonts replaced, ready to be shown in the
+UI. They are added after the columns of the csv.
+
+## Pack format
+All the numbers are unsigned 32 bits integers.
+```
+header   magic "QMPK", version, columns, rows, sha256 of the csv,
+         of the wrapping widths and of the glyph table
+cells    (offset, length) of every cell, row after row
+strings  the utf-8 string table, each different string stored once
+```
+A cell is found by its row and column with a single offset
+calculation, so every question has the same access cost.
+"""
+
+import os
+import sys
+import csv
+import mmap
+import struct
+import hashlib
+from array import array
+from typing import final
+
+from sources.engine.text_wrapper import wrap_column
+from sources.engine.glyphs import replace_glyphs_bulk, glyphs_signature
+from sources.engine.logger import log
+
+
+PACK_MAGIC = b"QMPK"
+PACK_VERSION = 1
+PACK_EXTENSION = ".qmpk"
+
+HEADER = struct.Struct("<4sHHII32s")
+# magic, version, columns, rows, strings size, csv hash
+
+QUESTIONS_WRAP_WIDTHS = (35, 20, 20, 20, 20)
+# The question and the four answers, as they are shown in the UI
+
+
+def file_hash(file_path: str, wrap_widths: tuple[int, ...] = ()) -> bytes:
+    """
+    # File Hash
+    The `file_hash` function returns the sha256 digest of a file, of
+    the wrapping widths of its pack and of the glyph table used for
+    the wrapped columns.
+    """
+
+    with open(file_path, "rb") as f:
+        digest = hashlib.sha256(f.read())
+
+    if wrap_widths:
+        digest.update(b"wrap" + array("I", wrap_widths).tobytes())
+        digest.update(b"glyphs" + glyphs_signature())
+
+    return digest.digest()
+
+
+def pack_path(csv_path: str) -> str:
+    """
+    # Pack Path
+    The `pack_path` function returns the path of the pack compiled
+    from the `csv_path` database.
+    """
+
+    return os.path.splitext(csv_path)[0] + PACK_EXTENSION
+
+
+def read_database(csv_path: str) -> list[list[str]]:
+    """
+    # Read Database
+    The `read_database` function reads a csv database with the csv
+    module and returns its rows without the header.
+
+    Like `pandas.read_csv`, blank lines are skipped and short rows
+    are completed with empty cells.
+    """
+
+    with open(csv_path, "r", encoding="UTF-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < len(header):
+                row += [""] * (len(header) - len(row))
+            rows.append(row)
+
+    return rows
+
+
+def read_database_with_pandas(csv_path: str) -> list[list[str]]:
+    """
+    # Read Database With Pandas
+    The `read_database_with_pandas` function reads a csv database
+    with `pandas.read_csv`. It's only used by the command line tool
+    with the `--pandas` option, so pandas is imported here and only
+    if it's needed.
+    """
+
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    return df.values.tolist()
+
+
+def compile_pack(
+    csv_path: str, output_path: str | None = None,
+    reader=read_database, wrap_widths: tuple[int, ...] = ()
+) -> str:
+    """
+    # Compile Pack
+    The `compile_pack` function compiles the `csv_path` database into
+    a binary pack and returns the path of the pack.
+
+    For every width of `wrap_widths`, the column with the same index
+    gets its unsupported letters replaced, is wrapped at this width
+    and is added at the end of the rows.
+
+    The pack is written into a temporary file which replaces the old
+    pack only when it's complete.
+    """
+
+    if output_path is None:
+        output_path = pack_path(csv_path)
+
+    source_hash = file_hash(csv_path, wrap_widths)
+    rows = reader(csv_path)
+
+    if rows and wrap_widths:
+        wrapped_columns = [
+            wrap_column(replace_glyphs_bulk(row[c] for row in rows), width)
+            for c, width in enumerate(wrap_widths)
+        ]
+        rows = [
+            list(row) + list(wrapped)
+            for row, wrapped in zip(rows, zip(*wrapped_columns))
+        ]
+
+    columns = len(rows[0]) if rows else 0
+
+    strings = bytearray()
+    string_offsets = {}  # The same string is stored only once
+    cells = array("I")
+
+    for row in rows:
+        for value in row:
+            encoded = str(value).encode("UTF-8")
+            offset = string_offsets.get(encoded)
+
+            if offset is None:
+                offset = len(strings)
+                string_offsets[encoded] = offset
+                strings += encoded
+
+            cells.append(offset)
+            cells.append(len(encoded))
+
+    header = HEADER.pack(
+        PACK_MAGIC, PACK_VERSION, columns, len(rows), len(strings),
+        source_hash
+    )
+
+    temporary_path = output_path + ".tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(header)
+        f.write(cells.tobytes())
+        f.write(strings)
+    os.replace(temporary_path, output_path)
+
+    log.info(
+        f"Questions: The <{os.path.basename(csv_path)}> database was "
+        f"compiled into <{os.path.basename(output_path)}>."
+    )
+
+    return output_path
+
+
+@final
+class QuestionsPack():
+    """
+    # Questions Pack
+    The `QuestionsPack` class memory-maps a compiled pack and reads
+    its cells by row index.
+
+    It contains these methods:
+    - `cell` returns one cell of a row.
+    - `row` returns all the cells of a row.
+    - `close` closes the memory map.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+        with open(file_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic, version, self.columns, self.rows, strings_size,
+            self.source_hash
+        ) = HEADER.unpack_from(self._map, 0)
+
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self._map.close()
+            raise ValueError(
+                f"<{file_path}> isn't a version {PACK_VERSION} pack."
+            )
+
+        cells_size = self.rows * self.columns * 2 * 4
+        self._strings_start = HEADER.size + cells_size
+
+        if len(self._map) != self._strings_start + strings_size:
+            self._map.close()
+            raise ValueError(f"<{file_path}> is truncated.")
+
+        self._view = memoryview(self._map)
+        self._cells = self._view[HEADER.size:self._strings_start].cast("I")
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def cell(self, row: int, column: int) -> str:
+        """
+        # Cell
+        The `cell` method returns the cell at `row` and `column`.
+        """
+
+        if not 0 <= row < self.rows or not 0 <= column < self.columns:
+            raise IndexError(
+                f"The cell <{row}, {column}> isn't in the pack."
+            )
+
+        index = (row * self.columns + column) * 2
+        start = self._strings_start + self._cells[index]
+
+        return str(
+            self._view[start:start + self._cells[index + 1]], "UTF-8"
+        )
+
+    def row(self, row: int, first_column: int = 0) -> tuple[str, ...]:
+        """
+        # Row
+        The `row` method returns the cells of the `row`, from
+        `first_column` to the last one.
+        """
+
+        return tuple(
+            self.cell(row, column)
+            for column in range(first_column, self.columns)
+        )
+
+    def close(self) -> None:
+        """
+        # Close
+        The `close` method releases the memory map of the pack.
+        """
+
+        self._cells.release()
+        self._view.release()
+        self._map.close()
+
+
+def load_pack(
+    csv_path: str, wrap_widths: tuple[int, ...] = ()
+) -> QuestionsPack:
+    """
+    # Load Pack
+    The `load_pack` function opens the pack of the `csv_path`
+    database. The pack is compiled first if it doesn't exist, is
+    broken or if the hash of the csv file or the wrapping widths
+    changed.
+    """
+
+    compiled_path = pack_path(csv_path)
+
+    if os.path.exists(compiled_path):
+        try:
+            pack = QuestionsPack(compiled_path)
+        except (ValueError, struct.error):
+            log.warning(
+                f"Questions: The <{os.path.basename(compiled_path)}> "
+                "pack is broken. It'll be compiled again."
+            )
+        else:
+            if pack.source_hash == file_hash(csv_path, wrap_widths):
+                return pack
+            pack.close()
+
+    return QuestionsPack(
+        compile_pack(csv_path, compiled_path, wrap_widths=wrap_widths)
+    )
+
+
+if __name__ == "__main__":
+    # python -m sources.engine.questions_pack [--pandas] [database.csv ...]
+    from sources.engine.resource_path import resource_path
+
+    arguments = sys.argv[1:]
+    database_reader = read_database
+
+    if "--pandas" in arguments:
+        arguments.remove("--pandas")
+        database_reader = read_database_with_pandas
+
+    databases_folder = resource_path("resources/databases")
+    databases = arguments or [
+        os.path.join(databases_folder, f)
+        for f in sorted(os.listdir(databases_folder))
+        if f.endswith(".csv")
+    ]
+
+    for database in databases:
+        if os.path.basename(database) == "images.csv":
+            compile_pack(database, reader=database_reader)
+        else:
+            compile_pack(
+                database, reader=database_reader,
+                wrap_widths=QUESTIONS_WRAP_WIDTHS
+            )
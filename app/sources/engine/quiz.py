@@ -0,0 +1,124 @@
+"""
+# Quiz
+The `quiz.py` module contains the `Quiz` class and the `Question`
+tuple which it asks.
+
+It plays the game without UI, for example on a server, in a benchmark
+or in a script:
+```python
+store = StateStore(":memory:")
+quiz = Quiz(QuestionBank("en-EN", store), PointsManager(store))
+
+question = quiz.ask()
+quiz.answer(question.correct)
+```
+"""
+
+import time
+from random import Random
+from typing import final, NamedTuple
+
+from sources.engine.question_bank import QuestionBank
+from sources.engine.points_manager import PointsManager
+from sources.engine.randomizing_styles import RandomizingStyle
+
+
+class Question(NamedTuple):
+    """
+    # Question
+    The `Question` tuple is an asked question. Its `answers` are in a
+    random order, `correct` is the index of the true answer.
+    """
+
+    number: int
+    text: str
+    answers: tuple[str, str, str, str]
+    correct: int
+
+
+@final
+class Quiz():
+    """
+    # Quiz
+    The `Quiz` class asks the questions of a `QuestionBank` with the
+    randomizing style called `style_name`, and counts the points of
+    the answers with a `PointsManager`.
+
+    The styles of the bank are shared by its quizzes. A quiz can have
+    its own `style` instead, for example when many players use the
+    same bank.
+
+    It contains these methods:
+    - `ask` returns the next question.
+    - `answer` checks the answer to the asked question.
+    """
+
+    def __init__(
+        self, bank: QuestionBank, points: PointsManager,
+        style_name: str | None = "normal", rng: Random | None = None,
+        style: RandomizingStyle | None = None
+    ) -> None:
+        self.bank = bank
+        self.points = points
+        self.style_name = style_name
+        self.style = style
+        self.rng = rng or Random()
+
+        self.question = None  # The asked `Question`
+        self.asked_at = 0.0
+
+    def ask(self) -> Question:
+        """
+        # Ask
+        The `ask` method draws the next question and shuffles its
+        answers.
+        """
+
+        if self.style is None:
+            number = self.bank.draw(self.style_name)
+        else:
+            number = self.style.draw()
+        text, *answers = self.bank.question(number)
+
+        order = [0, 1, 2, 3]  # The true answer is the first one
+        self.rng.shuffle(order)
+
+        self.question = Question(
+            number, text, tuple(answers[i] for i in order), order.index(0)
+        )
+        self.asked_at = time.monotonic()
+        return self.question
+
+    def answer(self, choice: int, latency: float | None = None) -> bool:
+        """
+        # Answer
+        The `answer` method checks if `choice` is the index of the true
+        answer, counts the points and adds the answer to the
+        statistics. `latency` is the time since `ask` by default.
+        """
+
+        if self.question is None:
+            raise RuntimeError("No question was asked.")
+
+        if latency is None:
+            latency = time.monotonic() - self.asked_at
+
+        question = self.question
+        self.question = None
+        correct = choice == question.correct
+
+        if correct:
+            answered_at = self.points.win(
+                question.number, latency, self.bank.language
+            )
+        else:
+            answered_at = self.points.lose(
+                question.number, latency, self.bank.language
+            )
+
+        self.bank.observe(question.number, correct, latency, answered_at)
+
+        if self.style is not None:
+            self.style.observe(question.number, correct, answered_at)
+
+        return correct
@@ -0,0 +1,222 @@
+"""
+# Randomizing Styles
+The `randomizing_styles.py` module contains the randomizing styles,
+which choose the next question, and their registry.
+
+Every style is registered with the `register_style` decorator, so a
+new style is added without changing the `QuestionsManager`.
+
+It contains these classes:
+- `RandomizingStyle`, the common interface of the styles.
+- `NormalStyle`, every question once in a random order.
+- `AlternativeStyle`, a random question every time.
+- `InOrderStyle`, the questions in the order of the database.
+- `AdaptiveStyle`, spaced repetition from the answer statistics.
+"""
+
+from abc import ABC, abstractmethod
+from random import randrange
+from typing import final
+
+from sources.engine.question_stats import QuestionStats
+from sources.engine.shuffle_bag import ShuffleBag
+from sources.engine.spaced_repetition import SpacedRepetition
+from sources.engine.logger import log
+
+
+STYLES = {}
+# The registered styles by name, in the order of the settings screen
+
+
+def register_style(name: str):
+    """
+    # Register Style
+    The `register_style` decorator adds a `RandomizingStyle` subclass
+    to `STYLES` under the `name` of the setting.
+    """
+
+    def decorator(style_class: type) -> type:
+        style_class.name = name
+        STYLES[name] = style_class
+        return style_class
+
+    return decorator
+
+
+def create_style(
+    name: str, size: int, stats: QuestionStats,
+    data: bytes | None = None
+) -> "RandomizingStyle":
+    """
+    # Create Style
+    The `create_style` function creates the style called `name` for a
+    bank of `size` questions. It's restored from `data` when it's given
+    and valid, then its `restored` attribute is `True`.
+    """
+
+    style_class = STYLES[name]
+
+    if data:
+        try:
+            style = style_class.from_bytes(data, size, stats)
+        except ValueError as e:
+            log.warning(
+                f"Questions: The <{name}> .bag file is broken ({e}). "
+                "The questions order was reset."
+            )
+            style = None
+
+        if style is not None:
+            style.restored = True
+            return style
+
+    return style_class(size, stats)
+
+
+class RandomizingStyle(ABC):
+    """
+    # Randomizing Style
+    The `RandomizingStyle` class is the interface of the styles. A
+    style is created for a bank of `size` questions and can read the
+    `stats` of their answers. Every style must define `draw`.
+
+    `persistent` styles are saved with `to_bytes` a few seconds after
+    a draw and restored with `from_bytes` when the game starts.
+
+    It contains these methods:
+    - `draw` returns the next question.
+    - `observe` is called after every answer.
+    - `put_back` gives back a drawn question which wasn't asked.
+    - `to_bytes` returns the state of the style.
+    - `from_bytes` restores a style from its state.
+    """
+
+    name = ""
+    persistent = False
+    restored = False  # Restored from the saved state by `create_style`
+
+    def __init__(self, size: int, stats: QuestionStats) -> None:
+        self.size = size
+        self.stats = stats
+
+    @abstractmethod
+    def draw(self) -> int:
+        """
+        # Draw
+        The `draw` method returns the number of the next question.
+        """
+
+    def observe(self, question: int, correct: bool, now: float) -> None:
+        """
+        # Observe
+        The `observe` method is called after the answer to `question`,
+        once it's added to the `stats`. Most styles ignore it.
+        """
+
+    def put_back(self, question: int) -> None:
+        """
+        # Put Back
+        The `put_back` method is called when the last drawn `question`
+        wasn't asked, so the style can draw it again. A style without
+        state ignores it.
+        """
+
+    def to_bytes(self) -> bytes:
+        return b""
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, size: int, stats: QuestionStats
+    ) -> "RandomizingStyle | None":
+        return None
+
+
+@final
+@register_style("normal")
+class NormalStyle(RandomizingStyle):
+    """
+    # Normal Style
+    The `NormalStyle` class asks every question once in a random order
+    before asking them again. Its order is kept after a restart.
+    """
+
+    persistent = True
+
+    def __init__(
+        self, size: int, stats: QuestionStats, bag: ShuffleBag | None = None
+    ) -> None:
+        super().__init__(size, stats)
+        self.bag = ShuffleBag(size) if bag is None else bag
+
+    def draw(self) -> int:
+        return self.bag.draw()
+
+    def put_back(self, question: int) -> None:
+        self.bag.put_back(question)
+
+    def to_bytes(self) -> bytes:
+        return self.bag.to_bytes()
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, size: int, stats: QuestionStats
+    ) -> "NormalStyle | None":
+        bag = ShuffleBag.from_bytes(data)
+        return cls(size, stats, bag) if len(bag) == size else None
+
+
+@final
+@register_style("alternative")
+class AlternativeStyle(RandomizingStyle):
+    """
+    # Alternative Style
+    The `AlternativeStyle` class asks a random question every time, so
+    a question can come back at once.
+    """
+
+    def draw(self) -> int:
+        return randrange(self.size)
+
+
+@final
+@register_style("in_order")
+class InOrderStyle(RandomizingStyle):
+    """
+    # In Order Style
+    The `InOrderStyle` class asks the questions in the order of the
+    database.
+    """
+
+    def __init__(self, size: int, stats: QuestionStats) -> None:
+        super().__init__(size, stats)
+        self.bag = ShuffleBag(size, shuffled=False)
+
+    def draw(self) -> int:
+        return self.bag.draw()
+
+    def put_back(self, question: int) -> None:
+        self.bag.put_back(question)
+
+
+@final
+@register_style("adaptive")
+class AdaptiveStyle(RandomizingStyle):
+    """
+    # Adaptive Style
+    The `AdaptiveStyle` class asks the questions with a
+    `SpacedRepetition` schedule. Its state is the `stats`, which are
+    saved in the state database.
+    """
+
+    def __init__(self, size: int, stats: QuestionStats) -> None:
+        super().__init__(size, stats)
+        self.scheduler = SpacedRepetition(stats)
+
+    def draw(self) -> int:
+        return self.scheduler.draw()
+
+    def observe(self, question: int, correct: bool, now: float) -> None:
+        self.scheduler.observe(question, now)
+
+    def put_back(self, question: int) -> None:
+        self.scheduler.put_back(question)
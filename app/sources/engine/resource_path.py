@@ -0,0 +1,137 @@
+"""
+# Resource Path
+The `resouce_path.py file contains the `resouce_path` function.
+It's used to get the complete path of a file or a folder.
+
+It's also useful for converting the project into an executable (.exe).
+
+The resources are listed once in a manifest when the game starts, so
+finding a path is only a dictionary lookup.
+
+When the `QUIZMASTER_DATA` environment variable is set, its folder is
+searched before the game, and the files which don't exist yet, like
+`sources/json/state.db` or the logs, are created in it. The benchmarks
+use it so they never change the real state of the game.
+"""
+
+import os
+import sys
+import posixpath
+from functools import cache
+from sources.engine.logger import log
+
+
+PYGAME = True
+
+MANIFEST_FOLDERS = ("resources", "sources/json")
+# The folders listed in the manifest. The other paths are still found,
+# they are added to the manifest when they exist.
+
+DATA_VARIABLE = "QUIZMASTER_DATA"
+
+
+def _base_path() -> str:
+    try:
+        return sys._MEIPASS
+    except Exception:
+        return os.path.abspath(".")
+
+
+def _search_paths() -> list[str]:
+    """
+    # Search Paths
+    The `_search_paths` function returns the folders where the paths
+    are searched, in order: the `QUIZMASTER_DATA` folder if it's set,
+    the folder of the game and its `app` folder.
+    """
+
+    base_path = _base_path()
+    data_path = os.environ.get(DATA_VARIABLE)
+
+    return (
+        [data_path] if data_path else []
+    ) + [base_path, os.path.join(base_path, "app")]
+
+
+def _key(relative_path: str) -> str:
+    return posixpath.normpath(str(relative_path).replace("\\", "/"))
+
+
+@cache
+def resource_manifest() -> dict[str, str]:
+    """
+    # Resource Manifest
+    The `resource_manifest` function lists the files and the folders
+    of `MANIFEST_FOLDERS` once, and returns a dictionary with their
+    relative path as key and their complete path as value.
+
+    The folders next to the game are used before the ones of the
+    `app` folder, like in `resource_path`.
+    """
+
+    manifest = {}
+
+    for base in _search_paths():
+        for folder in MANIFEST_FOLDERS:
+            for root, folders, files in os.walk(os.path.join(base, folder)):
+                for name in folders + files:
+                    path = os.path.join(root, name)
+                    manifest.setdefault(
+                        _key(os.path.relpath(path, base)), path
+                    )
+
+            if os.path.isdir(os.path.join(base, folder)):
+                manifest.setdefault(_key(folder), os.path.join(base, folder))
+
+    log.info(f"ResourcePath: {len(manifest)} resources were found.")
+    return manifest
+
+
+def resource_exists(relative_path: str) -> bool:
+    """
+    # Resource Exists
+    The `resource_exists` function tells if the file or the folder
+    exists, from the manifest.
+    """
+
+    return _key(relative_path) in resource_manifest()
+
+
+def resource_path(relative_path: str | None = None) -> str:
+    """
+    # Resource Path
+    The `resouce_path` function is used to get the complete path of a
+    file or a folder.
+
+    It's also useful for converting the project into an executable
+    (.exe).
+    """
+
+    if relative_path is None:
+        log.error(
+            f"ResourcePath: The path <{relative_path}> wasn't found."
+        )
+        return relative_path
+
+    manifest = resource_manifest()
+    key = _key(relative_path)
+    file_path = manifest.get(key)
+
+    if file_path is None:
+        for base in _search_paths():
+            file_path = os.path.join(base, key)
+
+            if os.path.exists(file_path):
+                manifest[key] = file_path  # Created after the start
+                break
+        else:
+            # A new file is created in the data folder, if there is one
+            file_path = os.path.join(
+                os.environ.get(DATA_VARIABLE)
+                or os.path.join(_base_path(), "app"), key
+            )
+
+    if str(relative_path).endswith(("/", "\\")):
+        file_path = os.path.join(file_path, "")
+
+    return file_path
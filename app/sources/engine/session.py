@@ -0,0 +1,157 @@
+"""
+# Session
+The `session.py` module only contains the `Session` class and the
+`permute` function which chooses its questions.
+
+A process keeps one `SharedBank` per language and one small `Session`
+per player, so thousands of players are served by one process.
+"""
+
+import time
+from random import getrandbits, randrange
+from typing import final
+
+from sources.engine.shared_bank import SharedBank
+from sources.engine.points_manager import score
+from sources.engine.quiz import Question
+
+
+MASK_64 = (1 << 64) - 1
+FEISTEL_ROUNDS = 4
+ROUND_STEP = 0x9E3779B97F4A7C15  # Changes the key of every round
+
+
+def _mix(value: int) -> int:
+    # The finalizer of SplitMix64, every bit changes about half of them
+    value &= MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def permute(index: int, size: int, key: int) -> int:
+    """
+    # Permute
+    The `permute` function returns the number at `index` in a random
+    permutation of the numbers from `0` to `size - 1` chosen by `key`.
+
+    It's a small Feistel network on the bits of `size`, walking the
+    cycle until the number is smaller than `size`. Nothing is stored,
+    so the permutation costs no memory.
+    """
+
+    half = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half) - 1
+    number = index
+
+    while True:
+        left, right = number >> half, number & mask
+
+        for round_number in range(FEISTEL_ROUNDS):
+            left, right = right, left ^ (
+                _mix(key + round_number * ROUND_STEP + right) & mask
+            )
+
+        number = (left << half) | right
+
+        if number < size:
+            return number
+
+
+@final
+class Session():
+    """
+    # Session
+    The `Session` class contains only the state of one player over a
+    `SharedBank`: the cursor on its questions, the points, the win
+    streak and the asked question.
+
+    The questions are asked once in a random order before being asked
+    again, like with the "normal" randomizing style. The order is
+    computed from the `key` and the cursor by `permute`, so it's not
+    stored and every pass has a new order.
+
+    It contains these methods:
+    - `ask` returns the next question.
+    - `answer` checks the answer to the asked question and counts the
+    points.
+    - `show` shows a question asked by someone else, like a room.
+    - `set_bank` changes the bank, for example for another language.
+    """
+
+    __slots__ = (
+        "bank", "key", "cursor", "points", "win_streak",
+        "best_win_streak", "question", "correct", "asked_at"
+    )
+
+    def __init__(self, bank: SharedBank, key: int | None = None) -> None:
+        self.bank = bank
+        self.key = getrandbits(64) if key is None else key
+        self.cursor = 0
+        self.points = 0
+        self.win_streak = 0
+        self.best_win_streak = 0
+        self.question = -1  # The number of the asked question
+        self.correct = -1  # The index of the true answer
+        self.asked_at = 0.0  # To measure the answer time
+
+    @property
+    def language(self) -> str:
+        return self.bank.language
+
+    def set_bank(self, bank: SharedBank) -> None:
+        self.bank = bank
+        self.cursor = 0
+        self.question = -1
+
+    def ask(self) -> Question:
+        """
+        # Ask
+        The `ask` method returns the next question. Its answers are
+        turned so the true answer is at a random index.
+        """
+
+        size = len(self.bank)
+        passes, index = divmod(self.cursor, size)
+        self.cursor += 1
+
+        self.question = permute(index, size, (self.key + passes) & MASK_64)
+        self.correct = randrange(4)
+        self.asked_at = time.monotonic()
+
+        text, *answers = self.bank.question(self.question)
+        shift = 4 - self.correct  # The true answer is the first one
+        answers = answers[shift:] + answers[:shift]
+
+        return Question(self.question, text, tuple(answers), self.correct)
+
+    def show(self, question: Question) -> None:
+        """
+        # Show
+        The `show` method makes `question` the asked question, when it
+        was chosen by someone else, for example by a room where every
+        player gets the same question.
+        """
+
+        self.question = question.number
+        self.correct = question.correct
+        self.asked_at = time.monotonic()
+
+    def answer(self, choice: int) -> bool:
+        """
+        # Answer
+        The `answer` method checks if `choice` is the index of the true
+        answer and counts the points.
+        """
+
+        if self.question < 0:
+            raise RuntimeError("No question was asked.")
+
+        correct = choice == self.correct
+        self.points, self.win_streak = score(
+            self.points, self.win_streak, correct
+        )
+        self.best_win_streak = max(self.best_win_streak, self.win_streak)
+        self.question = -1
+
+        return correct
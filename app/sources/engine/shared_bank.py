@@ -0,0 +1,80 @@
+"""
+# Shared Bank
+The `shared_bank.py` module only contains the `SharedBank` class.
+
+It keeps the questions of a language once in memory, read-only, for
+every `Session` of the process.
+"""
+
+import sys
+from typing import final
+
+from sources.engine.resource_path import resource_path
+from sources.engine.questions_pack import load_pack, QUESTIONS_WRAP_WIDTHS
+
+
+@final
+class SharedBank():
+    """
+    # Shared Bank
+    The `SharedBank` class contains the questions of a `language`: for
+    every question, the question and its true answer followed by the
+    three wrong answers, already formatted.
+
+    It can't be changed after it's loaded, so the sessions share it
+    without lock. Every text is interned with `sys.intern`, so an
+    answer used by many questions, a country or a year, is kept once.
+
+    It contains these methods:
+    - `load` reads the bank of a language from its pack.
+    - `question` returns a question and its four answers.
+    """
+
+    __slots__ = ("language", "questions", "source_hash")
+
+    def __init__(
+        self, language: str, questions: tuple[tuple[str, ...], ...],
+        source_hash: bytes | None = b""
+    ) -> None:
+        object.__setattr__(self, "language", language)
+        object.__setattr__(self, "questions", questions)
+        object.__setattr__(self, "source_hash", source_hash)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("A SharedBank can't be changed.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("A SharedBank can't be changed.")
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    @classmethod
+    def load(
+        cls, language: str, csv_path: str | None = None
+    ) -> "SharedBank":
+        """
+        # Load
+        The `load` method reads every question of the `language` from
+        its pack, compiled first if needed, and closes the pack.
+        """
+
+        pack = load_pack(
+            csv_path or resource_path(f"resources/databases/{language}.csv"),
+            QUESTIONS_WRAP_WIDTHS
+        )
+        first_column = pack.columns - len(QUESTIONS_WRAP_WIDTHS)
+
+        try:
+            questions = tuple(
+                tuple(map(sys.intern, pack.row(row, first_column)))
+                for row in range(len(pack))
+            )
+            source_hash = pack.source_hash
+        finally:
+            pack.close()
+
+        return cls(language, questions, source_hash)
+
+    def question(self, number: int) -> tuple[str, ...]:
+        return self.questions[number]
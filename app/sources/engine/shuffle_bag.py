@@ -0,0 +1,123 @@
+"""
+# Shuffle Bag
+The `shuffle_bag.py` module only contains the `ShuffleBag` class.
+
+It gives every question number once before giving them again, in a
+random order or in order.
+"""
+
+from array import array
+from random import randrange
+from typing import final
+
+
+@final
+class ShuffleBag():
+    """
+    # Shuffle Bag
+    The `ShuffleBag` class contains the numbers from `0` to `size - 1`
+    and a cursor on the next number to draw.
+
+    When `shuffled` is `True`, every draw does one step of the
+    Fisher-Yates shuffle: the number under the cursor is swapped with
+    a random number which wasn't drawn yet. So the shuffle costs
+    the same small time on every draw and there is no refill: when the
+    cursor reaches the end, it goes back to the start and the next
+    pass is shuffled again in the same way.
+
+    It contains these methods:
+    - `draw` returns the next number in O(1).
+    - `put_back` gives back the last drawn number.
+    - `remaining` returns how many numbers are left in this pass.
+    - `reset` starts a new pass.
+    - `to_bytes` and `from_bytes` save and restore the numbers and
+    the cursor.
+    """
+
+    def __init__(self, size: int, shuffled: bool | None = True) -> None:
+        self.size = size
+        self.shuffled = shuffled
+        self.cursor = 0
+        self.numbers = array("I", range(size))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def draw(self) -> int:
+        """
+        # Draw
+        The `draw` method returns the next number of the bag.
+        """
+
+        if self.size == 0:
+            raise IndexError("The shuffle bag is empty.")
+
+        if self.cursor == self.size:
+            self.cursor = 0
+
+        cursor = self.cursor
+        numbers = self.numbers
+
+        if self.shuffled:
+            other = randrange(cursor, self.size)
+            numbers[cursor], numbers[other] = numbers[other], numbers[cursor]
+
+        self.cursor = cursor + 1
+        return numbers[cursor]
+
+    def put_back(self, number: int) -> None:
+        """
+        # Put Back
+        The `put_back` method gives back the last drawn `number` when
+        it wasn't used, so it's drawn again in this pass.
+        """
+
+        if self.cursor and self.numbers[self.cursor - 1] == number:
+            self.cursor -= 1
+
+    def remaining(self) -> int:
+        """
+        # Remaining
+        The `remaining` method returns how many numbers are left
+        before the bag starts a new pass.
+        """
+
+        return self.size - self.cursor
+
+    def reset(self) -> None:
+        """
+        # Reset
+        The `reset` method starts a new pass, so every number can be
+        drawn again.
+        """
+
+        self.cursor = 0
+
+    def to_bytes(self) -> bytes:
+        """
+        # To Bytes
+        The `to_bytes` method returns the cursor followed by the
+        numbers of the bag as a packed array.
+        """
+
+        return self.cursor.to_bytes(4, "little") + self.numbers.tobytes()
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, shuffled: bool | None = True
+    ) -> "ShuffleBag":
+        """
+        # From Bytes
+        The `from_bytes` method creates a bag from the data returned
+        by `to_bytes`.
+        """
+
+        bag = cls(0, shuffled)
+        bag.numbers.frombytes(memoryview(data)[4:])
+        bag.size = len(bag.numbers)
+        bag.cursor = int.from_bytes(data[:4], "little")
+
+        if bag.cursor > bag.size:
+            raise ValueError("The cursor of the shuffle bag is too big.")
+
+        return bag
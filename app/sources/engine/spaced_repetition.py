@@ -0,0 +1,176 @@
+"""
+# Spaced Repetition
+The `spaced_repetition.py` module only contains the `SpacedRepetition`
+class.
+
+It chooses the questions of the "adaptive" randomizing style: the
+questions answered wrong come back soon, the ones answered right come
+back later and later.
+"""
+
+import time
+import heapq
+from array import array
+from itertools import compress
+from operator import not_
+from typing import final
+
+from sources.engine.question_stats import QuestionStats, MAX_BOX
+from sources.engine.shuffle_bag import ShuffleBag
+
+
+INTERVALS = (60, 5 * 60, 30 * 60, 3 * 3600, 24 * 3600, 7 * 24 * 3600)
+# Seconds before a question of every Leitner box is asked again
+
+
+@final
+class SpacedRepetition():
+    """
+    # Spaced Repetition
+    The `SpacedRepetition` class schedules the questions with Leitner
+    boxes. Every answered question is due `INTERVALS[box]` seconds
+    after its last answer.
+
+    The answered questions are in a heap ordered by due time, so the
+    next question is found in O(log n). The questions which were never
+    asked are drawn from a `ShuffleBag` when no question is due.
+
+    It contains these methods:
+    - `draw` returns the next question.
+    - `observe` schedules a question again after its answer.
+    - `put_back` gives back the last drawn question.
+    - `due_count` returns how many questions are due.
+    """
+
+    def __init__(
+        self, stats: QuestionStats,
+        intervals: tuple[int, ...] | None = INTERVALS
+    ) -> None:
+        if len(intervals) != MAX_BOX + 1:
+            raise ValueError("There must be one interval per box.")
+
+        self.stats = stats
+        self.intervals = intervals
+        self.due = array("d", bytes(8 * stats.size))  # 0 if never asked
+
+        questions = range(stats.size)
+        heap = []
+
+        for question in compress(questions, stats.asked):
+            due = (
+                stats.last_asked[question] + intervals[stats.box[question]]
+            )
+            self.due[question] = due
+            heap.append((due, question))
+
+        heapq.heapify(heap)
+        self._heap = heap
+        self._unseen = array(
+            "I", compress(questions, map(not_, stats.asked))
+        )
+        self._new_questions = ShuffleBag(len(self._unseen))
+        self._draws = []  # The questions drawn but not answered yet
+
+    def _push(self, question: int, due: float) -> None:
+        self.due[question] = due
+        heapq.heappush(self._heap, (due, question))
+
+    def _first_due(self) -> float | None:
+        """
+        # First Due
+        The `_first_due` method drops the entries of the heap which were
+        rescheduled since, and returns the due time of the first
+        question.
+        """
+
+        while self._heap:
+            due, question = self._heap[0]
+
+            if self.due[question] == due:
+                return due
+
+            heapq.heappop(self._heap)
+
+        return None
+
+    def draw(self, now: float | None = None) -> int:
+        """
+        # Draw
+        The `draw` method returns the question which is due first. If
+        no question is due yet, a question never asked is returned, and
+        when every question was asked, the next one to be due.
+        """
+
+        now = time.time() if now is None else now
+        first_due = self._first_due()
+        new_index = None
+
+        if first_due is not None and (
+            first_due <= now or not self._new_questions.remaining()
+        ):
+            question = heapq.heappop(self._heap)[1]
+        elif self._new_questions.remaining():
+            new_index = self._new_questions.draw()
+            question = self._unseen[new_index]
+        else:
+            raise IndexError("There are no questions to schedule.")
+
+        self._draws.append((question, self.due[question], new_index))
+
+        # Scheduled again if it's never answered
+        self._push(question, now + self.intervals[0])
+
+        return question
+
+    def put_back(self, question: int) -> None:
+        """
+        # Put Back
+        The `put_back` method gives back the last drawn `question` when
+        it wasn't asked: it gets its previous due time, or goes back to
+        the questions never asked. Several questions drawn ahead are
+        given back from the last one.
+        """
+
+        if not self._draws or self._draws[-1][0] != question:
+            return
+
+        _, due, new_index = self._draws.pop()
+
+        if new_index is None:
+            self._push(question, due)
+        else:
+            self.due[question] = due  # Its entry of the heap is dropped
+            self._new_questions.put_back(new_index)
+
+    def observe(self, question: int, now: float | None = None) -> None:
+        """
+        # Observe
+        The `observe` method schedules the `question` after its answer,
+        with its new box. The `QuestionStats` must already contain the
+        answer.
+
+        The questions drawn before the `question` can't be given back
+        anymore, only the ones drawn ahead after it.
+        """
+
+        now = time.time() if now is None else now
+
+        for index, draw in enumerate(self._draws):
+            if draw[0] == question:
+                del self._draws[:index + 1]
+                break
+
+        self._push(question, now + self.intervals[self.stats.box[question]])
+
+    def due_count(self, now: float | None = None) -> int:
+        """
+        # Due Count
+        The `due_count` method returns how many answered questions are
+        due now.
+        """
+
+        now = time.time() if now is None else now
+        return sum(
+            1 for question, due in enumerate(self.due)
+            if self.stats.asked[question] and 0 < due <= now
+        )
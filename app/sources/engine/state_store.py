@@ -0,0 +1,490 @@
+"""
+# State Store
+The `state_store.py` module only contains the `StateStore` class.
+
+It keeps the settings, the points of every profile and the history of
+the answers in one SQLite database, `sources/json/state.db`.
+"""
+
+import os
+import json
+import time
+import queue
+import sqlite3
+import threading
+from typing import final
+
+from sources.engine.resource_path import resource_path
+from sources.engine.question_stats import MAX_BOX
+from sources.engine.logger import log
+
+
+SCHEMA_VERSION = 1
+RETRY_DELAY = 1.0  # Seconds before the answers which failed are retried
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS points (
+    profile TEXT PRIMARY KEY,
+    points INTEGER NOT NULL,
+    win_streak INTEGER NOT NULL,
+    best_win_streak INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    language TEXT,
+    question INTEGER,
+    correct INTEGER NOT NULL,
+    answered_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS question_stats (
+    language TEXT NOT NULL,
+    question INTEGER NOT NULL,
+    asked INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    last_asked REAL NOT NULL,
+    latency_total REAL NOT NULL,
+    box INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (language, question)
+);
+"""
+
+EMPTY_POINTS = {"points": 0, "win_streak": 0, "best_win_streak": 0}
+
+
+def _read_json(path: str) -> dict | None:
+    try:
+        with open(path, "r", encoding="UTF-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def _read_points_json(folder: str) -> dict | None:
+    """
+    # Read Points Json
+    The `_read_points_json` function reads the points of the json
+    files of the older versions: `points.json` and the newer lines of
+    `points.journal`.
+    """
+
+    data = _read_json(os.path.join(folder, "points.json"))
+    state = dict(EMPTY_POINTS)
+    sequence = 0
+    found = data is not None
+
+    if found:
+        for key in EMPTY_POINTS:
+            state[key] = int(data.get(key, 0))
+        sequence = data.get("sequence", 0)
+
+    try:
+        with open(
+            os.path.join(folder, "points.journal"), "r", encoding="UTF-8"
+        ) as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break  # The last line was cut by a crash
+
+                if event.get("sequence", 0) > sequence:
+                    for key in EMPTY_POINTS:
+                        state[key] = int(event.get(key, state[key]))
+                    found = True
+
+    except OSError:
+        pass
+
+    return state if found else None
+
+
+@final
+class StateStore():
+    """
+    # State Store
+    The `StateStore` class keeps the state of the game in a SQLite
+    database in WAL mode:
+    - `settings`, one row per setting, the value is json.
+    - `points`, the points of every profile.
+    - `answers`, one row per answer, never changed.
+    - `question_stats`, the running totals of the answers of every
+    question and its Leitner box, by language and row.
+
+    The answers are written by a background thread, so answering never
+    waits for the database: the answers waiting together are written in
+    one transaction. In WAL mode with `NORMAL` synchronisation a commit
+    doesn't wait for the disk, the changes are synchronised at the
+    checkpoints. The points and the history are read after the waiting
+    answers are written.
+
+    When the database can't be written, for example when it's locked,
+    the answers are kept and written again with the next answers, or
+    after `RETRY_DELAY` seconds.
+
+    The first time, the settings.json and points.json files of the
+    older versions are imported.
+
+    It contains these methods:
+    - `get_settings` returns the saved settings.
+    - `set_settings` saves some settings.
+    - `get_points` returns the points of a profile.
+    - `set_points` saves the points of a profile.
+    - `record_answer` saves an answer and the new points.
+    - `flush` waits until the answers are written.
+    - `answers_count` returns the number of saved answers.
+    - `question_stats` returns the statistics of the questions.
+    - `close` writes the waiting answers and closes the database.
+    """
+
+    def __init__(self, database_path: str | None = None) -> None:
+        if database_path is None:
+            folder = resource_path("sources/json/")
+
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+                log.info(
+                    "State: The <sources/json/> folder does not exist. "
+                    "A new <sources/json/> folder was created."
+                )
+
+            database_path = os.path.join(folder, "state.db")
+
+        self.database_path = database_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            database_path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._add_missing_columns()
+
+        self._answers = queue.Queue()  # Answers waiting to be written
+        self._unsaved = []  # Answers which failed, used by the writer
+        self._writer = threading.Thread(
+            target=self._write_answers, name="StateStore", daemon=True
+        )
+        self._writer.start()
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()
+        if version[0] < SCHEMA_VERSION:
+            self._migrate_json(
+                None if database_path == ":memory:"
+                else os.path.dirname(database_path)
+            )
+
+    def _add_missing_columns(self) -> None:
+        """
+        # Add Missing Columns
+        The `_add_missing_columns` method adds the columns which the
+        databases of the older versions don't have.
+        """
+
+        columns = {
+            row[1] for row in self._connection.execute(
+                "PRAGMA table_info(question_stats)"
+            )
+        }
+
+        if "box" not in columns:
+            self._connection.execute(
+                "ALTER TABLE question_stats "
+                "ADD COLUMN box INTEGER NOT NULL DEFAULT 0"
+            )
+
+    def _migrate_json(self, folder: str | None) -> None:
+        """
+        # Migrate Json
+        The `_migrate_json` method imports the settings.json and
+        points.json files once. The files are left as they were. A
+        database in memory has no `folder` and nothing to import.
+        """
+
+        settings = points = None
+
+        if folder is not None:
+            settings = _read_json(os.path.join(folder, "settings.json"))
+
+            try:
+                points = _read_points_json(folder)
+            except (TypeError, ValueError):
+                points = None  # The file was broken, the points are lost
+
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+
+            if settings:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO settings VALUES (?, ?)",
+                    [(k, json.dumps(v)) for k, v in settings.items()]
+                )
+
+            if points:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?)",
+                    ("default", points["points"], points["win_streak"],
+                     points["best_win_streak"])
+                )
+
+            self._connection.execute(
+                f"PRAGMA user_version={SCHEMA_VERSION}"
+            )
+
+        if settings or points:
+            log.info(
+                "State: The settings.json and points.json files were "
+                "imported in the state.db database."
+            )
+
+    def get_settings(self) -> dict:
+        """
+        # Get Settings
+        The `get_settings` method returns the saved settings.
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value FROM settings"
+            ).fetchall()
+
+        return {key: json.loads(value) for key, value in rows}
+
+    def set_settings(self, settings: dict) -> None:
+        """
+        # Set Settings
+        The `set_settings` method saves the `settings` in one
+        transaction. The other settings don't change.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO settings VALUES (?, ?)",
+                [(k, json.dumps(v)) for k, v in settings.items()]
+            )
+
+    def get_points(self, profile: str | None = "default") -> dict | None:
+        """
+        # Get Points
+        The `get_points` method returns the points, the win streak and
+        the best win streak of the `profile`, or `None` if it has no
+        points yet.
+        """
+
+        self.flush()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT points, win_streak, best_win_streak FROM points "
+                "WHERE profile = ?", (profile,)
+            ).fetchone()
+
+        return dict(zip(EMPTY_POINTS, row)) if row else None
+
+    def set_points(
+        self, state: dict[str, int], profile: str | None = "default"
+    ) -> None:
+        """
+        # Set Points
+        The `set_points` method saves the points of the `profile`,
+        after the waiting answers, which save older points.
+        """
+
+        self.flush()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?)",
+                (profile, state["points"], state["win_streak"],
+                 state["best_win_streak"])
+            )
+
+    def record_answer(
+        self, correct: bool, state: dict[str, int],
+        profile: str | None = "default", language: str | None = None,
+        question: int | None = None, latency: float | None = 0.0
+    ) -> float:
+        """
+        # Record Answer
+        The `record_answer` method adds the answer to the history,
+        updates the statistics of the `question` and saves the new
+        points of the `profile` in one transaction.
+
+        The answer is written in the background, and the time of the
+        answer is returned at once.
+        """
+
+        answered_at = time.time()
+        self._answers.put((
+            profile, language, question, int(correct), answered_at,
+            latency or 0.0, state["points"], state["win_streak"],
+            state["best_win_streak"]
+        ))
+
+        return answered_at
+
+    def _write_answers(self) -> None:
+        """
+        # Write Answers
+        The `_write_answers` method is the loop of the writer thread. It
+        writes the waiting answers in one transaction, until `close`
+        puts `None` in the queue.
+
+        The answers which couldn't be written are kept in `_unsaved` and
+        written before the next answers. They're only lost if they still
+        can't be written when the database is closed.
+        """
+
+        while True:
+            try:
+                answers = [self._answers.get(
+                    timeout=RETRY_DELAY if self._unsaved else None
+                )]
+            except queue.Empty:
+                answers = []  # Only the unsaved answers are retried
+
+            while True:
+                try:
+                    answers.append(self._answers.get_nowait())
+                except queue.Empty:
+                    break
+
+            batch = self._unsaved + [
+                answer for answer in answers if answer is not None
+            ]
+
+            try:
+                self._write(batch)
+            except sqlite3.Error as e:
+                if not self._unsaved:
+                    log.warning(
+                        f"State: {len(batch)} answers couldn't be saved, "
+                        f"they're kept to be saved again: {e}"
+                    )
+                self._unsaved = batch
+            else:
+                if self._unsaved:
+                    log.info(
+                        f"State: {len(self._unsaved)} unsaved answers "
+                        "were saved."
+                    )
+                self._unsaved = []
+            finally:
+                for _ in answers:
+                    self._answers.task_done()
+
+            if None in answers:
+                if self._unsaved:
+                    log.error(
+                        f"State: {len(self._unsaved)} answers couldn't "
+                        "be saved before the database was closed."
+                    )
+                return
+
+    def _write(self, answers: list[tuple]) -> None:
+        if not answers:
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT INTO answers "
+                "(profile, language, question, correct, answered_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [answer[:5] for answer in answers]
+            )
+
+            # Running totals, the history is never read again
+            self._connection.executemany(
+                "INSERT INTO question_stats "
+                "VALUES (?, ?, 1, ?, ?, ?, ?) "
+                "ON CONFLICT (language, question) DO UPDATE SET "
+                "asked = asked + 1, "
+                "correct = correct + excluded.correct, "
+                "last_asked = excluded.last_asked, "
+                "latency_total = latency_total + excluded.latency_total, "
+                "box = CASE WHEN excluded.correct "
+                "THEN MIN(box + 1, ?) ELSE 0 END",
+                [
+                    (language, question, correct, answered_at, latency,
+                     correct, MAX_BOX)
+                    for _, language, question, correct, answered_at,
+                    latency, *_ in answers
+                    if question is not None and language is not None
+                ]
+            )
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?)",
+                [(answer[0], *answer[6:]) for answer in answers]
+            )
+
+    def flush(self) -> None:
+        """
+        # Flush
+        The `flush` method waits until the waiting answers are written,
+        or kept to be written again if the database failed.
+        """
+
+        self._answers.join()
+
+    def answers_count(self, profile: str | None = None) -> int:
+        """
+        # Answers Count
+        The `answers_count` method returns the number of answers of the
+        `profile`, or of every profile.
+        """
+
+        self.flush()
+
+        with self._lock:
+            if profile is None:
+                row = self._connection.execute(
+                    "SELECT COUNT(*) FROM answers"
+                ).fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT COUNT(*) FROM answers WHERE profile = ?",
+                    (profile,)
+                ).fetchone()
+
+        return row[0]
+
+    def question_stats(self, language: str) -> list[tuple]:
+        """
+        # Question Stats
+        The `question_stats` method returns the statistics of the
+        questions of the `language`: question, asked, correct, last
+        asked, latency total and Leitner box.
+        """
+
+        self.flush()
+
+        with self._lock:
+            return self._connection.execute(
+                "SELECT question, asked, correct, last_asked, "
+                "latency_total, box "
+                "FROM question_stats WHERE language = ?", (language,)
+            ).fetchall()
+
+    def close(self) -> None:
+        """
+        # Close
+        The `close` method writes the waiting answers, then the WAL into
+        the database and closes it.
+        """
+
+        if self._writer.is_alive():
+            self._answers.put(None)
+            self._writer.join()
+
+        with self._lock:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._connection.close()
@@ -0,0 +1,64 @@
+"""
+# Text Wrapper
+The `text_wrapper.py` module cuts texts into lines by words, so they
+fit in the labels and the buttons of the UI.
+
+It contains two functions:
+- `wrap_text` wraps one text.
+- `wrap_column` wraps a whole column of a database in one pass.
+"""
+
+
+def wrap_text(text: str, max_length: int) -> str:
+    """
+    # Wrap Text
+    The `wrap_text` function cuts a string into lines by words, every
+    line is at most `max_length` long except if a single word is
+    longer.
+    """
+
+    wrapped_lines = []
+    current_line = []
+    current_length = 0
+
+    for word in str(text).split(" "):
+
+        if not current_length:
+            current_line = [word]
+            current_length = len(word)
+
+        elif current_length + len(word) + 1 > max_length:
+            wrapped_lines.append(" ".join(current_line))
+            current_line = [word]
+            current_length = len(word)
+
+        else:
+            current_line.append(word)
+            current_length += len(word) + 1
+
+    if current_line:
+        wrapped_lines.append(" ".join(current_line))
+
+    return "\n".join(wrapped_lines)
+
+
+def wrap_column(texts, max_length: int) -> list[str]:
+    """
+    # Wrap Column
+    The `wrap_column` function wraps every text of a database column.
+    The same text is only wrapped once.
+    """
+
+    wrapped = {}
+    column = []
+
+    for text in texts:
+        result = wrapped.get(text)
+
+        if result is None:
+            result = wrap_text(text, max_length)
+            wrapped[text] = result
+
+        column.append(result)
+
+    return column
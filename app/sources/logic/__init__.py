@@ -3,20 +3,34 @@
 The logic folder contains files with fuctions and classes used in the
 others parts of the project.
 
+It's the Kivy front end of the engine (`sources/engine`): it creates
+the objects of the game and adds what needs Kivy or Pygame, like the
+window, the images, the music and the logs.
+
 ## Files
 This folder contains *manager* files:
-- `text_manager.py` manages labels showed on UI and their translate
-by json files.
+- `text_manager.py` contains `text_manager`, the `TextManager` of the
+game which manages labels showed on UI and their translate by json
+files.
 - `settings_manager.py` manages the settings, contains variables used in
-UI, saves and loads informations from a json file.
-- `points_manager.py` counts points, saves and loads them from a json
-file.
-- `questions_manager.py` takes questions, answers and images from
-databases and converts it to be used in UI.
+UI, saves and loads informations from the state database.
+- `points_manager.py` contains `points_manager`, the `PointsManager`
+of the game which counts points.
+- `state_store.py` contains `state_store`, the `StateStore` of the
+game which keeps the settings, the points and the answers in a SQLite
+database.
+- `questions_manager.py` takes questions and answers from the
+`QuestionBank` of the engine, adds the images and converts it to be
+used in UI.
+- `question_prefetcher.py` prepares the next questions, with their
+images decoded in the background.
+- `image_atlas.py` builds the atlases of the question images and finds
+the images in them.
+- `texture_cache.py` keeps the textures of the question images.
 - `music_manager.py` manages music playing at the background and
 sound effects.
+- `sound_loader.py` loads the sound effects in the background and caches
+their decoded samples.
 - `logs_manager.py` formats and saves logs in the logs folder, counts
 files in the logs folder and deletes old ones.
-- `resource_path` is useful for converting the project into an
-executable (.exe).
 """
@@ -0,0 +1,278 @@
+"""
+# Image Atlas
+The `image_atlas.py` module builds Kivy atlases with small versions of
+the question images and finds the images in them.
+
+The images in `resources/images` are big photos, but they are shown
+200 pixels high. The atlas contains them at this height, packed in a
+few jpg pages, so they are decoded and uploaded once.
+
+The atlases are built with Pillow from the app folder:
+```
+python -m sources.logic.image_atlas
+```
+The size of every source image is saved next to the atlas. When the
+size of an image changed since, the atlas is built again if Pillow is
+installed, otherwise the image is loaded from `resources/images` like
+the images which aren't in the atlas. Only the sizes are compared at
+launch, so an image changed without changing its size is only seen
+when the atlas is built again with the command above.
+
+An image of the atlas whose file is missing is still shown from the
+atlas, so a package can leave out the photos of `resources/images`.
+"""
+
+import os
+import json
+from typing import final
+
+from sources.engine.resource_path import resource_path
+from sources.engine.questions_pack import read_database
+from kivy.logger import Logger as log
+
+
+ATLAS_FOLDER = "resources/atlas"
+DISPLAY_HEIGHT = 200  # The height of the image in `QuestionMenu`
+PAGE_SIZE = 2048
+PADDING = 2
+
+
+def atlas_name(height: int) -> str:
+    """
+    # Atlas Name
+    The `atlas_name` function returns the name of the atlas of the
+    images resized to `height`.
+    """
+
+    return f"questions_{height}"
+
+
+def image_size(image_path: str) -> int | None:
+    """
+    # Image Size
+    The `image_size` function returns the size in bytes of an image
+    file, or `None` if it can't be read. It only reads the metadata of
+    the file, not the image.
+    """
+
+    try:
+        return os.path.getsize(image_path)
+    except OSError:
+        return None
+
+
+def build_atlas(
+    image_names: list[str], height: int,
+    page_size: int | None = PAGE_SIZE, quality: int | None = 85
+) -> str:
+    """
+    # Build Atlas
+    The `build_atlas` function resizes the images to `height` pixels
+    high, packs them in rows on jpg pages and writes the `.atlas` file
+    which Kivy reads, with a `.sources` file of the sizes of the
+    images. It returns the path of the `.atlas` file.
+
+    The id of an image in the atlas is its file name, like in
+    `images.csv`.
+    """
+
+    from PIL import Image  # Only needed to build the atlases
+
+    folder = os.path.join(
+        resource_path(os.path.dirname(ATLAS_FOLDER)),
+        os.path.basename(ATLAS_FOLDER)
+    )  # The folder may not exist yet
+    os.makedirs(folder, exist_ok=True)
+
+    pages = []  # (page image, {id: (x, y from the top, w, h)})
+    page, regions = None, {}
+    x, y = 0, 0
+    sources = {}  # The size of every image by name
+
+    for image_name in image_names:
+        image_path = resource_path(f"resources/images/{image_name}")
+
+        if not os.path.exists(image_path):
+            log.warning(
+                f"Atlas: The image <{image_name}> does not exist. "
+                "It wasn't added to the atlas."
+            )
+            continue
+
+        with Image.open(image_path) as image:
+            scale = min(1, height / image.height)
+            size = (
+                min(page_size, max(1, round(image.width * scale))),
+                max(1, round(image.height * scale))
+            )
+            resized = image.convert("RGB").resize(size, Image.LANCZOS)
+
+        if x + size[0] > page_size:
+            x, y = 0, y + height + PADDING
+
+        if page is None or y + height > page_size:
+            page = Image.new("RGB", (page_size, page_size))
+            regions = {}
+            pages.append((page, regions))
+            x, y = 0, 0
+
+        page.paste(resized, (x, y))
+        regions[image_name] = (x, y, *size)
+        sources[image_name] = image_size(image_path)
+        x += size[0] + PADDING
+
+    name = atlas_name(height)
+    atlas = {}
+
+    for i, (page, regions) in enumerate(pages):
+        used_height = max(y + h for _, y, _, h in regions.values())
+        page_name = f"{name}-{i}.jpg"
+
+        page.crop((0, 0, page_size, used_height)).save(
+            os.path.join(folder, page_name), quality=quality, optimize=True
+        )
+
+        # Kivy atlases count y from the bottom of the page
+        atlas[page_name] = {
+            uid: [x, used_height - y - h, w, h]
+            for uid, (x, y, w, h) in regions.items()
+        }
+
+    atlas_path = os.path.join(folder, f"{name}.atlas")
+    with open(atlas_path, "w", encoding="UTF-8") as f:
+        json.dump(atlas, f, indent=1)
+
+    # Kivy reads every key of the `.atlas` as a page, so it's apart
+    with open(
+        os.path.join(folder, f"{name}.sources"), "w", encoding="UTF-8"
+    ) as f:
+        json.dump(sources, f, indent=1, sort_keys=True)
+
+    log.info(
+        f"Atlas: <{name}.atlas> was built with {len(pages)} pages."
+    )
+    return atlas_path
+
+
+def build_images_atlas(height: int | None = DISPLAY_HEIGHT) -> str:
+    """
+    # Build Images Atlas
+    The `build_images_atlas` function builds the atlas of the images of
+    `images.csv` and returns the path of its `.atlas` file.
+    """
+
+    rows = read_database(resource_path("resources/databases/images.csv"))
+    image_names = sorted({row[0] for row in rows if row and row[0]})
+
+    return build_atlas(image_names, height)
+
+
+@final
+class ImageAtlas():
+    """
+    # Image Atlas
+    The `ImageAtlas` class reads the `.atlas` file of the images shown
+    `display_height` pixels high, and gives the `atlas://` url of the
+    images it contains.
+
+    It only reads the json files: the pages are loaded by Kivy when
+    an image of the atlas is shown for the first time.
+
+    It contains only one method - `resolve`, which returns the url of
+    an image.
+    """
+
+    def __init__(self, display_height: int | None = DISPLAY_HEIGHT) -> None:
+        self.height = display_height
+        self.ids = set()
+        self.url = ""
+
+        name = atlas_name(display_height)
+        atlas_path = resource_path(f"{ATLAS_FOLDER}/{name}.atlas")
+
+        if not os.path.exists(atlas_path):
+            log.info(f"Atlas: There is no <{name}.atlas>.")
+            return
+
+        stale = self._read(atlas_path)
+
+        if stale:
+            try:
+                import PIL  # noqa: F401
+            except ImportError:
+                log.warning(
+                    f"Atlas: The images <{', '.join(sorted(stale))}> "
+                    f"changed since <{name}.atlas> was built. They are "
+                    "loaded from their files."
+                )
+                self.ids -= stale
+            else:
+                log.warning(
+                    f"Atlas: {len(stale)} images changed since "
+                    f"<{name}.atlas> was built. It's built again."
+                )
+                self.ids.clear()
+                self._read(build_images_atlas(display_height))
+
+        self.url = "atlas://" + os.path.splitext(atlas_path)[0]
+        log.info(f"Atlas: The question images are read from <{name}.atlas>.")
+
+    def _read(self, atlas_path: str) -> set[str]:
+        """
+        # Read
+        The `_read` method adds the ids of the `.atlas` file and returns
+        the ones whose image changed size since the atlas was built. An
+        image without file or without saved size isn't checked.
+        """
+
+        with open(atlas_path, "r", encoding="UTF-8") as f:
+            for regions in json.load(f).values():
+                self.ids.update(regions)
+
+        sources_path = os.path.splitext(atlas_path)[0] + ".sources"
+
+        try:
+            with open(sources_path, "r", encoding="UTF-8") as f:
+                sources = json.load(f)
+        except (OSError, ValueError):
+            return set()
+
+        stale = set()
+
+        for image_name in self.ids:
+            image_path = resource_path(f"resources/images/{image_name}")
+
+            size = image_size(image_path)
+
+            if size is not None and sources.get(image_name, size) != size:
+                stale.add(image_name)
+
+        return stale
+
+    def resolve(self, image_name: str) -> str | None:
+        """
+        # Resolve
+        The `resolve` method returns the `atlas://` url of the image
+        called `image_name` in `images.csv`, or `None` if it isn't in
+        the atlas.
+        """
+
+        if image_name in self.ids:
+            return f"{self.url}/{image_name}"
+
+        return None
+
+
+image_atlas = ImageAtlas()
+"""
+# Image Atlas
+`image_atlas` is an object of the `ImageAtlas` class which gives the
+`atlas://` url of the question images shown 200 pixels high.
+
+It contains only one method - `resolve`, which returns the url of
+an image.
+"""
+
+
+if __name__ == "__main__":
+    build_images_atlas()
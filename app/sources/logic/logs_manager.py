@@ -7,32 +7,149 @@ logs folder and deletes old ones.
 """
 
 import os
-from logging import NOTSET, FileHandler
+import queue
+from logging import NOTSET, WARNING, FileHandler, LogRecord
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import final
 
 from kivy.logger import Logger as log
 from kivy.logger import KivyFormatter
 
-from sources.logic.resource_path import resource_path
+from sources.engine.resource_path import resource_path
+
+
+QUEUE_SIZE = 10_000  # Records waiting to be written
+BATCH_SIZE = 256  # Records written in one write
+OVERFLOW_POLICIES = ("drop", "block", "sample")
+SAMPLE_RATE = 10  # With "sample", 1 info record of 10 is kept
+SAMPLE_THRESHOLD = 0.5  # With "sample", sampling when half full
+
+
+@final
+class BoundedQueueHandler(QueueHandler):
+    """
+    # Bounded Queue Handler
+    The `BoundedQueueHandler` class puts the records in a bounded
+    queue, so logging on the UI thread never writes into the file.
+
+    When the queue is full, the `overflow` policy decides:
+    - "drop" drops the new record.
+    - "block" waits until there is room.
+    - "sample" keeps 1 record of `SAMPLE_RATE` below the warnings once
+    the queue is `SAMPLE_THRESHOLD` full, and drops when it's full.
+
+    The dropped records are counted in `dropped`.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue, overflow: str | None = "drop"
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self._sampled = 0
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """
+        # Prepare
+        The `prepare` method keeps the records without arguments as
+        they are, so they are only formatted by the writer thread. The
+        messages of this project are already formatted f-strings.
+        """
+
+        if not record.args and record.exc_info is None:
+            return record
+        return super().prepare(record)
+
+    def enqueue(self, record: LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+
+        if (
+            self.overflow == "sample" and record.levelno < WARNING
+            and self.queue.qsize() >= self.queue.maxsize * SAMPLE_THRESHOLD
+        ):
+            self._sampled += 1
+            if self._sampled % SAMPLE_RATE:
+                self.dropped += 1
+                return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+@final
+class BatchFileHandler(FileHandler):
+    """
+    # Batch File Handler
+    The `BatchFileHandler` class is the file handler of the
+    `QueueListener`. It keeps the formatted records and writes them
+    together when `BATCH_SIZE` records are waiting or when the queue is
+    empty.
+    """
+
+    def __init__(self, file_path: str, log_queue: queue.Queue) -> None:
+        super().__init__(file_path, mode="a", encoding="UTF-8")
+        self.log_queue = log_queue
+        self.batch = []
+        self.writes = 0
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            self.batch.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+        if len(self.batch) >= BATCH_SIZE or self.log_queue.empty():
+            self.write_batch()
+
+    def write_batch(self) -> None:
+        if not self.batch:
+            return
+
+        with self.lock:
+            self.stream.write("".join(self.batch))
+            self.stream.flush()
+            self.batch.clear()
+            self.writes += 1
+
+    def close(self) -> None:
+        self.write_batch()
+        super().close()
 
 
 @final
 class LogsManager():
     """
     # Logs Manager
-    The `LogsManager` class contains two mathods:
+    The `LogsManager` class contains these mathods:
     - `specify_logging` specifies the logs saving.
     - `delete_old_logs` deletes old logs if the files count is bigger
     than the `max_files`.
+    - `flush` writes the waiting records and stops the background
+    writer.
+
+    The records are written by a `QueueListener` thread, so logging
+    doesn't write into the file on the UI thread. `overflow` is the
+    policy of the `BoundedQueueHandler` when the queue is full.
     """
 
     def __init__(
         self, logs_folder: str | None = "logs/",
-        max_files: int | None = 10
+        max_files: int | None = 10, overflow: str | None = "drop"
     ) -> None:
 
-        self.handler = None  # It'll be a `FileHandler`
+        self.handler = None  # It'll be a `BatchFileHandler`
+        self.queue_handler = None  # It'll be a `BoundedQueueHandler`
+        self.listener = None
+        self.overflow = overflow
 
         self.logs_folder = resource_path(logs_folder)
         self.filename = ""
@@ -70,15 +187,50 @@ class LogsManager():
             self.logs_folder + "/" + self.filename
         )
 
-        self.handler = FileHandler(self.file_path, mode="a")
+        log_queue = queue.Queue(QUEUE_SIZE)
+
+        self.handler = BatchFileHandler(self.file_path, log_queue)
         self.handler.setLevel(NOTSET)
         self.handler.setFormatter(self.custom_formatting)
 
+        self.queue_handler = BoundedQueueHandler(log_queue, self.overflow)
+        self.queue_handler.setLevel(NOTSET)
+
+        self.listener = QueueListener(log_queue, self.handler)
+        self.listener.start()
+
         log.info(
             "Logs: Record log in "
             f"<{self.logs_folder}/{self.filename}>"
         )
 
+        log.addHandler(self.queue_handler)
+
+    def dropped(self) -> int:
+        return self.queue_handler.dropped if self.queue_handler else 0
+
+    def flush(self) -> None:
+        """
+        # Flush
+        The `flush` method writes every waiting record and stops the
+        background writer. The next records, for example when the app
+        closes, are written directly into the file.
+        """
+
+        if self.listener is None:
+            return
+
+        if self.dropped():
+            log.warning(
+                f"Logs: {self.dropped()} records were dropped because "
+                "the logs queue was full."
+            )
+
+        log.removeHandler(self.queue_handler)
+        self.listener.stop()  # Waits until the queue is written
+        self.listener = None
+
+        self.handler.write_batch()
         log.addHandler(self.handler)
 
     def delete_old_logs(self, max_files: int | None = None) -> None:
@@ -110,8 +262,10 @@ logs_manager = LogsManager()
 """
 # Logs Manager
 `logs_manager` is an object of the `LogsManager` class which
-contains two mathods:
+contains these mathods:
 - `specify_logging` specifies the logs saving.
 - `delete_old_logs` deletes old logs if the files count is bigger
 than the `max_files`
+- `flush` writes the waiting records and stops the background
+writer.
 """
@@ -10,10 +10,14 @@ import pygame
 from random import shuffle
 from typing import final, Optional
 
-from sources.logic.resource_path import resource_path
+from sources.engine.resource_path import resource_path
+from sources.logic.sound_loader import SoundLoader
 from kivy.logger import Logger as log
 
 
+SONG_CHECK_INTERVAL = 1  # Seconds between two `check_song` calls
+
+
 @final
 class MusicManager():
     """
@@ -28,6 +32,10 @@ class MusicManager():
     the next song in the list.
     - `next_song` plays the next song without waiting for the end of
     the previous song.
+    - `set_volumes` changes the volumes when they changed.
+
+    The sound effects are `LazySound` handles, loaded in the background
+    by a `SoundLoader`.
 
     The difference with the `MusicManager` class is that it uses
     Pygame, so that's useful for converting to .exe with PyInstaller
@@ -46,16 +54,19 @@ class MusicManager():
 
         self.remaining_songs = []
         self.current_song = None
+        self.volumes = None  # The music and sounds volumes which are set
 
         self.songs_list = self._load_music_files("resources/music")
 
-        self.transition = pygame.mixer.Sound(
-            resource_path("resources/sounds/transition.mp3"))
-        self.button_clicked = pygame.mixer.Sound(
+        # Loaded in the background, `play` waits only if it's too early
+        self.sound_loader = SoundLoader()
+        self.button_clicked = self.sound_loader.load(
             resource_path("resources/sounds/8bit-click.wav"))
-        self.win = pygame.mixer.Sound(
+        self.transition = self.sound_loader.load(
+            resource_path("resources/sounds/transition.mp3"))
+        self.win = self.sound_loader.load(
             resource_path("resources/sounds/win.mp3"))
-        self.lose = pygame.mixer.Sound(
+        self.lose = self.sound_loader.load(
             resource_path("resources/sounds/lose.wav"))
 
         self.randomize_song()
@@ -130,8 +141,12 @@ class MusicManager():
         """
         # Set Volumes
         The `set_volumes` method adjusts the volume for music and
-        sound effects.
+        sound effects. Nothing is done if they didn't change.
         """
+        if self.volumes == (music_volume, sounds_volume):
+            return
+
+        self.volumes = (music_volume, sounds_volume)
         pygame.mixer.music.set_volume(music_volume)
         self.transition.set_volume(sounds_volume)
         self.button_clicked.set_volume(sounds_volume)
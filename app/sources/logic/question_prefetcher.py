@@ -0,0 +1,217 @@
+"""
+# Question Prefetcher
+The `question_prefetcher.py` module only contains the
+`QuestionPrefetcher` class.
+
+It prepares the next questions while the player reads the result
+screen: the questions are drawn on the UI thread and their images are
+decoded on a background thread, so the question screen only has to
+show them.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import final, NamedTuple
+
+from kivy.core.image import ImageLoader
+from kivy.logger import Logger as log
+
+from sources.logic.questions_manager import questions_manager
+from sources.logic.settings_manager import settings_manager
+from sources.logic.text_manager import text_manager as txt
+from sources.logic.texture_cache import texture_cache
+
+
+DEPTH = 2  # The questions prepared ahead
+
+
+class PreparedQuestion(NamedTuple):
+    """
+    # Prepared Question
+    The `PreparedQuestion` tuple contains everything the question
+    screen needs to show a question.
+
+    `image_data` is the decoded image, its texture is only created
+    when it's shown. It's `None` if there is no image, if the images
+    aren't drawn, if the image is in the atlas or if the texture of the
+    image is already cached.
+    """
+
+    question: str
+    true_answer: str
+    wrong_answer1: str
+    wrong_answer2: str
+    wrong_answer3: str
+    image_path: str
+    image_data: object
+    quest_numb: int
+    key: tuple
+
+
+@final
+class QuestionPrefetcher():
+    """
+    # Question Prefetcher
+    The `QuestionPrefetcher` class keeps a queue of `depth` questions
+    prepared ahead.
+
+    The questions are drawn on the UI thread after the answer to the
+    previous one, so the randomizing styles and their statistics are
+    only used by the UI thread. Only the decoding of their images is
+    done in the background, one image after another.
+
+    The prepared questions are only used if the language, the
+    randomizing style and the images setting didn't change since they
+    were prepared. Otherwise they're given back to their randomizing
+    style from the last one, so no question is skipped.
+
+    It contains these methods:
+    - `prepare_next` fills the queue of prepared questions.
+    - `next_question` returns the first prepared question.
+    - `clear` gives back the prepared questions.
+    - `stats` returns the queue depth and the hit / miss counters.
+    """
+
+    def __init__(self, depth: int | None = DEPTH) -> None:
+        if depth < 1:
+            raise ValueError("At least one question must be prepared.")
+
+        self.depth = depth
+        self.hits = 0  # The question was ready
+        self.misses = 0  # The question was prepared when it was shown
+
+        # The drawn questions, their `_key` and the `Future` of their
+        # decoded image
+        self._queue = deque()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="QuestionPrefetcher"
+        )
+
+    def _key(self) -> tuple:
+        return (
+            txt.current_language, settings_manager.randomizing_style,
+            settings_manager.drawing_images
+        )
+
+    def _decode(self, image_path: str) -> object:
+        """
+        # Decode
+        The `_decode` method returns the decoded image of the question,
+        or `None` if it isn't needed or can't be decoded.
+        """
+
+        if (
+            not image_path
+            or not settings_manager.drawing_images
+            or image_path.startswith("atlas://")
+            or texture_cache.contains(image_path)
+        ):
+            return None
+
+        try:
+            return ImageLoader.load(image_path, keep_data=True)
+        except Exception as e:
+            log.error(
+                f"Prefetcher: The image <{image_path}> couldn't "
+                f"be decoded: {e}"
+            )
+            return None
+
+    def _draw(self) -> tuple[int, tuple, tuple]:
+        quest_numb = questions_manager.draw_quest()
+        key = self._key()  # The language is the one of the drawing
+        return quest_numb, questions_manager.extract_quest(quest_numb), key
+
+    def _submit(self, image_path: str) -> Future:
+        future = Future()
+        try:
+            future = self._executor.submit(self._decode, image_path)
+        except RuntimeError:  # The app is stopping
+            future.set_result(None)
+        return future
+
+    def prepare_next(self) -> None:
+        """
+        # Prepare Next
+        The `prepare_next` method draws questions until `depth`
+        questions are prepared and starts decoding their images in the
+        background. It's called on the UI thread once the previous
+        answer is saved.
+        """
+
+        if self._queue and self._queue[0][2] != self._key():
+            self.clear()
+
+        while len(self._queue) < self.depth:
+            quest_numb, extracted, key = self._draw()
+            self._queue.append(
+                (quest_numb, extracted, key, self._submit(extracted[5]))
+            )
+
+    def next_question(self) -> PreparedQuestion:
+        """
+        # Next Question
+        The `next_question` method makes the first prepared question
+        the asked question and returns it. If no valid question is
+        ready, the question is prepared right now.
+        """
+
+        if self._queue and self._queue[0][2] == self._key():
+            self.hits += 1
+            quest_numb, extracted, key, image = self._queue.popleft()
+            image_data = image.result()  # Already decoded, usually
+        else:
+            self.misses += 1
+            self.clear()
+            quest_numb, extracted, key = self._draw()
+            image_data = self._decode(extracted[5])
+
+        questions_manager.show_quest(quest_numb, extracted)
+
+        return PreparedQuestion(*extracted, image_data, quest_numb, key)
+
+    def clear(self) -> None:
+        """
+        # Clear
+        The `clear` method gives back the prepared questions to their
+        randomizing style, from the last one, for example when the
+        settings changed.
+        """
+
+        while self._queue:
+            quest_numb, _, (language, style_name, _), image = (
+                self._queue.pop()
+            )
+            questions_manager.put_back_quest(
+                language, style_name, quest_numb
+            )
+            image.cancel()
+
+    def stats(self) -> dict[str, int]:
+        """
+        # Stats
+        The `stats` method returns the queue depth, how many questions
+        are ready, the hits and the misses.
+        """
+
+        return {
+            "depth": self.depth,
+            "ready": len(self._queue),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+question_prefetcher = QuestionPrefetcher()
+"""
+# Question Prefetcher
+`question_prefetcher` is an object of the `QuestionPrefetcher` class
+which prepares the next `DEPTH` questions, with their images decoded
+on a background thread.
+
+It contains these methods:
+- `prepare_next` fills the queue of prepared questions.
+- `next_question` returns the first prepared question.
+- `clear` gives back the prepared questions.
+- `stats` returns the queue depth and the hit / miss counters.
+"""
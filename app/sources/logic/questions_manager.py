@@ -7,12 +7,17 @@ It takes questions, answers and images from databases and converts
 it to be used in UI.
 """
 
-import os
-import pandas as pd
-from random import randint, shuffle
+from random import randrange
 from typing import final
 
-from sources.logic.resource_path import resource_path
+from sources.engine.resource_path import resource_path, resource_exists
+from sources.engine.questions_pack import load_pack
+from sources.engine.question_bank import QuestionBank
+from sources.engine.text_wrapper import wrap_text
+from sources.engine.glyphs import replace_glyphs
+from sources.engine.bag_store import BagStore
+from sources.logic.state_store import state_store
+from sources.logic.image_atlas import image_atlas
 from kivy.logger import Logger as log
 
 from sources.logic.text_manager import text_manager as txt
@@ -25,12 +30,19 @@ class QuestionsManager():
     The `QuestionsManager` class reads databases, randomizes
     questions and returns the question, answers and image.
 
-    It contains only one method - `rand_quest` which does
-    all of this.
+    The `rand_quest` method does all of this. The question screen
+    uses its steps through the `QuestionPrefetcher`:
+    - `draw_quest` draws the number of the next question.
+    - `extract_quest` reads a question and chooses its image.
+    - `show_quest` makes a question the asked question.
+    - `put_back_quest` gives back a question which wasn't asked.
 
     It takes one argument : images_ordered which is bool.
     If it's true it'll assocate images with question, if it isn't,
     it'll take random images every time.
+
+    The questions are chosen by the `QuestionBank` of the engine, this
+    class adds the images and the settings of the game.
     """
 
     def __init__(self, images_ordered: bool | None = False) -> None:
@@ -46,13 +58,13 @@ class QuestionsManager():
         self.status = False
         self.current_language = ""
         self.images_ordered = images_ordered
-        self.question_numbers = []
+        self.bag_store = BagStore()
+        self.bank = None  # The `QuestionBank` of the current language
 
         self.csv_img = resource_path("resources/databases/images.csv")
-        self.df_img = pd.read_csv(self.csv_img)
-        self.quest_count_images = len(self.df_img) - 1
-
-        self.csv_name = ""
+        self.images_pack = load_pack(self.csv_img)
+        self.quest_count_images = len(self.images_pack)
+        self.image_paths = self._resolve_images()
 
     def _replace_ukrainian(
         self, text_input: str | None = "There's no text"
@@ -65,13 +77,43 @@ class QuestionsManager():
         supported by the fonts) or standad cyrillic (russian) letters.
         """
 
-        text = text_input
-        str(text_input)
-        text = text.replace("ї", "ï").replace("і", "i")
-        text = text.replace("Ї", "Ï").replace("І", "I")
-        text = text.replace("Є", "Е").replace("є", "е")
-        text = text.replace("Ґ", "г").replace("ґ", "г")
-        return text
+        return replace_glyphs(text_input)
+
+    def _resolve_images(self) -> dict[str, str]:
+        """
+        # Resolve Images
+        The `_resolve_images` method finds every image of `images.csv`
+        once, in the atlas or in `resources/images`, and returns their
+        paths by name. A missing image has an empty path and is only
+        reported here.
+        """
+
+        image_paths = {}
+        missing = []
+
+        for row in range(self.quest_count_images):
+            name = self.images_pack.cell(row, 0)
+
+            if not name or name in image_paths:
+                continue
+
+            atlas_url = image_atlas.resolve(name)
+
+            if atlas_url:
+                image_paths[name] = atlas_url
+            elif resource_exists(f"resources/images/{name}"):
+                image_paths[name] = resource_path(f"resources/images/{name}")
+            else:
+                image_paths[name] = ""
+                missing.append(name)
+
+        if missing:
+            log.error(
+                f"The images <{', '.join(missing)}> do not exist! "
+                "Their questions will be shown without image."
+            )
+
+        return image_paths
 
     def _change_the_language(self) -> None:
         """
@@ -82,24 +124,13 @@ class QuestionsManager():
         If nothing has changed it doesn't do anything.
         """
 
-        self.csv_name = resource_path(
-            f"resources/databases/{self.current_language}.csv"
-        )
-
-        self.df = pd.read_csv(self.csv_name)
-        self.quest_count = len(self.df) - 1
-
-        self.question_numbers = []
-
-        for i in range(self.quest_count):
-            self.question_numbers.append(i)
-
-        self.question_numbers_randomized = \
-            self.question_numbers.copy()
-
-        shuffle(self.question_numbers_randomized)
+        if self.bank is not None:
+            self.bank.close()
 
-        self.question_numbers = [-1] + self.question_numbers
+        self.bank = QuestionBank(
+            self.current_language, state_store, self.bag_store
+        )
+        self.quest_count = len(self.bank)
 
     def _format_text(self, text_input, max_length) -> str:
         """
@@ -107,71 +138,33 @@ class QuestionsManager():
         The `_format_text` method is used to cut a string into parts
         by words with a min lengh that's given in the 2nd argument:
         `max_lengh`.
-        """
 
-        text = str(text_input)
+        The questions of the databases are already formatted in their
+        packs, so it's only used for other texts.
+        """
 
-        text = self._replace_ukrainian(text)
+        text = self._replace_ukrainian(text_input)
         # Because fonts don't support ukrainian translation
 
-        try:
-            words = text.split(" ")
-        except Exception:
-            log.info(
-                f"Questions: In <{text}> there no spaces. "
-                "Can not split this text."
-            )
-            return text
-
-        wrapped_lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-
-            if current_length > 0:
-                the_space_count = 1
-
-            else:
-                the_space_count = 0
-
-            line_length = current_length + \
-                len(word) + the_space_count
+        return wrap_text(text, max_length)
 
-            if line_length > max_length:
-                wrapped_lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
-
-            else:
-                if current_length > 0:
-                    current_line.append(word)
-                    the_space_count = 1
-                else:
-                    current_line = [word]
-                    the_space_count = 0
-
-                current_length += len(word) + the_space_count
-
-        if current_line:
-            wrapped_lines.append(" ".join(current_line))
-
-        return "\n".join(wrapped_lines)
-
-    def _extract_quest(self) -> tuple[str, str, str, str, str, str]:
+    def extract_quest(
+        self, quest_numb: int
+    ) -> tuple[str, str, str, str, str, str]:
         """
         # Extract Question
-        The `_extract_quest` method is used to extract the asked
-        question (question, answers and image) from the database.
+        The `extract_quest` method is used to extract a question
+        (question, answers and image) from the database. It doesn't
+        change the asked question.
         """
 
+        image = ""
+
         # Image Extraction
         if self.images_ordered:
             try:
-                self.image = self.df_img.iloc[
-                    self.quest_numb, 0
-                ]
-            except Exception:
+                image = self.images_pack.cell(quest_numb, 0)
+            except IndexError:
                 log.error(
                     "There is not enough of images to "
                     "have an image per question!\n"
@@ -181,88 +174,112 @@ class QuestionsManager():
                 )
 
         else:
-            self.image = self.df_img.iloc[
-                randint(0, self.quest_count_images), 0
-            ]
-
-        self.image = resource_path(f"resources/images/{self.image}")
-
-        if not os.path.exists(self.image) and self.enough_images:
-            log.error(
-                f"The image path <{self.image}> does not exist!"
+            image = self.images_pack.cell(
+                randrange(self.quest_count_images), 0
             )
 
-            self.image = ""
+        # The missing images were already reported
+        image = self.image_paths.get(image, "")
+
+        # Question and answers extraction, already formatted in the pack
+        question, *answers = self.bank.question(quest_numb)
 
-        # Question Extraction
-        self.question = self._format_text(
-            self.df.iloc[self.quest_numb, 0], 35
-        ) + "\n\n\n\n\n"  # Костыли
+        question += "\n\n\n\n\n"  # Костыли
         # It's there because Kivy refuses to move up the question.
         # So, it moves the question a little bit upper.
 
-        # Answers Extraction
-        self.true_answer = self.df.iloc[self.quest_numb, 1]
-        self.wrong_answer1 = self.df.iloc[self.quest_numb, 2]
-        self.wrong_answer2 = self.df.iloc[self.quest_numb, 3]
-        self.wrong_answer3 = self.df.iloc[self.quest_numb, 4]
+        return (question, *answers, image)
 
-        for i in (
-            self.true_answer, self.wrong_answer1,
-            self.wrong_answer2, self.wrong_answer3
-        ):
-            self._format_text(i, 20)
+    def show_quest(
+        self, quest_numb: int,
+        extracted: tuple[str, str, str, str, str, str]
+    ) -> tuple[str, str, str, str, str, str]:
+        """
+        # Show Question
+        The `show_quest` method makes the `extracted` question number
+        `quest_numb` the asked question.
+        """
 
-        return (
-            self.question, self.true_answer,
-            self.wrong_answer1, self.wrong_answer2,
-            self.wrong_answer3, self.image
+        self.quest_numb = quest_numb
+        (
+            self.question, self.true_answer, self.wrong_answer1,
+            self.wrong_answer2, self.wrong_answer3, self.image
+        ) = extracted
+
+        log.info(
+            f"Questions: The <{quest_numb + 1} / "
+            f"{self.quest_count}> question is asked."
         )
 
-    def rand_quest(
-        self
-    ) -> tuple[str, str, str, str, str, str]:
-        """
-        # Randomize Question
-        The `rand_quest` method is used to randomize the number of the
-        question which is saved in the variable `quest_numb`.
+        return extracted
+
+    def save_data(self, wait: bool | None = False) -> None:
         """
+        # Save Data
+        The `save_data` method saves the state of the persistent
+        randomizing styles, for example the remaining questions of the
+        "normal" style, in the background.
 
-        if txt.current_language != self.current_language:
-            self.current_language = txt.current_language
-            self._change_the_language()
+        When `wait` is `True`, it waits until the files are written.
+        """
 
-        if settings_manager.randomizing_style == "normal":
-            if len(self.question_numbers_randomized) == 0:
-                for i in range(self.quest_count):
-                    self.question_numbers_randomized.append(i)
+        if self.bank is not None:
+            self.bank.save(wait)
 
-                shuffle(self.question_numbers_randomized)
+    def observe_answer(
+        self, language: str, question: int | None, correct: bool,
+        latency: float, answered_at: float | None = None
+    ) -> None:
+        """
+        # Observe Answer
+        The `observe_answer` method adds an answer to the statistics of
+        the questions kept in memory. The database is updated by the
+        `PointsManager`, `answered_at` is the time it saved.
+        """
 
-            self.quest_numb = self.question_numbers_randomized[0]
+        if (
+            question is not None and self.bank is not None
+            and language == self.bank.language
+        ):
+            self.bank.observe(question, correct, latency, answered_at)
 
-            self.question_numbers_randomized.pop(0)
+    def draw_quest(self) -> int:
+        """
+        # Draw Question
+        The `draw_quest` method draws the number of the next question
+        with the randomizing style of the settings, in the current
+        language.
+        """
 
-        elif settings_manager.randomizing_style == "alternative":
-            self.quest_numb = randint(
-                0, self.quest_count
-            )
+        if txt.current_language != self.current_language:
+            self.current_language = txt.current_language
+            self._change_the_language()
 
-        elif settings_manager.randomizing_style == "in_order":
-            if len(self.question_numbers) == 0:
-                for i in range(self.quest_count):
-                    self.question_numbers.append(i)
+        return self.bank.draw(settings_manager.randomizing_style)
 
-            self.quest_numb = self.question_numbers[0]
+    def put_back_quest(
+        self, language: str, style_name: str, quest_numb: int
+    ) -> None:
+        """
+        # Put Back Question
+        The `put_back_quest` method gives back a question drawn but not
+        asked, so the randomizing style doesn't skip it.
+        """
 
-            self.question_numbers.pop(0)
+        if self.bank is not None and language == self.bank.language:
+            self.bank.put_back(style_name, quest_numb)
 
-        log.info(
-            f"Questions: The <{self.quest_numb + 1} / "
-            f"{self.quest_count + 1}> question is asked."
-        )
+    def rand_quest(
+        self
+    ) -> tuple[str, str, str, str, str, str]:
+        """
+        # Randomize Question
+        The `rand_quest` method is used to randomize the number of the
+        question which is saved in the variable `quest_numb`.
+        """
 
-        return self._extract_quest()
+        quest_numb = self.draw_quest()
+        return self.show_quest(quest_numb, self.extract_quest(quest_numb))
 
 
 questions_manager = QuestionsManager(images_ordered=True)
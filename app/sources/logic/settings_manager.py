@@ -3,16 +3,17 @@
 The `settings_manager.pymodule only contains `SettingsManager` class.
 
 It manages, contains settings variables used in UI, saves and loads
-informations from a json file.
+informations from the state database.
 """
 
-import os
-import json
+import sqlite3
 from typing import final
 
 from kivy.core.window import Window
+from kivy.clock import Clock
 
-from sources.logic.resource_path import resource_path
+from sources.logic.state_store import state_store
+from sources.engine.randomizing_styles import STYLES
 from kivy.logger import Logger as log
 
 from sources.logic.text_manager import text_manager as txt
@@ -23,18 +24,25 @@ from sources.ui.colors import LIGHT_VIOLET, DARK_VIOLET, CYAN, GREY, DARK_GREY
 from sources.ui.colors import BLACK
 
 
+SAVE_DELAY = 1  # Seconds, the changes made in this time are saved once
+
+
 @final
 class SettingsManager():
     """
     # Settings Manager
     The `SettingManager` class manages the settings, contains
-    variables used in UI, saves and loads informations from a json
-    file.
+    variables used in UI, saves and loads informations from the
+    state database.
+
+    The changed settings are only written once per `SAVE_DELAY`, or
+    when the app stops, and `disk_writes` counts the real writes.
 
     It contains these methods:
-    - `save_data` saves data in the settings.json file.
-    - `import_data` imports data from the settings.json file.
-    - `clear_data` clears the settings.json file.
+    - `save_data` saves the changed settings in the database.
+    - `dirty_fields` returns the settings which aren't saved yet.
+    - `import_data` imports data from the database.
+    - `clear_data` resets the settings.
     - `color_change` changes the color of the app's menus.
     """
 
@@ -48,9 +56,13 @@ class SettingsManager():
         self.main_color = LIGHT_BLUE
         self.bg_color = DARK_BLUE
 
-        self.RANDOMIZING_STYLES = [
-            "normal", "alternative", "in_order"
-        ]
+        self.disk_writes = 0
+        self._saved_data = {}  # The data which is in the database
+        self._save_trigger = Clock.create_trigger(
+            lambda dt: self.save_data(wait=True), SAVE_DELAY
+        )
+
+        self.RANDOMIZING_STYLES = list(STYLES)
 
         self.COLORS = [
             "blue", "orange",
@@ -59,67 +71,100 @@ class SettingsManager():
             "grey", "black"
         ]
 
-        if not os.path.exists(resource_path("sources/json/")):
-            os.makedirs(resource_path("sources/json/"))
-            log.info(
-                "Settings: The sources/json/ folder does not exist. "
-                "A new sources/json/ folder was created"
-            )
+        self.import_data()
 
-        self.JSON_PATH = resource_path("sources/json/settings.json")
+    def _data(self) -> dict:
+        return {
+            "music_volume": self.music_volume,
+            "sounds_volume": self.sounds_volume,
+            "language": txt.current_language,
+            "menus_color": self.menus_color,
+            "drawing_images": self.drawing_images,
+            "randomizing_style": self.randomizing_style,
+            "rainbow_buttons": self.rainbow_buttons
+        }
+
+    def dirty_fields(self) -> list[str]:
+        """
+        # Dirty Fields
+        The `dirty_fields` method returns the names of the settings
+        which changed since they were saved.
+        """
 
-        if not os.path.exists(self.JSON_PATH):
-            self.clear_data()
-            log.info(
-                "Settings: The sources/json/settings.json file "
-                "does not exist. The new one was created."
-            )
-        self.import_data()
+        return [
+            key for key, value in self._data().items()
+            if self._saved_data.get(key) != value
+        ]
 
-    def save_data(self) -> None:
+    def save_data(self, wait: bool | None = False) -> None:
         """
         # Save Data
-        The `save_data` method saves data in the settings.json file.
+        The `save_data` method saves the changed settings in the
+        database.
+
+        They are written `SAVE_DELAY` seconds later, with every change
+        made meanwhile. When `wait` is `True`, they're written now.
+        Nothing is written if no setting changed.
         """
 
-        with open(self.JSON_PATH, "w", encoding="UTF-8") as f:
-            json.dump({
-                "music_volume": self.music_volume,
-                "sounds_volume": self.sounds_volume,
-                "language": txt.current_language,
-                "menus_color": self.menus_color,
-                "drawing_images": self.drawing_images,
-                "randomizing_style": self.randomizing_style,
-                "rainbow_buttons": self.rainbow_buttons
-            }, f)
+        if not wait:
+            self._save_trigger()
+            return
+
+        self._save_trigger.cancel()
+        dirty_fields = self.dirty_fields()
+
+        if not dirty_fields:
+            return
+
+        data = self._data()
+
+        try:
+            state_store.set_settings(
+                {key: data[key] for key in dirty_fields}
+            )
+        except sqlite3.Error as e:
+            log.error(f"Settings: The settings weren't saved: {e}")
+            return
+
+        self._saved_data = data
+        self.disk_writes += 1
         log.info(
-            "Settings: Data has been saved in the settings.json file."
+            f"Settings: Data has been saved in the database "
+            f"({', '.join(dirty_fields)} changed, "
+            f"{self.disk_writes} writes in this session)."
         )
 
     def import_data(self) -> None:
         """
         # Import Data
-        The `mport_data` method imports data from the settings.json file.
+        The `mport_data` method imports data from the database.
         """
 
         try:
-            with open(self.JSON_PATH, "r", encoding="UTF-8") as f:
-                data = json.load(f)
-                self.music_volume = data.get("music_volume", 0.5)
-                self.sounds_volume = data.get("sounds_volume", 0.25)
-                self.current_language = data.get("language", None)
-                self.menus_color = data.get("menus_color", "blue")
-                self.drawing_images = data.get("drawing_images", True)
-                self.randomizing_style = data.get(
-                    "randomizing_style", "normal"
-                )
-                self.rainbow_buttons = data.get("rainbow_buttons", False)
-
-        except Exception:
-            self.clear_data()
+            data = state_store.get_settings()
+        except (sqlite3.Error, ValueError):
             log.warning(
-                "The <settings.json> file wasn't set correctly. It was reset."
+                "The settings weren't set correctly. They were reset."
             )
+            data = {}
+
+        if not data:
+            log.info(
+                "Settings: There are no settings yet. "
+                "The default ones will be saved."
+            )
+            self.clear_data()
+            return
+
+        self._saved_data = data
+        self.music_volume = data.get("music_volume", 0.5)
+        self.sounds_volume = data.get("sounds_volume", 0.25)
+        self.current_language = data.get("language", "")
+        self.menus_color = data.get("menus_color", "blue")
+        self.drawing_images = data.get("drawing_images", True)
+        self.randomizing_style = data.get("randomizing_style", "normal")
+        self.rainbow_buttons = data.get("rainbow_buttons", False)
 
         int(self.music_volume)
         int(self.sounds_volume)
@@ -158,35 +203,33 @@ class SettingsManager():
             txt.set_language()
 
         log.info(
-            "Settings: Data has been imported "
-            "from the settings.json file."
+            "Settings: Data has been imported from the database."
         )
 
-        self.save_data()
+        if self.dirty_fields():  # Some settings were corrected
+            self.save_data()
 
     def clear_data(self) -> None:
         """
         # Clear Data
-        The `clear_data` method clears the settings.json file.
+        The `clear_data` method resets the settings.
         """
 
         txt.set_system_language()
-        with open(self.JSON_PATH, "w", encoding="UTF-8") as f:
-            json.dump({
-                "music_volume": 0.5,
-                "sounds_volume": 0.25,
-                "language": txt.current_language,
-                "menus_color": "blue",
-                "drawing_images": True,
-                "randomizing_style": "normal",
-                "rainbow_buttons": False
-            }, f)
+        self.music_volume = 0.5
+        self.sounds_volume = 0.25
+        self.current_language = txt.current_language
+        self.menus_color = "blue"
+        self.drawing_images = True
+        self.randomizing_style = "normal"
+        self.rainbow_buttons = False
+        self.color_change()
 
         log.info(
             "Settings: The settings data has been cleared."
         )
 
-        self.import_data()
+        self.save_data()
 
     def color_change(self) -> None:
         """
@@ -228,19 +271,18 @@ class SettingsManager():
 
         Window.clearcolor = self.bg_color
 
-        self.save_data()
-
 
 settings_manager = SettingsManager()
 """
 # Settings Manager
 `settings_manager` is the object of the `SettingManager` class
 which manages the settings, contains variables used in UI,
-saves and loads informations from a json file.
+saves and loads informations from the state database.
 
 It contains these methods:
-- `save_data` saves data in the settings.json file.
-- `import_data` imports data from the settings.json file.
-- `clear_data` clears the settings.json file.
+- `save_data` saves the changed settings in the database.
+- `dirty_fields` returns the settings which aren't saved yet.
+- `import_data` imports data from the database.
+- `clear_data` resets the settings.
 - `color_change` changes the color of the app's menus.
 """
@@ -0,0 +1,258 @@
+"""
+# Sound Loader
+The `sound_loader.py` module contains the `SoundLoader` class and the
+`LazySound` handles which it returns.
+
+The sound effects are decoded in the background while the window
+opens. The decoded samples of the compressed sounds are cached in the
+`sources/json/sounds` folder, so the next launches don't decode them
+again.
+"""
+
+import os
+import time
+import struct
+import hashlib
+import threading
+from collections import deque
+from typing import final
+
+import pygame
+
+from sources.engine.resource_path import resource_path
+from kivy.logger import Logger as log
+
+
+PCM_MAGIC = b"QMSD"
+PCM_VERSION = 1
+HEADER = struct.Struct("<4sI32siii")
+# magic, version, sha256 of the source, mixer frequency, size, channels
+
+DECODED_FORMATS = (".mp3", ".ogg")
+# Only these sounds are cached, a wav file is read as fast as its cache
+
+WAIT_TIMEOUT = 5.0  # Seconds `play` waits for a sound before skipping it
+
+
+@final
+class LazySound():
+    """
+    # Lazy Sound
+    The `LazySound` class is the handle of a sound which is loaded in
+    the background. It's used like a `pygame.mixer.Sound`.
+
+    It contains these methods:
+    - `play` plays the sound, waiting for it only if it isn't loaded.
+    - `set_volume` sets the volume now or once the sound is loaded.
+    - `wait` waits until the sound is loaded and returns it, or `None`
+    after `timeout` seconds.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.sound = None  # Stays `None` if the sound can't be loaded
+        self.volume = None
+        self.waited = 0.0  # Seconds waited by `play` before the loading
+
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(
+        self, timeout: float | None = WAIT_TIMEOUT
+    ) -> "pygame.mixer.Sound | None":
+        if not self._ready.is_set():
+            start = time.perf_counter()
+            ready = self._ready.wait(timeout)
+            self.waited += time.perf_counter() - start
+
+            if not ready:
+                log.warning(
+                    f"Music: The <{self.path}> sound isn't loaded after "
+                    f"{timeout} seconds. It wasn't played."
+                )
+                return None
+
+        return self.sound
+
+    def set_loaded(self, sound: "pygame.mixer.Sound | None") -> None:
+        """
+        # Set Loaded
+        The `set_loaded` method is called by the loader with the loaded
+        `sound`. It applies the volume which was set before.
+        """
+
+        with self._lock:
+            if sound is not None and self.volume is not None:
+                sound.set_volume(self.volume)
+            self.sound = sound
+
+        self._ready.set()
+
+    def set_volume(self, volume: float) -> None:
+        with self._lock:
+            self.volume = volume
+            if self.sound is not None:
+                self.sound.set_volume(volume)
+
+    def play(self) -> None:
+        sound = self.wait()
+        if sound is not None:
+            sound.play()
+
+
+@final
+class SoundLoader():
+    """
+    # Sound Loader
+    The `SoundLoader` class loads the sounds in a background thread in
+    the order they are asked.
+
+    The decoded samples of the mp3 and ogg sounds are saved in
+    `sources/json/sounds/<name>.pcm` files with the sha256 of their
+    source and the mixer format. A cache is used only if both are the
+    same, otherwise the sound is decoded again.
+
+    It contains these methods:
+    - `load` returns a `LazySound` and asks the background loader to
+    load it.
+    - `wait` waits until every asked sound is loaded.
+    """
+
+    def __init__(self, folder: str | None = "sources/json/sounds/") -> None:
+        self.folder = resource_path(folder)
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._loading = False
+        self._thread = None
+
+        self.cache_hits = 0
+        self.decoded = 0
+
+    def load(self, path: str) -> LazySound:
+        sound = LazySound(path)
+
+        with self._condition:
+            self._queue.append(sound)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._load_loop, name="SoundLoader", daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify_all()
+
+        return sound
+
+    def wait(self) -> None:
+        with self._condition:
+            while self._queue or self._loading:
+                self._condition.wait()
+
+    def _cache_path(self, path: str) -> str:
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.folder, f"{name}.pcm")
+
+    def _load_loop(self) -> None:
+        """
+        # Load Loop
+        The `_load_loop` method is the background loader. A sound which
+        can't be loaded is logged and stays silent, and its waiters are
+        always released.
+        """
+
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+
+                sound = self._queue.popleft()
+                self._loading = True
+
+            loaded = None
+
+            try:
+                loaded = self._load_sound(sound.path)
+            except Exception as e:
+                log.error(
+                    f"Music: The <{sound.path}> sound wasn't loaded: {e}"
+                )
+            finally:
+                sound.set_loaded(loaded)
+
+                with self._condition:
+                    self._loading = False
+                    self._condition.notify_all()
+
+    def _load_sound(self, path: str) -> pygame.mixer.Sound:
+        if not path.endswith(DECODED_FORMATS):
+            return pygame.mixer.Sound(path)
+
+        with open(path, "rb") as f:
+            source_hash = hashlib.sha256(f.read()).digest()
+
+        mixer_format = pygame.mixer.get_init()
+        cache_path = self._cache_path(path)
+        samples = self._read_cache(cache_path, source_hash, mixer_format)
+
+        if samples is not None:
+            self.cache_hits += 1
+            return pygame.mixer.Sound(buffer=samples)
+
+        sound = pygame.mixer.Sound(path)
+        self.decoded += 1
+        self._write_cache(
+            cache_path, source_hash, mixer_format, sound.get_raw()
+        )
+        return sound
+
+    def _read_cache(
+        self, cache_path: str, source_hash: bytes,
+        mixer_format: tuple[int, int, int]
+    ) -> memoryview | None:
+        """
+        # Read Cache
+        The `_read_cache` method returns the cached samples, or `None`
+        if there is no cache for this source and mixer format.
+        """
+
+        if not os.path.exists(cache_path):
+            return None
+
+        with open(cache_path, "rb") as f:
+            data = f.read()
+
+        try:
+            magic, version, saved_hash, *saved_format = HEADER.unpack_from(
+                data, 0
+            )
+        except struct.error:
+            return None
+
+        if (
+            magic != PCM_MAGIC or version != PCM_VERSION
+            or saved_hash != source_hash
+            or tuple(saved_format) != tuple(mixer_format)
+        ):
+            return None
+
+        return memoryview(data)[HEADER.size:]
+
+    def _write_cache(
+        self, cache_path: str, source_hash: bytes,
+        mixer_format: tuple[int, int, int], samples: bytes
+    ) -> None:
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(cache_path + ".tmp", "wb") as f:
+                f.write(HEADER.pack(
+                    PCM_MAGIC, PCM_VERSION, source_hash, *mixer_format
+                ))
+                f.write(samples)
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError as e:
+            log.warning(f"Music: The <{cache_path}> cache wasn't saved: {e}")
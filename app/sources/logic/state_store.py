@@ -0,0 +1,28 @@
+"""
+# State Store
+The `state_store.py` module only contains `state_store`, the
+`StateStore` of the game.
+
+The `StateStore` class is in the engine, `sources/engine/state_store.py`.
+"""
+
+from sources.engine.state_store import StateStore
+
+
+state_store = StateStore()
+"""
+# State Store
+`state_store` is an object of the `StateStore` class which keeps the
+settings, the points and the answers in `sources/json/state.db`.
+
+It contains these methods:
+- `get_settings` returns the saved settings.
+- `set_settings` saves some settings.
+- `get_points` returns the points of a profile.
+- `set_points` saves the points of a profile.
+- `record_answer` saves an answer and the new points.
+- `flush` waits until the answers are written.
+- `answers_count` returns the number of saved answers.
+- `question_stats` returns the statistics of the questions.
+- `close` writes the waiting answers and closes the database.
+"""
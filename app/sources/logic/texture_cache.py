@@ -0,0 +1,137 @@
+"""
+# Texture Cache
+The `texture_cache.py` module only contains the `TextureCache` class.
+
+It keeps the textures of the question images, so an image asked again
+isn't decoded and uploaded again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import final
+
+from kivy.core.image import ImageLoader, Image as CoreImage
+from kivy.logger import Logger as log
+
+
+@final
+class TextureCache():
+    """
+    # Texture Cache
+    The `TextureCache` class keeps textures by image path until their
+    size goes over `budget_bytes`. Then the least recently used
+    textures are dropped.
+
+    It contains these methods:
+    - `get` returns the texture of an image.
+    - `contains` tells if the texture of an image is in the cache.
+    - `clear` drops every texture.
+    - `stats` returns the hit rate and the resident bytes.
+    """
+
+    def __init__(self, budget_bytes: int | None = 64 * 1024 * 1024) -> None:
+        self.budget_bytes = budget_bytes
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._textures = OrderedDict()  # path: (texture, size in bytes)
+        self._lock = threading.Lock()
+
+    def contains(self, path: str) -> bool:
+        """
+        # Contains
+        The `contains` method tells if the texture of the image at
+        `path` is in the cache. It can be called from any thread.
+        """
+
+        with self._lock:
+            return path in self._textures
+
+    def get(self, path: str, image_data=None):
+        """
+        # Get
+        The `get` method returns the texture of the image at `path`.
+
+        If it isn't in the cache, it's created from `image_data`, an
+        image already decoded by the prefetcher, or decoded now. It
+        must be called from the UI thread, where textures are created.
+
+        The `path` can also be an `atlas://` url, then the texture is a
+        region of the atlas page loaded by Kivy.
+        """
+
+        with self._lock:
+            cached = self._textures.get(path)
+
+            if cached is not None:
+                self._textures.move_to_end(path)
+                self.hits += 1
+                return cached[0]
+
+            self.misses += 1
+
+        if image_data is None and path.startswith("atlas://"):
+            image_data = CoreImage(path)
+        elif image_data is None:
+            image_data = ImageLoader.load(path)
+
+        texture = image_data.texture
+        width, height = texture.size
+        size = width * height * len(texture.colorfmt)
+
+        with self._lock:
+            self._textures[path] = (texture, size)
+            self.resident_bytes += size
+
+            while (
+                self.resident_bytes > self.budget_bytes
+                and len(self._textures) > 1
+            ):
+                old_path, (_, old_size) = self._textures.popitem(last=False)
+                self.resident_bytes -= old_size
+                log.debug(f"Textures: <{old_path}> left the cache.")
+
+        return texture
+
+    def clear(self) -> None:
+        """
+        # Clear
+        The `clear` method drops every texture of the cache.
+        """
+
+        with self._lock:
+            self._textures.clear()
+            self.resident_bytes = 0
+
+    def stats(self) -> dict[str, float]:
+        """
+        # Stats
+        The `stats` method returns the hit rate, the hits, the misses,
+        the number of textures and the resident bytes.
+        """
+
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "hits": self.hits,
+                "misses": self.misses,
+                "textures": len(self._textures),
+                "resident_bytes": self.resident_bytes,
+                "budget_bytes": self.budget_bytes
+            }
+
+
+texture_cache = TextureCache()
+"""
+# Texture Cache
+`texture_cache` is an object of the `TextureCache` class which keeps
+the textures of the question images, in 64 MB at most.
+
+It contains these methods:
+- `get` returns the texture of an image.
+- `contains` tells if the texture of an image is in the cache.
+- `clear` drops every texture.
+- `stats` returns the hit rate and the resident bytes.
+"""
@@ -0,0 +1,19 @@
+"""
+# Server
+The server folder contains the multiplayer quiz server: the players of
+a room on a LAN answer the same questions at the same time. It's built
+on the engine and asyncio only, without Kivy or Pygame.
+
+It's run from the app folder:
+```
+python -m sources.server --port 8765 --workers 4
+```
+
+## Files
+- `quiz_server.py` accepts the connections and creates the rooms.
+- `sharded_server.py` routes the rooms to worker processes, one per
+core.
+- `rooms.py` asks the questions of a room and counts the points.
+- `websocket.py` contains a small WebSocket over the asyncio streams.
+- `load_generator.py` connects many players to a server to measure it.
+"""
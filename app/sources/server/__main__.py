@@ -0,0 +1,51 @@
+"""
+# Server Main
+The `__main__.py` module starts the quiz server from the command line.
+"""
+
+import asyncio
+import logging
+import argparse
+
+from sources.engine.logger import log
+from sources.server.quiz_server import QuizServer
+from sources.server.sharded_server import ShardedServer
+from sources.server.rooms import QUESTION_TIME, PAUSE_TIME
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="The quiz server.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--question-time", type=float, default=QUESTION_TIME
+    )
+    parser.add_argument("--pause-time", type=float, default=PAUSE_TIME)
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="The worker processes, 0 for one per core."
+    )
+    arguments = parser.parse_args()
+
+    logging.basicConfig(format="[%(levelname)s] %(message)s")
+    log.setLevel(logging.INFO)
+
+    if arguments.workers == 1:
+        server = QuizServer(
+            arguments.host, arguments.port,
+            arguments.question_time, arguments.pause_time
+        )
+    else:
+        server = ShardedServer(
+            arguments.host, arguments.port, arguments.workers,
+            arguments.question_time, arguments.pause_time
+        )
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        log.info("Server: Stopped.")
+
+
+if __name__ == "__main__":
+    main()
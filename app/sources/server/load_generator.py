@@ -0,0 +1,262 @@
+"""
+# Load Generator
+The `load_generator.py` module connects many players to a quiz server
+and measures it: how long the questions take to reach the players,
+how many messages are delivered per second and how many connections
+fail.
+
+Every player answers its questions after a random think time. With
+`--spawn`, the server is started in another process on this computer:
+```
+python -m sources.server.load_generator --spawn --clients 2000
+```
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+
+from sources.server.websocket import connect, WebSocketError
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    # Percentile
+    The `percentile` function returns the value under which `percent`
+    percent of the sorted `values` are.
+    """
+
+    if not values:
+        return 0.0
+
+    index = min(len(values) - 1, int(len(values) * percent / 100))
+    return values[index]
+
+
+class Results():
+    """
+    # Results
+    The `Results` class collects the measures of every player.
+    """
+
+    def __init__(self) -> None:
+        self.connected = 0
+        self.failed = 0
+        self.errors = 0
+        self.questions = 0
+        self.answers = 0
+        self.results = 0
+        self.answered = 0  # Results of a round the player answered
+        self.right = 0
+        self.delays = []  # Seconds between sending and receiving
+        self.latencies = []  # Seconds between an answer and the next
+        self.connect_times = []
+
+    def report(self, clients: int, rooms: int, elapsed: float) -> dict:
+        delays = sorted(self.delays)
+        latencies = sorted(self.latencies)
+        connect_times = sorted(self.connect_times)
+
+        return {
+            "clients": clients,
+            "rooms": rooms,
+            "seconds": round(elapsed, 2),
+            "connected": self.connected,
+            "failed": self.failed,
+            "errors": self.errors,
+            "questions": self.questions,
+            "answers": self.answers,
+            "results": self.results,
+            "right_ratio": round(self.right / max(1, self.answered), 3),
+            "messages_per_second": round(
+                (self.questions + self.results) / elapsed, 1
+            ),
+            "delivery_ms": {
+                f"p{p}": round(percentile(delays, p) * 1000, 2)
+                for p in (50, 95, 99)
+            },
+            "next_question_ms": {
+                f"p{p}": round(percentile(latencies, p) * 1000, 2)
+                for p in (50, 95, 99)
+            },
+            "connect_ms": {
+                f"p{p}": round(percentile(connect_times, p) * 1000, 2)
+                for p in (50, 95, 99)
+            }
+        }
+
+
+async def play(
+    host: str, port: int, room: str, name: str, language: str,
+    think_time: float, stop_at: float, results: Results
+) -> None:
+    """
+    # Play
+    The `play` function is one player: it joins the `room` and answers
+    every question until `stop_at`. The time from its answer to the
+    next question counts the end of the round and the pause.
+    """
+
+    start = time.monotonic()
+
+    try:
+        socket = await connect(
+            host, port, f"/ws?room={room}&name={name}&language={language}"
+        )
+    except (OSError, WebSocketError, asyncio.IncompleteReadError):
+        results.failed += 1
+        return
+
+    results.connected += 1
+    results.connect_times.append(time.monotonic() - start)
+    rng = random.Random(name)
+    answered_at = None
+
+    async def answer(round_number: int) -> None:
+        nonlocal answered_at
+        await asyncio.sleep(rng.uniform(0, think_time))
+        if socket.send(json.dumps({
+            "type": "answer", "round": round_number,
+            "choice": rng.randrange(4)
+        })):
+            answered_at = time.monotonic()
+            results.answers += 1
+
+    tasks = set()
+
+    try:
+        while time.monotonic() < stop_at:
+            remaining = stop_at - time.monotonic()
+            text = await asyncio.wait_for(socket.receive(), remaining)
+
+            if text is None:
+                results.errors += 1
+                break
+
+            message = json.loads(text)
+
+            if message["type"] == "question":
+                results.questions += 1
+                results.delays.append(time.time() - message["sent_at"])
+                if answered_at is not None:
+                    results.latencies.append(time.monotonic() - answered_at)
+                    answered_at = None
+                task = asyncio.create_task(answer(message["round"]))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            elif message["type"] == "result":
+                results.results += 1
+                if message["answered"]:
+                    results.answered += 1
+                    results.right += message["right"]
+            elif message["type"] == "error":
+                results.errors += 1
+                break
+
+    except asyncio.TimeoutError:
+        pass
+    except (OSError, WebSocketError, ValueError):
+        results.errors += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await socket.close()
+
+
+async def run(
+    host: str, port: int, clients: int, rooms: int, duration: float,
+    think_time: float, language: str, ramp_time: float,
+    first_room: int | None = 0
+) -> dict:
+    """
+    # Run
+    The `run` function connects `clients` players spread over `rooms`
+    rooms during `ramp_time` seconds and returns their measures after
+    `duration` seconds. The rooms are numbered from `first_room`, so
+    many generators can share a server.
+    """
+
+    results = Results()
+    start = time.monotonic()
+    stop_at = start + ramp_time + duration
+    tasks = []
+
+    for i in range(clients):
+        tasks.append(asyncio.create_task(play(
+            host, port, f"room-{first_room + i % rooms}",
+            f"player-{first_room}-{i}", language,
+            think_time, stop_at, results
+        )))
+        if ramp_time:
+            await asyncio.sleep(ramp_time / clients)
+
+    await asyncio.gather(*tasks)
+    return results.report(clients, rooms, time.monotonic() - start)
+
+
+async def wait_for_server(host: str, port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="A quiz server load test.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--think-time", type=float, default=1.0)
+    parser.add_argument("--ramp-time", type=float, default=2.0)
+    parser.add_argument("--language", default="en-EN")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="The worker processes of the spawned server."
+    )
+    parser.add_argument(
+        "--spawn", action="store_true",
+        help="Start a server with short rounds in another process."
+    )
+    arguments = parser.parse_args()
+
+    server = None
+    if arguments.spawn:
+        server = subprocess.Popen([
+            sys.executable, "-m", "sources.server",
+            "--host", arguments.host, "--port", str(arguments.port),
+            "--question-time", "2", "--pause-time", "0.5",
+            "--workers", str(arguments.workers)
+        ])
+
+    try:
+        if server is not None:
+            asyncio.run(wait_for_server(arguments.host, arguments.port, 10))
+
+        report = asyncio.run(run(
+            arguments.host, arguments.port, arguments.clients,
+            arguments.rooms, arguments.duration, arguments.think_time,
+            arguments.language, arguments.ramp_time
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
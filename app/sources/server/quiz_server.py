@@ -0,0 +1,257 @@
+"""
+# Quiz Server
+The `quiz_server.py` module only contains the `QuizServer` class.
+
+It serves the rooms of players on a LAN with asyncio: the players
+connect with a WebSocket, and a few HTTP pages show the state of the
+server.
+"""
+
+import re
+import json
+import socket
+import asyncio
+from urllib.parse import urlsplit, parse_qs
+from typing import final
+
+from sources.engine.resource_path import resource_path, resource_exists
+from sources.engine.shared_bank import SharedBank
+from sources.engine.logger import log
+from sources.server.rooms import Room, QUESTION_TIME, PAUSE_TIME
+from sources.server.websocket import (
+    WebSocket, WebSocketError, read_headers, parse_headers,
+    handshake_response
+)
+
+
+LANGUAGE_PATTERN = re.compile(r"[a-z]{2}-[A-Z]{2}")
+NAME_PATTERN = re.compile(r"[\w .-]{1,32}")
+CHOICES = range(4)  # The indexes of the answers of a question
+HANDSHAKE_TIMEOUT = 10.0
+
+
+@final
+class QuizServer():
+    """
+    # Quiz Server
+    The `QuizServer` class accepts the connections on `host` and
+    `port`. A room is created when its first player joins and is
+    removed when its last player leaves. The questions of a language
+    are loaded once in a `SharedBank` used by all its rooms.
+
+    The players join with a WebSocket:
+    `ws://host:port/ws?room=<room>&name=<name>&language=<language>`.
+    They receive the "question" and "result" messages of their room
+    and send `{"type": "answer", "round": <round>, "choice": <index>}`.
+
+    The HTTP pages are `/health` and `/rooms`, in JSON.
+
+    It contains these methods:
+    - `start` starts listening.
+    - `accept` serves a connection accepted by another process.
+    - `serve_forever` serves until it's cancelled.
+    - `close` stops the server.
+    - `stats` returns the state of the server.
+    """
+
+    def __init__(
+        self, host: str | None = "0.0.0.0", port: int | None = 8765,
+        question_time: float | None = QUESTION_TIME,
+        pause_time: float | None = PAUSE_TIME
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.question_time = question_time
+        self.pause_time = pause_time
+
+        self.banks = {}  # The loading of the `SharedBank` of a language
+        self.rooms = {}  # By name
+        self.connections = 0
+        self.server = None
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=4096
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        log.info(f"Server: Listening on <{self.host}:{self.port}>.")
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        await self.server.serve_forever()
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+        for room in self.rooms.values():
+            if room.task is not None:
+                room.task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "connections": self.connections,
+            "languages": sorted(self.banks),
+            "rooms": [room.stats() for room in self.rooms.values()]
+        }
+
+    async def _bank(self, language: str) -> SharedBank | None:
+        """
+        # Bank
+        The `_bank` method returns the bank of the `language`, loaded
+        in a thread the first time, or `None` if there is no database.
+        """
+
+        if language not in self.banks:
+            if not LANGUAGE_PATTERN.fullmatch(language) or not (
+                resource_exists(f"resources/databases/{language}.csv")
+            ):
+                return None
+
+            # The first players of a language wait for the same loading
+            loop = asyncio.get_running_loop()
+            self.banks[language] = loop.run_in_executor(
+                None, SharedBank.load, language,
+                resource_path(f"resources/databases/{language}.csv")
+            )
+
+        try:
+            return await self.banks[language]
+        except Exception as e:  # The next player of it tries again
+            log.error(f"Server: The <{language}> bank failed: {e!r}")
+            self.banks.pop(language, None)
+            return None
+
+    async def accept(self, connection: socket.socket, data: bytes) -> None:
+        """
+        # Accept
+        The `accept` method serves a `connection` accepted by another
+        process, like the router of a `ShardedServer`, which already
+        read its headers `data`.
+        """
+
+        reader, writer = await asyncio.open_connection(sock=connection)
+        await self._handle(reader, writer, data)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+        data: bytes | None = None
+    ) -> None:
+        self.connections += 1
+
+        try:
+            if data is None:
+                first_line, headers = await asyncio.wait_for(
+                    read_headers(reader), HANDSHAKE_TIMEOUT
+                )
+            else:
+                first_line, headers = parse_headers(data)
+
+            method, target, _ = first_line.split(" ", 2)
+            url = urlsplit(target)
+
+            if url.path == "/ws":
+                await self._play(reader, writer, headers, parse_qs(url.query))
+            elif method == "GET" and url.path == "/health":
+                self._respond(writer, 200, {"status": "ok"})
+            elif method == "GET" and url.path == "/rooms":
+                self._respond(writer, 200, self.stats())
+            else:
+                self._respond(writer, 404, {"error": "Not found."})
+
+        except (
+            ValueError, WebSocketError, asyncio.TimeoutError,
+            asyncio.IncompleteReadError, ConnectionError
+        ) as e:
+            log.debug(f"Server: A connection was closed: {e!r}")
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    def _respond(
+        self, writer: asyncio.StreamWriter, status: int, data: dict
+    ) -> None:
+        body = json.dumps(data).encode("UTF-8")
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}[status]
+        writer.write((
+            f"HTTP/1.1 {status} {reason}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("ascii") + body)
+
+    async def _play(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+        headers: dict[str, str], query: dict[str, list[str]]
+    ) -> None:
+        """
+        # Play
+        The `_play` method upgrades the connection to a WebSocket, adds
+        the player to its room and reads its answers until it leaves.
+        """
+
+        room_name = query.get("room", ["lobby"])[0]
+        name = query.get("name", [""])[0]
+        language = query.get("language", ["en-EN"])[0]
+
+        if not (
+            NAME_PATTERN.fullmatch(name) and NAME_PATTERN.fullmatch(room_name)
+        ):
+            self._respond(writer, 400, {"error": "Wrong room or name."})
+            return
+
+        room = self.rooms.get(room_name)
+        bank = room.bank if room else await self._bank(language)
+
+        if bank is None:
+            self._respond(writer, 400, {"error": "Unknown language."})
+            return
+
+        writer.write(handshake_response(headers))
+        websocket = WebSocket(reader, writer)
+
+        room = self.rooms.get(room_name)
+        if room is None:
+            room = Room(room_name, bank, self.question_time, self.pause_time)
+            self.rooms[room_name] = room
+
+        player = room.join(name, websocket)
+
+        if player is None:
+            websocket.send(json.dumps(
+                {"type": "error", "error": "The name is already used."}
+            ))
+            await websocket.close(1008)
+            return
+
+        websocket.send(json.dumps({
+            "type": "welcome", "room": room_name, "name": name,
+            "language": room.bank.language, "players": len(room.players)
+        }))
+
+        try:
+            while (text := await websocket.receive()) is not None:
+                message = json.loads(text)
+
+                if message.get("type") == "answer":
+                    round_number, choice = message["round"], message["choice"]
+
+                    # `bool` is an `int` too, `true` isn't an answer
+                    if (
+                        type(round_number) is not int
+                        or type(choice) is not int or choice not in CHOICES
+                    ):
+                        raise ValueError(f"Wrong answer: {text[:64]!r}")
+
+                    room.answer(player, round_number, choice)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            log.debug(f"Server: A wrong message of <{name}>: {e!r}")
+        finally:
+            room.leave(player)
+
+            if not room.players and self.rooms.get(room_name) is room:
+                del self.rooms[room_name]
+
+            await websocket.close()
@@ -0,0 +1,210 @@
+"""
+# Rooms
+The `rooms.py` module contains the `Room` class and the `Player` of a
+room.
+
+A room asks the same question to all its players at the same time,
+collects their answers with their time and counts the points with the
+rules of the `PointsManager`.
+"""
+
+import json
+import time
+import asyncio
+from typing import final
+
+from sources.engine.session import Session
+from sources.engine.shared_bank import SharedBank
+from sources.engine.logger import log
+from sources.server.websocket import WebSocket, encode_frame, OP_TEXT
+
+
+QUESTION_TIME = 15.0  # Seconds to answer a question
+PAUSE_TIME = 3.0  # Seconds between the result and the next question
+
+
+@final
+class Player():
+    """
+    # Player
+    The `Player` class is a player of a room: its connection, its
+    `Session` with its points, and its answer to the asked question.
+    """
+
+    __slots__ = ("name", "socket", "session", "choice", "latency")
+
+    def __init__(
+        self, name: str, socket: WebSocket, session: Session
+    ) -> None:
+        self.name = name
+        self.socket = socket
+        self.session = session
+        self.choice = None  # The answer to the asked question
+        self.latency = 0.0
+
+
+@final
+class Room():
+    """
+    # Room
+    The `Room` class asks the questions of a `SharedBank` to its
+    players while there is at least one player.
+
+    The question is encoded once and the same frame is written to
+    every player. A round ends when every player answered or after
+    `question_time` seconds, and a player who didn't answer loses like
+    with a wrong answer.
+
+    It contains these methods:
+    - `join` adds a player and starts the room if needed.
+    - `leave` removes a player.
+    - `answer` saves the answer of a player.
+    - `stats` returns the state of the room.
+    """
+
+    def __init__(
+        self, name: str, bank: SharedBank,
+        question_time: float | None = QUESTION_TIME,
+        pause_time: float | None = PAUSE_TIME
+    ) -> None:
+        self.name = name
+        self.bank = bank
+        self.question_time = question_time
+        self.pause_time = pause_time
+
+        self.players = {}  # By name
+        self.order = Session(bank)  # Chooses the questions of the room
+        self.round = 0
+        self.question = None
+        self.asked_at = 0.0
+        self.waiting = 0  # The players who can still answer
+        self.answered = asyncio.Event()
+        self.task = None
+
+    def join(self, name: str, socket: WebSocket) -> Player | None:
+        """
+        # Join
+        The `join` method adds a player called `name`, or returns
+        `None` if the name is already used in the room.
+        """
+
+        if name in self.players:
+            return None
+
+        player = Player(name, socket, Session(self.bank))
+        self.players[name] = player
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+        return player
+
+    def leave(self, player: Player) -> None:
+        if self.players.get(player.name) is player:
+            del self.players[player.name]
+
+            if (
+                self.question is not None and player.choice is None
+                and player.session.question >= 0
+            ):
+                self.waiting -= 1
+                self._check_answered()
+
+    def answer(self, player: Player, round_number: int, choice: int) -> None:
+        """
+        # Answer
+        The `answer` method saves the first answer of a `player` to
+        the asked question, with the time since it was asked.
+        """
+
+        if (
+            round_number != self.round or self.question is None
+            or player.choice is not None or player.session.question < 0
+        ):
+            return  # Too late, or the player joined after the question
+
+        player.choice = choice
+        player.latency = time.monotonic() - self.asked_at
+        self.waiting -= 1
+        self._check_answered()
+
+    def _check_answered(self) -> None:
+        if self.question is not None and self.waiting <= 0:
+            self.answered.set()
+
+    async def _run(self) -> None:
+        log.info(f"Server: The room <{self.name}> started.")
+
+        try:
+            while self.players:
+                await self._play_round()
+                await asyncio.sleep(self.pause_time)
+        except Exception as e:
+            log.error(f"Server: The room <{self.name}> stopped: {e}")
+            raise
+
+        log.info(f"Server: The room <{self.name}> is empty and stopped.")
+
+    async def _play_round(self) -> None:
+        """
+        # Play Round
+        The `_play_round` method asks a question to every player, waits
+        for the answers and sends the result to every player.
+        """
+
+        self.round += 1
+        self.question = question = self.order.ask()
+        self.answered.clear()
+
+        frame = encode_frame(OP_TEXT, json.dumps({
+            "type": "question",
+            "round": self.round,
+            "text": question.text,
+            "answers": question.answers,
+            "time": self.question_time,
+            "sent_at": time.time()
+        }).encode("UTF-8"))
+
+        players = list(self.players.values())
+        self.waiting = len(players)
+        self.asked_at = time.monotonic()
+
+        for player in players:
+            player.choice = None
+            player.session.show(question)
+            player.socket.send_frame(frame)
+
+        try:
+            await asyncio.wait_for(
+                self.answered.wait(), self.question_time
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        self.question = None
+
+        for player in players:
+            if self.players.get(player.name) is not player:
+                continue  # The player left during the question
+
+            choice = -1 if player.choice is None else player.choice
+            right = player.session.answer(choice)
+
+            player.socket.send(json.dumps({
+                "type": "result",
+                "round": self.round,
+                "correct": question.correct,
+                "right": right,
+                "answered": player.choice is not None,
+                "latency": round(player.latency, 3),
+                "points": player.session.points,
+                "win_streak": player.session.win_streak
+            }))
+
+    def stats(self) -> dict:
+        return {
+            "room": self.name,
+            "language": self.bank.language,
+            "players": len(self.players),
+            "round": self.round
+        }
@@ -0,0 +1,385 @@
+"""
+# Sharded Server
+The `sharded_server.py` module only contains the `ShardedServer` class
+and the `run_worker` function of its worker processes.
+
+One `QuizServer` runs all its rooms on one core. The sharded server
+starts one worker process per core, each with its own `QuizServer`
+and its own banks read from the memory-mapped packs, and a small
+router which gives every room to the same worker.
+
+The router only reads the headers of a connection and sends the
+connection itself to the worker with `socket.send_fds`, so it never
+copies the messages of the players. It's only available on Unix.
+"""
+
+import os
+import json
+import hashlib
+import socket
+import asyncio
+import logging
+import multiprocessing
+from glob import glob
+from urllib.parse import urlsplit, parse_qs
+from typing import final
+
+from sources.engine.resource_path import resource_path
+from sources.engine.questions_pack import load_pack, QUESTIONS_WRAP_WIDTHS
+from sources.engine.logger import log
+from sources.server.quiz_server import (
+    QuizServer, LANGUAGE_PATTERN, HANDSHAKE_TIMEOUT
+)
+from sources.server.rooms import QUESTION_TIME, PAUSE_TIME
+from sources.server.websocket import MAX_HEADERS_SIZE
+
+
+SEND_TIMEOUT = 5.0  # Seconds to wait for a busy worker
+RESTART_DELAY = 1.0  # Seconds before a stopped worker is started again
+
+
+def worker_index(room: str, workers: int) -> int:
+    """
+    # Worker Index
+    The `worker_index` function returns the worker of a `room`. It's
+    computed with `blake2b`, which is the same in every run, unlike
+    `hash`, and spreads the close names like "room-1" and "room-2",
+    unlike `crc32`.
+    """
+
+    digest = hashlib.blake2b(room.encode("UTF-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % workers
+
+
+def compile_packs() -> None:
+    """
+    # Compile Packs
+    The `compile_packs` function compiles the pack of every language
+    before the workers start, so they only read them.
+    """
+
+    for csv_path in glob(os.path.join(
+        resource_path("resources/databases"), "*.csv"
+    )):
+        language = os.path.splitext(os.path.basename(csv_path))[0]
+
+        if LANGUAGE_PATTERN.fullmatch(language):
+            load_pack(csv_path, QUESTIONS_WRAP_WIDTHS).close()
+
+
+def run_worker(
+    channel: socket.socket, index: int, question_time: float,
+    pause_time: float, log_level: int
+) -> None:
+    """
+    # Run Worker
+    The `run_worker` function is the main function of a worker
+    process. It serves the connections received on its `channel`
+    until the router closes it.
+    """
+
+    logging.basicConfig(format=f"[%(levelname)s] [{index}] %(message)s")
+    log.setLevel(log_level)
+
+    try:
+        asyncio.run(_serve_worker(channel, question_time, pause_time))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _serve_worker(
+    channel: socket.socket, question_time: float, pause_time: float
+) -> None:
+    server = QuizServer(question_time=question_time, pause_time=pause_time)
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+    tasks = set()
+
+    def receive() -> None:
+        while True:
+            try:
+                data, fds, _, _ = socket.recv_fds(
+                    channel, MAX_HEADERS_SIZE, 1
+                )
+            except BlockingIOError:
+                return
+            except OSError:
+                data, fds = b"", []
+
+            if not data and not fds:  # The router stopped
+                loop.remove_reader(channel.fileno())
+                if not stopped.done():
+                    stopped.set_result(None)
+                return
+
+            for fd in fds:
+                connection = socket.socket(fileno=fd)
+                connection.setblocking(False)
+
+                task = loop.create_task(server.accept(connection, data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+    channel.setblocking(False)
+    loop.add_reader(channel.fileno(), receive)
+
+    await stopped
+    await server.close()
+
+
+@final
+class ShardedServer():
+    """
+    # Sharded Server
+    The `ShardedServer` class accepts the connections on `host` and
+    `port` and gives them to `workers` processes, one per core by
+    default. The connections of a room always go to the same worker,
+    chosen from the `room` parameter of the request, or from its
+    `worker` parameter, for example to read the `/rooms` page of a
+    worker.
+
+    A worker which stops is started again after `RESTART_DELAY`, its
+    rooms are lost. Meanwhile its connections are answered with a 503
+    error.
+
+    It contains these methods:
+    - `start` starts the workers and listens.
+    - `serve_forever` routes the connections until it's cancelled.
+    - `close` stops the router and the workers.
+    - `stats` returns the connections given to every worker and its
+    restarts.
+    """
+
+    def __init__(
+        self, host: str | None = "0.0.0.0", port: int | None = 8765,
+        workers: int | None = None,
+        question_time: float | None = QUESTION_TIME,
+        pause_time: float | None = PAUSE_TIME
+    ) -> None:
+        if not hasattr(socket, "send_fds"):
+            raise OSError("The sharded server is only available on Unix.")
+
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.question_time = question_time
+        self.pause_time = pause_time
+
+        self.listener = None
+        self.channels = [None] * self.workers  # To send the connections
+        self.processes = [None] * self.workers
+        self.routed = [0] * self.workers
+        self.restarts = [0] * self.workers
+        self.tasks = set()
+        self.closing = False
+
+    async def start(self) -> None:
+        compile_packs()
+
+        for index in range(self.workers):
+            self._start_worker(index)
+
+        self.listener = socket.create_server(
+            (self.host, self.port), backlog=4096
+        )
+        self.listener.setblocking(False)
+        self.port = self.listener.getsockname()[1]
+
+        log.info(
+            f"Server: Listening on <{self.host}:{self.port}> with "
+            f"{self.workers} workers."
+        )
+
+    async def serve_forever(self) -> None:
+        if self.listener is None:
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            connection, _ = await loop.sock_accept(self.listener)
+
+            task = loop.create_task(self._route(connection))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def close(self) -> None:
+        self.closing = True
+        loop = asyncio.get_running_loop()
+
+        if self.listener is not None:
+            self.listener.close()
+
+        for process in self.processes:
+            if process is not None:
+                loop.remove_reader(process.sentinel)
+
+        for channel in self.channels:
+            channel.close()  # The worker stops when its channel closes
+
+        for process in self.processes:
+            await asyncio.to_thread(process.join, SEND_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+
+    def stats(self) -> dict:
+        return {
+            "workers": [
+                {
+                    "routed": routed, "restarts": restarts,
+                    "alive": process.is_alive()
+                }
+                for routed, restarts, process in zip(
+                    self.routed, self.restarts, self.processes
+                )
+            ]
+        }
+
+    def _start_worker(self, index: int) -> None:
+        """
+        # Start Worker
+        The `_start_worker` method starts the worker process `index`
+        with a new channel, and watches it until it stops.
+        """
+
+        router_end, worker_end = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+
+        # A spawned worker doesn't inherit the event loop of the router
+        process = multiprocessing.get_context("spawn").Process(
+            target=run_worker, daemon=True, name=f"worker-{index}",
+            args=(
+                worker_end, index, self.question_time,
+                self.pause_time, log.getEffectiveLevel()
+            )
+        )
+        process.start()
+        worker_end.close()
+        router_end.setblocking(False)
+
+        self.channels[index] = router_end
+        self.processes[index] = process
+
+        asyncio.get_running_loop().add_reader(
+            process.sentinel, self._worker_stopped, index
+        )
+
+    def _worker_stopped(self, index: int) -> None:
+        """
+        # Worker Stopped
+        The `_worker_stopped` method is called when the worker process
+        `index` stops, and starts it again after `RESTART_DELAY`.
+        """
+
+        loop = asyncio.get_running_loop()
+        process = self.processes[index]
+        loop.remove_reader(process.sentinel)
+
+        if self.closing:
+            return
+
+        process.join()
+        self.channels[index].close()
+        self.restarts[index] += 1
+        log.error(
+            f"Server: The worker {index} stopped with the exit code "
+            f"{process.exitcode}. Its rooms are lost, it's started again "
+            f"in {RESTART_DELAY} seconds."
+        )
+
+        def restart() -> None:
+            if not self.closing:
+                self._start_worker(index)
+
+        loop.call_later(RESTART_DELAY, restart)
+
+    async def _read_headers(self, connection: socket.socket) -> bytes:
+        loop = asyncio.get_running_loop()
+        data = b""
+
+        while b"\r\n\r\n" not in data:
+            chunk = await loop.sock_recv(connection, 4096)
+
+            if not chunk:
+                raise ConnectionError("The connection was closed.")
+
+            data += chunk
+
+            if len(data) > MAX_HEADERS_SIZE:
+                raise ValueError("The headers are too long.")
+
+        return data
+
+    async def _route(self, connection: socket.socket) -> None:
+        """
+        # Route
+        The `_route` method reads the headers of a `connection`, sends
+        them with the connection to the worker of its room, and closes
+        the copy of the connection in the router.
+        """
+
+        try:
+            data = await asyncio.wait_for(
+                self._read_headers(connection), HANDSHAKE_TIMEOUT
+            )
+            target = data.split(b"\r\n", 1)[0].decode("latin-1").split()[1]
+            query = parse_qs(urlsplit(target).query)
+
+            if "worker" in query:
+                index = int(query["worker"][0]) % self.workers
+            else:
+                index = worker_index(
+                    query.get("room", ["lobby"])[0], self.workers
+                )
+
+            if not self.processes[index].is_alive():
+                await self._unavailable(connection)
+                return
+
+            try:
+                await self._send(index, data, connection)
+            except (BrokenPipeError, ConnectionError):
+                # The worker stopped, `_worker_stopped` restarts it
+                await self._unavailable(connection)
+                return
+
+            self.routed[index] += 1
+
+        except (
+            ValueError, IndexError, asyncio.TimeoutError, OSError
+        ) as e:
+            log.debug(f"Server: A connection wasn't routed: {e!r}")
+        finally:
+            connection.close()
+
+    async def _unavailable(self, connection: socket.socket) -> None:
+        body = json.dumps(
+            {"error": "The worker of this room is restarting."}
+        ).encode("UTF-8")
+
+        await asyncio.get_running_loop().sock_sendall(connection, (
+            "HTTP/1.1 503 Service Unavailable\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Retry-After: 1\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("ascii") + body)
+
+    async def _send(
+        self, index: int, data: bytes, connection: socket.socket
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SEND_TIMEOUT
+
+        while True:
+            try:
+                socket.send_fds(
+                    self.channels[index], [data], [connection.fileno()]
+                )
+                return
+            except BlockingIOError:
+                if loop.time() > deadline:
+                    raise
+
+                await asyncio.sleep(0.001)  # The worker is busy
@@ -0,0 +1,304 @@
+"""
+# Web Socket
+The `websocket.py` module contains the `WebSocket` class, a small
+WebSocket connection (RFC 6455) over the streams of asyncio, and the
+functions which open it as a server or as a client.
+
+Only the standard library is used, so the server runs wherever the
+engine runs.
+"""
+
+import os
+import base64
+import struct
+import hashlib
+import asyncio
+from typing import final
+
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+MAX_MESSAGE_SIZE = 64 * 1024  # A player only sends small messages
+MAX_WRITE_BUFFER = 256 * 1024  # A slower client is disconnected
+MAX_HEADERS_SIZE = 16 * 1024
+
+
+class WebSocketError(Exception):
+    """
+    # Web Socket Error
+    The `WebSocketError` exception is raised when the other side
+    doesn't follow the protocol.
+    """
+
+
+def accept_key(key: str) -> str:
+    """
+    # Accept Key
+    The `accept_key` function returns the `Sec-WebSocket-Accept` value
+    which answers the `Sec-WebSocket-Key` of a client.
+    """
+
+    digest = hashlib.sha1((key + GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    # The payload is xored with the repeated mask as one big integer
+    size = len(payload)
+    repeated = (mask * (size // 4 + 1))[:size]
+    return (
+        int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")
+    ).to_bytes(size, "big")
+
+
+def encode_frame(
+    opcode: int, payload: bytes, masked: bool | None = False
+) -> bytes:
+    """
+    # Encode Frame
+    The `encode_frame` function returns a whole frame. The frames of a
+    client are `masked`, the ones of a server aren't, so the server
+    encodes a question once for every player of a room.
+    """
+
+    mask_bit = 0x80 if masked else 0
+    size = len(payload)
+
+    if size < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | size)
+    elif size < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, size)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, size)
+
+    if masked:
+        mask = os.urandom(4)
+        return header + mask + _apply_mask(payload, mask)
+
+    return header + payload
+
+
+async def read_headers(
+    reader: asyncio.StreamReader
+) -> tuple[str, dict[str, str]]:
+    """
+    # Read Headers
+    The `read_headers` function reads an HTTP request or response and
+    returns its first line and its headers, with lowercase names.
+    """
+
+    try:
+        data = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError as e:
+        raise WebSocketError("The headers are too long.") from e
+
+    return parse_headers(data)
+
+
+def parse_headers(data: bytes) -> tuple[str, dict[str, str]]:
+    """
+    # Parse Headers
+    The `parse_headers` function returns the first line and the
+    headers of an HTTP request or response which is already read.
+    """
+
+    if len(data) > MAX_HEADERS_SIZE:
+        raise WebSocketError("The headers are too long.")
+
+    first_line, *lines = data.decode("latin-1").split("\r\n")
+    headers = {}
+
+    for line in lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    return first_line, headers
+
+
+@final
+class WebSocket():
+    """
+    # Web Socket
+    The `WebSocket` class sends and receives the text messages of one
+    connection. It answers the pings and the close frames itself.
+
+    It contains these methods:
+    - `receive` returns the next text message.
+    - `send` sends a text message.
+    - `send_frame` sends a frame which is already encoded.
+    - `close` closes the connection.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+        client: bool | None = False
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.client = client  # A client masks its frames
+        self.closed = False
+
+    async def _read_frame(self) -> tuple[bool, int, bytes]:
+        first, second = await self.reader.readexactly(2)
+        final_frame, opcode = bool(first & 0x80), first & 0x0F
+        masked, size = bool(second & 0x80), second & 0x7F
+
+        if size == 126:
+            size = struct.unpack("!H", await self.reader.readexactly(2))[0]
+        elif size == 127:
+            size = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+
+        if size > MAX_MESSAGE_SIZE:
+            raise WebSocketError("The message is too big.")
+
+        if masked == self.client:
+            raise WebSocketError("Only the client frames are masked.")
+
+        mask = await self.reader.readexactly(4) if masked else b""
+        payload = await self.reader.readexactly(size)
+
+        if masked:
+            payload = _apply_mask(payload, mask)
+
+        return final_frame, opcode, payload
+
+    async def receive(self) -> str | None:
+        """
+        # Receive
+        The `receive` method returns the next text message, or `None`
+        when the connection is closed.
+        """
+
+        message = []
+        message_size = 0
+
+        while not self.closed:
+            try:
+                final_frame, opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.closed = True
+                return None
+
+            if opcode == OP_PING:
+                self.send_frame(encode_frame(OP_PONG, payload, self.client))
+            elif opcode == OP_PONG:
+                continue
+            elif opcode == OP_CLOSE:
+                await self.close()
+                return None
+            elif opcode in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+                if (opcode == OP_CONTINUATION) != bool(message):
+                    raise WebSocketError("A fragment is missing.")
+
+                message.append(payload)
+                message_size += len(payload)
+
+                if message_size > MAX_MESSAGE_SIZE:
+                    raise WebSocketError("The message is too big.")
+
+                if final_frame:
+                    return b"".join(message).decode("UTF-8")
+            else:
+                raise WebSocketError(f"Unknown opcode {opcode}.")
+
+        return None
+
+    def send_frame(self, frame: bytes) -> bool:
+        """
+        # Send Frame
+        The `send_frame` method writes a `frame` without waiting. It
+        returns `False` if the connection is closed, and closes the
+        connection of a client which doesn't read its messages.
+        """
+
+        if self.closed or self.writer.is_closing():
+            self.closed = True
+            return False
+
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.closed = True
+            self.writer.close()
+            return False
+
+        self.writer.write(frame)
+        return True
+
+    def send(self, text: str) -> bool:
+        return self.send_frame(
+            encode_frame(OP_TEXT, text.encode("UTF-8"), self.client)
+        )
+
+    async def close(self, code: int | None = 1000) -> None:
+        if not self.closed:
+            self.send_frame(
+                encode_frame(OP_CLOSE, struct.pack("!H", code), self.client)
+            )
+            self.closed = True
+
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def handshake_response(headers: dict[str, str]) -> bytes:
+    """
+    # Handshake Response
+    The `handshake_response` function returns the answer of the server
+    to the upgrade request of a client.
+    """
+
+    key = headers.get("sec-websocket-key")
+
+    if (
+        not key or headers.get("upgrade", "").lower() != "websocket"
+        or headers.get("sec-websocket-version") != "13"
+    ):
+        raise WebSocketError("It isn't a WebSocket upgrade request.")
+
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+    ).encode("ascii")
+
+
+async def connect(host: str, port: int, path: str) -> WebSocket:
+    """
+    # Connect
+    The `connect` function opens a client connection to the WebSocket
+    at `path`, used by the load generator.
+    """
+
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+
+    writer.write((
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n\r\n"
+    ).encode("ascii"))
+
+    first_line, headers = await read_headers(reader)
+
+    if (
+        " 101 " not in first_line
+        or headers.get("sec-websocket-accept") != accept_key(key)
+    ):
+        writer.close()
+        raise WebSocketError(f"The server refused: {first_line}")
+
+    return WebSocket(reader, writer, client=True)
@@ -15,7 +15,7 @@ from kivy.clock import Clock
 from kivy.logger import Logger as log
 
 from sources.logic.settings_manager import settings_manager
-from sources.logic.music_manager import music_manager
+from sources.logic.music_manager import music_manager, SONG_CHECK_INTERVAL
 from sources.logic.questions_manager import questions_manager
 from sources.logic.points_manager import points_manager
 from sources.logic.text_manager import text_manager as txt
@@ -33,7 +33,10 @@ class MainMenu(Screen):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        Clock.schedule_interval(self.update_music, 0)
+        music_manager.set_volumes(
+            settings_manager.music_volume, settings_manager.sounds_volume
+        )
+        Clock.schedule_interval(self.update_music, SONG_CHECK_INTERVAL)
 
         self.main_layout = BoxLayout(
             orientation="vertical",
@@ -104,13 +107,10 @@ class MainMenu(Screen):
         """
         # Update Music
         The `update_music` method starts a new song when the previous
-        finished.
+        finished. It's called every `SONG_CHECK_INTERVAL` seconds.
         """
 
         music_manager.check_song()
-        music_manager.set_volumes(
-            settings_manager.music_volume, settings_manager.sounds_volume
-        )
 
     def update_labels(self, instance=None) -> None:
         """
@@ -4,6 +4,7 @@ The `question_menu.py` module corresponds to the asked question
 screen.
 """
 
+import time
 from typing import final
 from random import randint
 
@@ -16,10 +17,11 @@ from kivy.logger import Logger as log
 
 from sources.logic.music_manager import music_manager
 from sources.logic.questions_manager import questions_manager
+from sources.logic.question_prefetcher import question_prefetcher
+from sources.logic.texture_cache import texture_cache
 from sources.logic.points_manager import points_manager
 from sources.logic.settings_manager import settings_manager
 from sources.logic.text_manager import text_manager as txt
-from sources.logic.resource_path import resource_path
 
 from sources.ui.colors import LIGHT_YELLOW, LIGHT_GREEN, LIGHT_CYAN, LIGHT_RED
 from sources.ui.colors import WHITE
@@ -38,6 +40,9 @@ class QuestionMenu(Screen):
 
         self.image = None
         self.previous_image = None
+        self.quest_numb = None
+        self.language = None
+        self.asked_at = time.monotonic()
 
         self.update_variables()
 
@@ -127,11 +132,20 @@ class QuestionMenu(Screen):
         example, a new language was set or points count was changed.
         """
 
+        prepared = question_prefetcher.next_question()
         (
             self.question, self.true_answer,
             self.wrong_answer1, self.wrong_answer2, self.wrong_answer3,
             self.image_path
-        ) = questions_manager.rand_quest()
+        ) = prepared[:6]
+        self.quest_numb = prepared.quest_numb
+        self.language = prepared.key[0]
+
+        log.info(
+            "Quest. Menu: Prefetched questions "
+            f"<{question_prefetcher.stats()}>."
+        )
+        log.info(f"Quest. Menu: Textures <{texture_cache.stats()}>.")
 
         if settings_manager.drawing_images:
 
@@ -151,8 +165,11 @@ class QuestionMenu(Screen):
                 )
 
             else:
+                # The image is cached or was decoded by the prefetcher
                 self.image = Image(
-                    source=resource_path(self.image_path),
+                    texture=texture_cache.get(
+                        self.image_path, prepared.image_data
+                    ),
                     size_hint_y=None,
                     height=200
                 )
@@ -259,6 +276,8 @@ class QuestionMenu(Screen):
             self.wrong_button3.background_color = \
                 settings_manager.main_color
 
+        self.asked_at = time.monotonic()
+
     def update_labels(self, instance=None) -> None:
         """
         # Update Menu
@@ -277,15 +296,25 @@ class QuestionMenu(Screen):
         """
 
         music_manager.button_clicked.play()
-        if instance.text == questions_manager.true_answer:
-            points_manager.win()
-            win = True
+        latency = time.monotonic() - self.asked_at
+        win = instance.text == self.true_answer
+
+        if win:
+            answered_at = points_manager.win(
+                self.quest_numb, latency, self.language
+            )
             music_manager.win.play()
         else:
-            points_manager.lose()
-            win = False
+            answered_at = points_manager.lose(
+                self.quest_numb, latency, self.language
+            )
             music_manager.lose.play()
 
+        questions_manager.observe_answer(
+            self.language, self.quest_numb, win, latency, answered_at
+        )
+        question_prefetcher.prepare_next()  # While the result is shown
+
         self.manager.current = "ResultMenu"
         self.manager.get_screen("ResultMenu").update_labels(win)
         questions_manager.status = False
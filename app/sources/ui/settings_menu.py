@@ -16,13 +16,13 @@ from kivy.uix.label import Label
 from kivy.uix.slider import Slider
 from kivy.uix.button import Button
 from kivy.uix.checkbox import CheckBox
-from kivy.clock import Clock
 from kivy.logger import Logger as log
 
 from sources.logic.music_manager import music_manager
 from sources.logic.settings_manager import settings_manager
 from sources.logic.points_manager import points_manager
 from sources.logic.questions_manager import questions_manager
+from sources.logic.question_prefetcher import question_prefetcher
 from sources.logic.text_manager import text_manager as txt
 
 from sources.ui.colors import RED, WHITE
@@ -38,8 +38,6 @@ class SettingsMenu(Screen):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        Clock.schedule_interval(self.update_music, 0)
-
         self.main_layout = BoxLayout(
             spacing=0,
             padding=0
@@ -335,14 +333,28 @@ class SettingsMenu(Screen):
             halign="right"
         )
 
+        self.adaptive_checkbox = CheckBox(
+            group="randomizing_styles"
+        )
+
+        self.adaptive_label = Label(
+            font_size=25,
+            font_name=txt.small_font,
+            halign="right"
+        )
+
         # Adding methods to buttons
 
+        self.music_slider.bind(value=self.update_music)
+        self.sounds_slider.bind(value=self.update_music)
+
         self.drawing_images_checkbox.bind(active=self.drawing_images)
         self.rainbow_buttons_checkbox.bind(active=self.rainbow_buttons)
 
         self.normal_checkbox.bind(active=self.set_randomizing_style)
         self.alternative_checkbox.bind(active=self.set_randomizing_style)
         self.in_order_checkbox.bind(active=self.set_randomizing_style)
+        self.adaptive_checkbox.bind(active=self.set_randomizing_style)
 
         self.english_checkbox.bind(active=self.set_language)
         self.french_checkbox.bind(active=self.set_language)
@@ -367,6 +379,8 @@ class SettingsMenu(Screen):
 
         self.randomizing_styles_layout2.add_widget(self.in_order_checkbox)
         self.randomizing_styles_layout2.add_widget(self.in_order_label)
+        self.randomizing_styles_layout2.add_widget(self.adaptive_checkbox)
+        self.randomizing_styles_layout2.add_widget(self.adaptive_label)
 
         self.languages_layout1.add_widget(self.english_checkbox)
         self.languages_layout1.add_widget(self.english_label)
@@ -445,6 +459,8 @@ class SettingsMenu(Screen):
             txt.drawing_images + "          "
         self.in_order_label.text = \
             txt.in_order + "                        "
+        self.adaptive_label.text = \
+            txt.adaptive + "                        "
 
         # !Don't change this part
         #  Kivy library doesn't accept to center
@@ -532,6 +548,8 @@ class SettingsMenu(Screen):
             self.alternative_checkbox.active = True
         elif settings_manager.randomizing_style == "in_order":
             self.in_order_checkbox.active = True
+        elif settings_manager.randomizing_style == "adaptive":
+            self.adaptive_checkbox.active = True
         else:
             self.normal_checkbox.active = True
 
@@ -540,11 +558,14 @@ class SettingsMenu(Screen):
         self.sounds_slider.value = \
             settings_manager.sounds_volume * 100
 
-    def update_music(self, instance=None) -> None:
+    def update_music(self, instance=None, value=None) -> None:
         settings_manager.music_volume = \
             round(self.music_slider.value / 100, 2)
         settings_manager.sounds_volume = \
             round(self.sounds_slider.value / 100, 2)
+        music_manager.set_volumes(
+            settings_manager.music_volume, settings_manager.sounds_volume
+        )
 
     def reset_settings(self, instance=None) -> None:
         settings_manager.clear_data()
@@ -601,6 +622,7 @@ class SettingsMenu(Screen):
 
         txt.set_language(self.new_languge)
         settings_manager.current_language = self.new_languge
+        question_prefetcher.clear()
 
         settings_manager.save_data()
         self.update_labels()
@@ -633,6 +655,7 @@ class SettingsMenu(Screen):
         )
 
         settings_manager.color_change()
+        settings_manager.save_data()
         self.update_labels()
         music_manager.button_clicked.play()
 
@@ -642,11 +665,14 @@ class SettingsMenu(Screen):
 
         if checkbox == self.normal_checkbox:
             settings_manager.randomizing_style = "normal"
-        elif checkbox == self.alternative_checkbox_checkbox:
+        elif checkbox == self.alternative_checkbox:
             settings_manager.randomizing_style = "alternative"
-        else:
+        elif checkbox == self.in_order_checkbox:
             settings_manager.randomizing_style = "in_order"
+        else:
+            settings_manager.randomizing_style = "adaptive"
 
+        question_prefetcher.clear()
         settings_manager.save_data()
         music_manager.button_clicked.play()
 
@@ -0,0 +1,13 @@
+"""
+# Benchmarks
+The benchmarks folder contains scripts measuring the speed of the
+logic part of the uninstall app.
+
+They are run from the uninstall_app folder, for example:
+```
+python -m benchmarks.text_benchmark
+```
+
+## Files
+- `text_benchmark.py` measures a language switch of the `TextManager`.
+"""
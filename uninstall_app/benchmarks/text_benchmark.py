@@ -0,0 +1,76 @@
+"""
+# Text Benchmark
+The `text_benchmark.py` module measures how long a language switch of
+the `TextManager` takes, before and after the translation catalog.
+
+"Before" reads and parses the json file for every key like the old
+`get_value` did. "After" only swaps the active catalog.
+"""
+
+import json
+import timeit
+from types import MethodType
+
+from sources.logic.text_manager import text_manager as txt
+
+
+def legacy_get_value(self, key) -> str:
+    """
+    # Legacy Get Value
+    The `legacy_get_value` function is the old `get_value` method
+    which opened and parsed the json file for every key.
+    """
+
+    with open(self.file, "r", encoding="UTF-8") as f:
+        data = json.load(f)
+        value = data.get(key, "ERROR")
+
+    if isinstance(value, int):
+        return str(value)
+
+    if value != "ERROR":
+        return value
+
+    return self._replace_ukrainian(key)
+
+
+def switch_languages() -> None:
+    """
+    # Switch Languages
+    The `switch_languages` function switches through all the
+    languages once.
+    """
+
+    for language in txt.ALL_LANGUAGES:
+        txt.set_language(language)
+
+
+def run(number: int = 200) -> dict[str, float]:
+    """
+    # Run
+    The `run` function returns the mean time of one language switch
+    in microseconds, before and after the translation catalog.
+    """
+
+    switches = number * len(txt.ALL_LANGUAGES)
+
+    txt.get_value = MethodType(legacy_get_value, txt)
+    before = timeit.timeit(switch_languages, number=number)
+    del txt.get_value
+
+    switch_languages()  # Every catalog is loaded once
+    after = timeit.timeit(switch_languages, number=number)
+
+    return {
+        "before_us": before / switches * 1_000_000,
+        "after_us": after / switches * 1_000_000
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    print(
+        f"Language switch before: {results['before_us']:.1f} us\n"
+        f"Language switch after: {results['after_us']:.1f} us\n"
+        f"Speedup: x{results['before_us'] / results['after_us']:.1f}"
+    )
@@ -7,6 +7,7 @@ others parts of the project.
 This folder contains *manager* files:
 - `text_manager.py` manages labels showed on UI and their translate
 by json files.
+- `glyphs.py` replaces the letters which aren't supported by the fonts.
 - `logs_manager.py` formats and saves logs in the logs folder, counts
 files in the logs folder and deletes old ones.
 - `resource_path` is useful for converting the project into an
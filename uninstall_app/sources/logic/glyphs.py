@@ -0,0 +1,51 @@
+"""
+# Glyphs
+The `glyphs.py` module of the uninstaller is the `glyphs.py` module of
+the game, `app/sources/engine/glyphs.py`, loaded from its file. Both
+apps replace the letters which aren't supported by the fonts with the
+same code, so they can't replace them differently.
+
+A frozen uninstaller bundles that file as data in
+`app/sources/engine`.
+
+It contains these functions:
+- `font_characters` returns the characters supported by a font.
+- `glyph_table` returns the `str.maketrans` substitution table.
+- `glyphs_signature` returns bytes which change with the table.
+- `replace_glyphs` replaces the letters of one text in one pass.
+- `replace_glyphs_bulk` replaces the letters of a whole column.
+- `replace_glyphs_catalog` replaces the letters of a translation
+catalog.
+"""
+
+import os
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+
+
+def _game_glyphs_path() -> str:
+    try:
+        base_path = sys._MEIPASS
+    except AttributeError:
+        base_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            os.pardir, os.pardir, os.pardir
+        )
+
+    return os.path.normpath(
+        os.path.join(base_path, "app", "sources", "engine", "glyphs.py")
+    )
+
+
+_spec = spec_from_file_location("sources.logic._glyphs", _game_glyphs_path())
+_glyphs = module_from_spec(_spec)
+_spec.loader.exec_module(_glyphs)
+
+FONTS = _glyphs.FONTS
+SUBSTITUTIONS = _glyphs.SUBSTITUTIONS
+font_characters = _glyphs.font_characters
+glyph_table = _glyphs.glyph_table
+glyphs_signature = _glyphs.glyphs_signature
+replace_glyphs = _glyphs.replace_glyphs
+replace_glyphs_bulk = _glyphs.replace_glyphs_bulk
+replace_glyphs_catalog = _glyphs.replace_glyphs_catalog
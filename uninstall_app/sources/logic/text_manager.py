@@ -10,6 +10,7 @@ import json
 from typing import final
 
 from sources.logic.resource_path import resource_path
+from sources.logic.glyphs import replace_glyphs, replace_glyphs_catalog
 from kivy.logger import Logger as log
 
 
@@ -20,9 +21,12 @@ class TextManager():
     The `TextManager` class manages labels showed on UI and their
     translate by json files.
 
-    It includes 4 methods:
+    It includes 5 methods:
     - `set_system_language` sets the language of the device.
-    - `get_value` imports one specific translation from the json file.
+    - `load_catalog` parses a json translation file once and keeps it
+    in memory.
+    - `get_value` imports one specific translation from the active
+    catalog.
     - `translate` imports all the translations and sets the variables
     usables in the UI part.
     - `set_language` sets the chosen language if it exists.
@@ -47,6 +51,9 @@ class TextManager():
 
         self.file = ""
 
+        self.catalogs = {}  # Every parsed translation file by language
+        self.catalog = {}  # The translation file of the current language
+
         self.english = "English (En)"
         self.french = "Français (Fr)"
         self.russian = "Русский (Ru)"
@@ -66,13 +73,7 @@ class TextManager():
         supported by the fonts) or standad cyrillic (russian) letters.
         """
 
-        text = text_input
-        str(text_input)
-        text = text.replace("ї", "ï").replace("і", "i")
-        text = text.replace("Ї", "Ï").replace("І", "I")
-        text = text.replace("Є", "Е").replace("є", "е")
-        text = text.replace("Ґ", "г").replace("ґ", "г")
-        return text
+        return replace_glyphs(text_input)
 
     def set_system_language(self) -> None:
         """
@@ -102,19 +103,46 @@ class TextManager():
         else:
             self.set_language("en-EN")
 
+    def load_catalog(self, language: str) -> dict:
+        """
+        # Load Catalog
+        The `load_catalog` method parses the json translation file of
+        the `language` only the first time it's asked and keeps it in
+        `catalogs`, so switching back to a loaded language doesn't
+        read the disk again.
+
+        The letters unsupported by the fonts are replaced in the whole
+        catalog when it's loaded.
+        """
+
+        catalog = self.catalogs.get(language)
+
+        if catalog is None:
+            file = resource_path(
+                f"resources/translations/{language}.json"
+            )
+            with open(file, "r", encoding="UTF-8") as f:
+                catalog = replace_glyphs_catalog(json.load(f))
+
+            self.catalogs[language] = catalog
+            log.info(
+                f"Text: The <{language}.json> file was loaded "
+                "in the translation catalog."
+            )
+
+        return catalog
+
     def get_value(self, key) -> str:
         """
         # Get Value
         The `get_value` method imports one specific translation from
-        the json file.
+        the active catalog.
 
         It takes an argument: key. It's the key of the json file and
         the text that will be returned if an error occured.
         """
 
-        with open(self.file, "r", encoding="UTF-8") as f:
-            data = json.load(f)
-            value = data.get(key, "ERROR")
+        value = self.catalog.get(key, "ERROR")
 
         if isinstance(value, int):
             return str(value)
@@ -138,6 +166,7 @@ class TextManager():
         self.file = resource_path(
             f"resources/translations/{self.current_language}.json"
         )
+        self.catalog = self.load_catalog(self.current_language)
 
         self.yes = self.get_value("Yes")
         self.no = self.get_value("No")
@@ -185,9 +214,12 @@ text_manager = TextManager()
 `text_manager` is the object of the `TextManager` class which manages
 labels showed on UI and their translate by json files.
 
-It includes 4 methods:
+It includes 5 methods:
 - `set_system_language` sets the language of the device.
-- `get_value` imports one specific translation from the json file.
+- `load_catalog` parses a json translation file once and keeps it
+in memory.
+- `get_value` imports one specific translation from the active
+catalog.
 - `translate` imports all the translations and sets the variables
 usables in the UI part.
 - `set_language` sets the chosen language if it exists.